@@ -10,19 +10,29 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
+import hashlib
+import heapq
 import io
 import json
 import logging
+import math
 import os
 import re
+import sqlite3
 import sys
 import tempfile
+import threading
 import unicodedata
 import zipfile
-from dataclasses import asdict, dataclass, field
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Iterable, Mapping, MutableMapping, Sequence
+from time import monotonic
+from typing import Any, Callable, Iterable, Mapping, MutableMapping, Sequence
 from urllib.parse import urljoin
 
 import requests
@@ -36,6 +46,11 @@ try:
 except ImportError:  # pragma: no cover - reported clearly at runtime
     pdfplumber = None
 
+try:
+    import pypdfium2
+except ImportError:  # pragma: no cover - pdfplumber remains available as the fallback
+    pypdfium2 = None
+
 try:
     import pytesseract
     from pdf2image import convert_from_bytes, pdfinfo_from_bytes
@@ -44,6 +59,16 @@ except ImportError:  # pragma: no cover - reported clearly at runtime
     convert_from_bytes = None
     pdfinfo_from_bytes = None
 
+try:
+    import tesserocr
+except ImportError:  # pragma: no cover - pytesseract remains available as the fallback
+    tesserocr = None
+
+try:
+    from PIL import Image, ImageChops, ImageFilter, ImageOps
+except ImportError:  # pragma: no cover - OCR then runs on unprocessed renders
+    Image = ImageChops = ImageFilter = ImageOps = None
+
 LOGGER = logging.getLogger("disclosure-monitor")
 
 HOUSE_INDEX_URL = (
@@ -61,11 +86,36 @@ PUSHOVER_MESSAGES_URL = "https://api.pushover.net/1/messages.json"
 DEFAULT_KEYWORDS = ("UNH", "UnitedHealth", "UnitedHealth Group")
 DEFAULT_STATE_PATH = Path(".monitor-state/disclosures.json")
 DEFAULT_RESULT_PATH = Path("monitor-result.json")
+DEFAULT_HISTORY_PATH = Path(".monitor-state/run-history.ndjson.gz")
+DEFAULT_HISTORY_MAX_BYTES = 1024 * 1024
+DEFAULT_HISTORY_KEEP = 5
+DEFAULT_HISTORY_RUNS = 30
+DEFAULT_PDF_TEXT_BACKEND = "auto"
+DEFAULT_PDF_BENCHMARK_PATH = Path(".monitor-state/pdf-text-backend.json")
+DEFAULT_OCR_ENGINE = "auto"
+DEFAULT_OCR_LANGUAGE = "eng"
+DEFAULT_OCR_DPI = 150
+DEFAULT_OCR_RETRY_DPI = 300
+DEFAULT_OCR_MIN_CONFIDENCE = 60.0
+MATCH_MODES = ("text", "structured")
+DEFAULT_FUZZY_MAX_EDITS = 2
+DEFAULT_OCR_WORKERS = 2
+DEFAULT_OCR_MAX_ATTEMPTS = 3
+# A running job whose worker has not finished within this time is handed out again.
+DEFAULT_OCR_LEASE_SECONDS = 3600
+DEFAULT_SEARCH_LIMIT = 20
+# Transaction codes kept by the ingestion side (ReadHousePDF.transform_raw_table_data).
+HOUSE_TRANSACTION_TYPES = frozenset({"P", "S", "SP", "E", "S (partial)"})
+MIN_USABLE_TEXT_CHARS = 20
+# Share of characters that may be unmapped glyphs ("(cid:NN)" codes or U+FFFD) before a text
+# layer counts as unreadable; a few stray glyphs in an otherwise good layer are tolerated.
+MAX_UNMAPPED_GLYPH_SHARE = 0.05
 DEFAULT_TIMEOUT = (15, 90)
 DEFAULT_LOOKBACK_DAYS = 120
 DEFAULT_MAX_DOWNLOAD_BYTES = 100 * 1024 * 1024
 DEFAULT_MAX_OCR_PAGES = 75
 DEFAULT_MAX_SEEN_PER_SOURCE = 25_000
+DEFAULT_DEADLINE_RESERVE_SECONDS = 30.0
 STATE_VERSION = 2
 
 
@@ -81,6 +131,14 @@ class NotificationError(MonitorError):
     """Raised when a positive match could not be delivered."""
 
 
+class OcrRequired(Exception):
+    """Raised instead of running OCR inline when OCR is delegated to the job queue."""
+
+    def __init__(self, pdf_bytes: bytes) -> None:
+        super().__init__("PDF has no usable text layer; OCR is queued")
+        self.pdf_bytes = pdf_bytes
+
+
 @dataclass(frozen=True)
 class Report:
     report_id: str
@@ -102,6 +160,39 @@ class Alert:
     keywords: tuple[str, ...]
     snippet: str
     details: tuple[str, ...] = ()
+    transactions: tuple[Mapping[str, str], ...] = ()
+    # Approximate matches in OCR text; never includes keywords already in `keywords`.
+    fuzzy_keywords: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Transaction:
+    """One structured row from a PTR transaction table."""
+
+    asset: str
+    ticker: str
+    transaction_type: str
+    transaction_date: str
+    amount: str
+    owner: str = ""
+    asset_type: str = ""
+
+    def match_text(self) -> str:
+        return f"{self.ticker} {self.asset}"
+
+    def summary(self) -> str:
+        return " | ".join(
+            value
+            for value in (
+                self.transaction_date,
+                self.owner,
+                self.ticker,
+                self.asset,
+                self.transaction_type,
+                self.amount,
+            )
+            if value
+        )
 
 
 @dataclass
@@ -113,6 +204,9 @@ class MonitorState:
     last_attempt_utc: str | None = None
     last_success_utc: str | None = None
     last_counts: dict[str, int] = field(default_factory=dict)
+    # Per filing year: ZIP digest, PTR row count and row fingerprints of the last House
+    # index whose new rows were all processed. See HouseIndexDelta.
+    house_index: dict[str, dict[str, Any]] = field(default_factory=dict)
 
     def is_seen(self, source: str, report_id: str) -> bool:
         return report_id in self.seen.setdefault(source, {})
@@ -126,6 +220,11 @@ class MonitorState:
                 continue
             ordered = sorted(values.items(), key=lambda item: item[1], reverse=True)
             self.seen[source] = dict(ordered[:max_per_source])
+        # Fingerprints of filing years that are no longer fetched are never read again.
+        fetched = {str(year) for year in house_index_years()}
+        self.house_index = {
+            year: index for year, index in self.house_index.items() if year in fetched
+        }
 
 
 @dataclass(frozen=True)
@@ -145,16 +244,40 @@ class Config:
     require_pushover: bool
     allow_empty_sources: bool
     allow_state_initialization: bool
+    deadline_seconds: float | None = None
+    watched_filers: tuple[str, ...] = ()
+    history_path: Path | None = None
+    history_max_bytes: int = DEFAULT_HISTORY_MAX_BYTES
+    pdf_text_backend: str = DEFAULT_PDF_TEXT_BACKEND
+    ocr_engine: str = DEFAULT_OCR_ENGINE
+    ocr_dpi: int = DEFAULT_OCR_DPI
+    ocr_retry_dpi: int = DEFAULT_OCR_RETRY_DPI
+    ocr_min_confidence: float = DEFAULT_OCR_MIN_CONFIDENCE
+    ocr_preprocess: bool = True
+    house_index_delta: bool = True
+    match_mode: str = "text"
+    fuzzy_ocr_match: bool = False
+    fuzzy_max_edits: int = DEFAULT_FUZZY_MAX_EDITS
+    # None runs OCR inline; a path delegates it to the SQLite queue and `ocr-worker`.
+    ocr_queue_path: Path | None = None
+    ocr_workers: int = DEFAULT_OCR_WORKERS
+    ocr_max_attempts: int = DEFAULT_OCR_MAX_ATTEMPTS
+    search_index_path: Path | None = None
 
 
 @dataclass
 class RunResult:
     started_utc: str
     finished_utc: str = ""
+    duration_seconds: float = 0.0
     source_counts: dict[str, int] = field(default_factory=dict)
     new_counts: dict[str, int] = field(default_factory=dict)
     baseline_counts: dict[str, int] = field(default_factory=dict)
     match_counts: dict[str, int] = field(default_factory=dict)
+    deferred_counts: dict[str, int] = field(default_factory=dict)
+    scanned_counts: dict[str, int] = field(default_factory=dict)
+    ocr_counts: dict[str, int] = field(default_factory=dict)
+    queued_counts: dict[str, int] = field(default_factory=dict)
     alerts: list[dict[str, Any]] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     success: bool = False
@@ -195,6 +318,29 @@ def parse_keywords(raw: str | None) -> tuple[str, ...]:
     return tuple(cleaned)
 
 
+def parse_watched_filers(raw: str | None) -> tuple[str, ...]:
+    if not raw:
+        return ()
+    cleaned: dict[str, str] = {}
+    for value in raw.split(","):
+        item = normalize_text(value)
+        if item:
+            cleaned.setdefault(item.casefold(), item)
+    return tuple(cleaned.values())
+
+
+def parse_deadline(raw: str | float | None) -> float | None:
+    if raw is None or raw == "":
+        return None
+    try:
+        seconds = float(raw)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid deadline in seconds: {raw!r}") from exc
+    if seconds <= 0:
+        raise ValueError(f"Deadline must be a positive number of seconds: {raw!r}")
+    return seconds
+
+
 def build_session(user_agent: str) -> Session:
     retry = Retry(
         total=4,
@@ -276,7 +422,100 @@ def find_keyword_hits(text: str, keywords: Sequence[str]) -> tuple[str, ...]:
     return tuple(keyword for keyword in keywords if _keyword_pattern(keyword).search(normalized))
 
 
-def text_snippet(text: str, keywords: Sequence[str], radius: int = 180) -> str:
+# Case folding plus single-character OCR confusions. Every mapping is one character to
+# one character so offsets in the folded text are offsets in the normalized text.
+_OCR_FOLD = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ1|!i0",
+    "abcdefghljklmnopqrstuvwxyzllllo",
+)
+# Multi-character confusions, applied to keywords (already folded) rather than to the text.
+_OCR_GLYPH_SPLITS = (("h", "l-l"), ("m", "rn"), ("w", "vv"), ("d", "cl"))
+
+
+def _ocr_keyword_variants(keyword: str) -> tuple[str, ...]:
+    variants = {keyword.translate(_OCR_FOLD)}
+    for glyph, split in _OCR_GLYPH_SPLITS:
+        variants |= {variant.replace(glyph, split) for variant in variants if glyph in variant}
+    return tuple(sorted(variants))
+
+
+def _fuzzy_edit_budget(keyword: str, max_edits: int) -> int:
+    # Short keywords (tickers) rely on the confusion table alone: one edit in a
+    # three-letter symbol matches far too many unrelated words.
+    return max(0, min(max_edits, (len(keyword) - 1) // 4))
+
+
+def _approximate_match_ends(pattern: str, text: str, max_edits: int) -> Iterable[int]:
+    """Yield end offsets where `pattern` matches a substring of `text` within `max_edits`.
+
+    Myers' bit-vector algorithm: the edit-distance column for the whole pattern lives in
+    two integers and advances with a fixed number of bit operations per text character.
+    """
+    length = len(pattern)
+    mask = (1 << length) - 1
+    high = 1 << (length - 1)
+    peq: dict[str, int] = {}
+    for index, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << index)
+    positive, negative, score = mask, 0, length
+    for position, char in enumerate(text):
+        eq = peq.get(char, 0)
+        xv = eq | negative
+        xh = (((eq & positive) + positive) ^ positive) | eq
+        horizontal_positive = negative | (~(xh | positive) & mask)
+        horizontal_negative = positive & xh
+        if horizontal_positive & high:
+            score += 1
+        elif horizontal_negative & high:
+            score -= 1
+        horizontal_positive = (horizontal_positive << 1) & mask
+        horizontal_negative = (horizontal_negative << 1) & mask
+        positive = horizontal_negative | (~(xv | horizontal_positive) & mask)
+        negative = horizontal_positive & xv
+        if score <= max_edits:
+            yield position
+
+
+def _fuzzy_keyword_start(folded: str, keyword: str, max_edits: int) -> int | None:
+    ticker = bool(re.fullmatch(r"[A-Z0-9.\-]{1,6}", keyword))
+    budget = _fuzzy_edit_budget(keyword, max_edits)
+    for variant in _ocr_keyword_variants(keyword):
+        for end in _approximate_match_ends(variant, folded, budget):
+            start = max(0, end - len(variant) + 1)
+            if ticker and (
+                (end + 1 < len(folded) and folded[end + 1].isalnum())
+                or (budget == 0 and start > 0 and folded[start - 1].isalnum())
+            ):
+                continue
+            return start
+    return None
+
+
+def find_fuzzy_keyword_hits(
+    text: str, keywords: Sequence[str], max_edits: int = DEFAULT_FUZZY_MAX_EDITS
+) -> tuple[str, ...]:
+    """Keywords that match OCR text only after allowing for OCR damage.
+
+    Cost is linear in the text length for each keyword variant. Keywords that match
+    exactly are not repeated here.
+    """
+    normalized = normalize_text(text)
+    exact = set(find_keyword_hits(normalized, keywords))
+    folded = normalized.translate(_OCR_FOLD)
+    return tuple(
+        keyword
+        for keyword in keywords
+        if keyword not in exact and _fuzzy_keyword_start(folded, keyword, max_edits) is not None
+    )
+
+
+def text_snippet(
+    text: str,
+    keywords: Sequence[str],
+    radius: int = 180,
+    fuzzy_keywords: Sequence[str] = (),
+    max_edits: int = DEFAULT_FUZZY_MAX_EDITS,
+) -> str:
     normalized = normalize_text(text)
     if not normalized:
         return ""
@@ -285,6 +524,12 @@ def text_snippet(text: str, keywords: Sequence[str], radius: int = 180) -> str:
         match = _keyword_pattern(keyword).search(normalized)
         if match:
             starts.append(match.start())
+    if not starts and fuzzy_keywords:
+        folded = normalized.translate(_OCR_FOLD)
+        for keyword in fuzzy_keywords:
+            fuzzy_start = _fuzzy_keyword_start(folded, keyword, max_edits)
+            if fuzzy_start is not None:
+                starts.append(fuzzy_start)
     center = min(starts) if starts else 0
     start = max(0, center - radius)
     end = min(len(normalized), center + radius)
@@ -325,10 +570,26 @@ def load_state(path: Path) -> tuple[MonitorState, bool]:
         last_attempt_utc=payload.get("last_attempt_utc"),
         last_success_utc=payload.get("last_success_utc"),
         last_counts={str(k): int(v) for k, v in payload.get("last_counts", {}).items()},
+        house_index=_load_house_index(payload.get("house_index", {})),
     )
     return state, False
 
 
+def _load_house_index(payload: Any) -> dict[str, dict[str, Any]]:
+    if not isinstance(payload, dict):
+        raise MonitorError("State field 'house_index' must be an object")
+    house_index: dict[str, dict[str, Any]] = {}
+    for year, entry in payload.items():
+        if not isinstance(entry, dict) or not isinstance(entry.get("rows"), list):
+            raise MonitorError(f"State field house_index.{year} is malformed")
+        house_index[str(year)] = {
+            "digest": str(entry.get("digest", "")),
+            "ptrs": int(entry.get("ptrs", len(entry["rows"]))),
+            "rows": [str(row) for row in entry["rows"]],
+        }
+    return house_index
+
+
 def save_state(path: Path, state: MonitorState) -> None:
     state.prune()
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -338,6 +599,7 @@ def save_state(path: Path, state: MonitorState) -> None:
         "last_attempt_utc": state.last_attempt_utc,
         "last_success_utc": state.last_success_utc,
         "last_counts": state.last_counts,
+        "house_index": state.house_index,
     }
     encoded = json.dumps(payload, indent=2, sort_keys=True) + "\n"
     with tempfile.NamedTemporaryFile(
@@ -358,6 +620,100 @@ def write_result(path: Path, result: RunResult) -> None:
     path.write_text(json.dumps(asdict(result), indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
 
+def _rotated_history_paths(path: Path, keep: int = DEFAULT_HISTORY_KEEP) -> list[Path]:
+    """Return history files oldest first, ending with the active file."""
+    rotated = [path.with_name(f"{path.name}.{index}") for index in range(keep, 0, -1)]
+    return [*rotated, path]
+
+
+def history_record(result: RunResult) -> dict[str, Any]:
+    return {
+        "started_utc": result.started_utc,
+        "finished_utc": result.finished_utc,
+        "duration_seconds": result.duration_seconds,
+        "success": result.success,
+        "source_counts": result.source_counts,
+        "new_counts": result.new_counts,
+        "scanned_counts": result.scanned_counts,
+        "ocr_counts": result.ocr_counts,
+        "match_counts": result.match_counts,
+        "deferred_counts": result.deferred_counts,
+        "queued_counts": result.queued_counts,
+        "error_types": [error.split(":", 1)[0] for error in result.errors],
+    }
+
+
+def append_history(
+    path: Path,
+    result: RunResult,
+    max_bytes: int = DEFAULT_HISTORY_MAX_BYTES,
+    keep: int = DEFAULT_HISTORY_KEEP,
+) -> None:
+    """Append one run to a gzip NDJSON log, rotating it once it exceeds ``max_bytes``.
+
+    Each append writes a separate gzip member, which readers decompress as one stream,
+    so earlier runs are never rewritten.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists() and path.stat().st_size >= max_bytes:
+        paths = _rotated_history_paths(path, keep)
+        paths[0].unlink(missing_ok=True)
+        for older, newer in zip(paths, paths[1:]):
+            if newer.exists():
+                newer.replace(older)
+    line = json.dumps(history_record(result), sort_keys=True, separators=(",", ":"))
+    with gzip.open(path, "at", encoding="utf-8") as handle:
+        handle.write(line + "\n")
+
+
+def read_history(
+    path: Path, last: int = DEFAULT_HISTORY_RUNS, keep: int = DEFAULT_HISTORY_KEEP
+) -> list[dict[str, Any]]:
+    records: list[dict[str, Any]] = []
+    for history_file in _rotated_history_paths(path, keep):
+        if not history_file.exists():
+            continue
+        try:
+            with gzip.open(history_file, "rt", encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        records.append(json.loads(line))
+        except (OSError, EOFError, json.JSONDecodeError) as exc:
+            # A run killed mid-append leaves a truncated final member; keep what was read.
+            LOGGER.warning("Stopped reading damaged history file %s: %s", history_file, exc)
+    return records[-last:] if last > 0 else records
+
+
+def _percentile(values: Sequence[float], fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(len(ordered) * fraction))  # Nearest-rank percentile.
+    return ordered[rank - 1]
+
+
+def summarize_history(records: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
+    durations = [float(record.get("duration_seconds") or 0.0) for record in records]
+    scanned = sum(sum(record.get("scanned_counts", {}).values()) for record in records)
+    ocr = sum(sum(record.get("ocr_counts", {}).values()) for record in records)
+    total_minutes = sum(durations) / 60
+    errors: Counter[str] = Counter()
+    for record in records:
+        errors.update(record.get("error_types", []))
+    return {
+        "runs": len(records),
+        "failures": sum(1 for record in records if not record.get("success")),
+        "first_started_utc": records[0].get("started_utc") if records else None,
+        "last_started_utc": records[-1].get("started_utc") if records else None,
+        "p50_duration_seconds": round(_percentile(durations, 0.50), 1),
+        "p95_duration_seconds": round(_percentile(durations, 0.95), 1),
+        "reports_scanned": scanned,
+        "reports_per_minute": round(scanned / total_minutes, 2) if total_minutes else 0.0,
+        "ocr_share": round(ocr / scanned, 3) if scanned else 0.0,
+        "error_types": dict(errors.most_common()),
+    }
+
+
 def _clean_row(row: Mapping[str, Any]) -> dict[str, str]:
     return {
         normalize_text(str(key).replace("\ufeff", "")): normalize_text(str(value or ""))
@@ -366,7 +722,7 @@ def _clean_row(row: Mapping[str, Any]) -> dict[str, str]:
     }
 
 
-def parse_house_index(zip_bytes: bytes, year: int) -> list[Report]:
+def _house_ptr_rows(zip_bytes: bytes, year: int) -> list[dict[str, str]]:
     try:
         archive = zipfile.ZipFile(io.BytesIO(zip_bytes))
     except zipfile.BadZipFile as exc:
@@ -395,49 +751,108 @@ def parse_house_index(zip_bytes: bytes, year: int) -> list[Report]:
             f"House {year} index is missing expected columns: {sorted(missing)}"
         )
 
-    reports: list[Report] = []
+    ptr_rows: list[dict[str, str]] = []
     for row in rows:
         if row.get("FilingType", "").upper() != "P":
             continue
-        doc_id = row.get("DocID", "").strip()
-        filing_year_text = row.get("Year", "").strip()
-        if not doc_id or not filing_year_text.isdigit():
+        if not row.get("DocID", "").strip() or not row.get("Year", "").strip().isdigit():
             raise SourceChangedError(
                 f"House PTR row is missing a usable Year or DocID: {row!r}"
             )
-        filing_year = int(filing_year_text)
-        filer = " ".join(
-            item
-            for item in (
-                row.get("Prefix", ""),
-                row.get("First", ""),
-                row.get("Last", ""),
-                row.get("Suffix", ""),
-            )
-            if item
+        ptr_rows.append(row)
+    return ptr_rows
+
+
+def _house_report(row: Mapping[str, str]) -> Report:
+    doc_id = row.get("DocID", "").strip()
+    filing_year = int(row.get("Year", "").strip())
+    filer = " ".join(
+        item
+        for item in (
+            row.get("Prefix", ""),
+            row.get("First", ""),
+            row.get("Last", ""),
+            row.get("Suffix", ""),
         )
-        reports.append(
-            Report(
-                report_id=f"house:{filing_year}:{doc_id}",
-                source="house",
-                filer=filer or "Unknown filer",
-                filed_date=row.get("FilingDate", "Unknown"),
-                url=HOUSE_PTR_URL.format(year=filing_year, doc_id=doc_id),
-                format="pdf",
-                metadata={
-                    "document_id": doc_id,
-                    "district": row.get("StateDst", ""),
-                    "filing_year": str(filing_year),
-                },
-            )
-        )
-    return reports
+        if item
+    )
+    return Report(
+        report_id=f"house:{filing_year}:{doc_id}",
+        source="house",
+        filer=filer or "Unknown filer",
+        filed_date=row.get("FilingDate", "Unknown"),
+        url=HOUSE_PTR_URL.format(year=filing_year, doc_id=doc_id),
+        format="pdf",
+        metadata={
+            "document_id": doc_id,
+            "district": row.get("StateDst", ""),
+            "filing_year": str(filing_year),
+        },
+    )
+
+
+def house_row_fingerprint(row: Mapping[str, str]) -> str:
+    key = f"{row.get('DocID', '').strip()}|{row.get('FilingDate', '').strip()}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def parse_house_index(zip_bytes: bytes, year: int) -> list[Report]:
+    return [_house_report(row) for row in _house_ptr_rows(zip_bytes, year)]
+
+
+@dataclass
+class HouseIndexDelta:
+    """Tracks which House index rows changed since the last fully processed index.
+
+    ``previous`` holds, per year, the ZIP digest and DocID+FilingDate fingerprints stored
+    in state. ``fetch_house_reports`` fills ``current`` and returns only new or amended
+    rows; the pipeline stores ``current`` only after all of those rows were processed,
+    so an interrupted run re-emits them. ``amended`` collects the ids of changed rows in
+    years that had stored fingerprints; an amendment keeps its DocID and report id, so
+    the pipeline scans these even when the id was seen before.
+    """
+
+    previous: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+    current: dict[str, dict[str, Any]] = field(default_factory=dict)
+    visible: int | None = None
+    amended: set[str] = field(default_factory=set)
+
+    def changed_reports(self, zip_bytes: bytes, year: int) -> list[Report]:
+        key = str(year)
+        digest = hashlib.sha256(zip_bytes).hexdigest()
+        previous = self.previous.get(key, {})
+        if previous and previous.get("digest") == digest:
+            self.current[key] = dict(previous)
+            self.visible = (self.visible or 0) + int(previous.get("ptrs", 0))
+            return []
+        rows = _house_ptr_rows(zip_bytes, year)
+        known = set(previous.get("rows", ()))
+        fingerprints = [house_row_fingerprint(row) for row in rows]
+        self.current[key] = {"digest": digest, "ptrs": len(rows), "rows": fingerprints}
+        self.visible = (self.visible or 0) + len(rows)
+        changed = [
+            _house_report(row)
+            for row, fingerprint in zip(rows, fingerprints)
+            if fingerprint not in known
+        ]
+        # Without stored fingerprints every row looks changed, so leave those years to
+        # the seen check instead of rescanning the whole index.
+        if known:
+            self.amended.update(report.report_id for report in changed)
+        return changed
+
+
+def house_index_years() -> tuple[int, int]:
+    """Filing years whose House index is fetched: the previous year and this one."""
+    current_year = utc_now().year
+    return current_year - 1, current_year
 
 
 def fetch_house_reports(
     session: Session,
     years: Sequence[int],
     max_download_bytes: int,
+    index_delta: HouseIndexDelta | None = None,
 ) -> list[Report]:
     reports: list[Report] = []
     successful_years = 0
@@ -458,10 +873,19 @@ def fetch_house_reports(
                     continue
                 raise MonitorError(f"House {year} index returned HTTP 404: {url}")
             data = response_bytes(response, f"House {year} index", max_download_bytes)
-            year_reports = parse_house_index(data, year)
+            if index_delta is None:
+                year_reports = parse_house_index(data, year)
+                LOGGER.info("House %s index contains %s PTRs", year, len(year_reports))
+            else:
+                year_reports = index_delta.changed_reports(data, year)
+                LOGGER.info(
+                    "House %s index contains %s PTRs, %s new or amended",
+                    year,
+                    index_delta.current[str(year)]["ptrs"],
+                    len(year_reports),
+                )
             reports.extend(year_reports)
             successful_years += 1
-            LOGGER.info("House %s index contains %s PTRs", year, len(year_reports))
         except MonitorError as exc:
             errors.append(str(exc))
 
@@ -641,26 +1065,387 @@ def fetch_senate_reports(
     return sorted(deduped.values(), key=lambda report: (report.filed_date, report.report_id))
 
 
-def extract_pdf_text(pdf_bytes: bytes, max_ocr_pages: int) -> str:
+# Per-thread extraction tallies ("ocr_documents", "ocr_pages", ...). Each source pipeline
+# runs on its own thread and reads the difference around a scan to attribute OCR work.
+_EXTRACTION_THREAD = threading.local()
+
+
+def _extraction_counts() -> Counter[str]:
+    counts = getattr(_EXTRACTION_THREAD, "counts", None)
+    if counts is None:
+        counts = _EXTRACTION_THREAD.counts = Counter()
+    return counts
+
+
+# PDFium is not thread-safe, and the source pipelines and OCR workers extract on
+# separate threads, so every pdfium call runs under this lock.
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _pdfium_page_texts(pdf_bytes: bytes) -> list[str]:
+    with _PDFIUM_LOCK:
+        document = pypdfium2.PdfDocument(pdf_bytes)
+        try:
+            texts: list[str] = []
+            for index in range(len(document)):
+                page = document[index]
+                text_page = page.get_textpage()
+                try:
+                    texts.append(text_page.get_text_range())
+                finally:
+                    text_page.close()
+                    page.close()
+            return texts
+        finally:
+            document.close()
+
+
+def _pdfplumber_page_texts(pdf_bytes: bytes) -> list[str]:
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+@dataclass(frozen=True)
+class TextBackend:
+    """A PDF text-layer extractor returning one string per page."""
+
+    name: str
+    page_texts: Callable[[bytes], list[str]]
+    is_available: Callable[[], bool]
+
+
+# pdfium returns the raw text stream without pdfplumber's character-level layout
+# analysis, which keyword matching does not need. pdfplumber stays as the fallback.
+TEXT_BACKENDS: dict[str, TextBackend] = {
+    "pdfium": TextBackend("pdfium", _pdfium_page_texts, lambda: pypdfium2 is not None),
+    "pdfplumber": TextBackend(
+        "pdfplumber", _pdfplumber_page_texts, lambda: pdfplumber is not None
+    ),
+}
+
+
+def text_backend_chain(preferred: str = DEFAULT_PDF_TEXT_BACKEND) -> list[TextBackend]:
+    if preferred == "auto":
+        names = ["pdfium", "pdfplumber"]
+    elif preferred in TEXT_BACKENDS:
+        names = [preferred, *(name for name in ("pdfplumber",) if name != preferred)]
+    else:
+        raise ValueError(
+            f"Unknown PDF text backend {preferred!r}; expected auto or {sorted(TEXT_BACKENDS)}"
+        )
+    return [TEXT_BACKENDS[name] for name in names if TEXT_BACKENDS[name].is_available()]
+
+
+_UNMAPPED_GLYPH = re.compile(r"\(cid:\d+\)")
+
+
+def text_layer_is_usable(text: str) -> bool:
+    """Reject empty text and the glyph soup produced by fonts without a Unicode map."""
+    normalized = normalize_text(text)
+    if len(normalized) < MIN_USABLE_TEXT_CHARS:
+        return False
+    unmapped = normalized.count("\ufffd") + sum(
+        len(match) for match in _UNMAPPED_GLYPH.findall(normalized)
+    )
+    if unmapped / len(normalized) > MAX_UNMAPPED_GLYPH_SHARE:
+        return False
+    readable = sum(1 for char in normalized if char.isalnum() or char.isspace())
+    return readable / len(normalized) >= 0.6
+
+
+def extract_text_layer(pdf_bytes: bytes, backend: str = DEFAULT_PDF_TEXT_BACKEND) -> str:
+    """Return the first usable text layer from the backend chain, or an empty string."""
+    chain = text_backend_chain(backend)
+    if not chain:
+        raise MonitorError("No PDF text backend is installed (pypdfium2 or pdfplumber)")
+    for position, text_backend in enumerate(chain):
+        try:
+            text = "\n".join(text_backend.page_texts(pdf_bytes)).strip()
+        except Exception as exc:
+            LOGGER.warning("PDF text extraction with %s failed: %s", text_backend.name, exc)
+            continue
+        if text_layer_is_usable(text):
+            if position:
+                _extraction_counts()["text_backend_fallbacks"] += 1
+            return text
+        LOGGER.debug("%s returned no usable text layer", text_backend.name)
+    return ""
+
+
+def benchmark_text_backends(
+    pdfs: Sequence[bytes], repeat: int = 3
+) -> dict[str, dict[str, float]]:
+    """Time each installed backend over sample PDFs; best of ``repeat`` passes."""
+    results: dict[str, dict[str, float]] = {}
+    for name, text_backend in TEXT_BACKENDS.items():
+        if not text_backend.is_available():
+            continue
+        best = float("inf")
+        usable = 0
+        for _attempt in range(max(1, repeat)):
+            usable = 0
+            started = monotonic()
+            for pdf_bytes in pdfs:
+                try:
+                    text = "\n".join(text_backend.page_texts(pdf_bytes))
+                except Exception:
+                    continue
+                usable += text_layer_is_usable(text)
+            best = min(best, monotonic() - started)
+        results[name] = {"seconds": best, "usable": usable}
+    return results
+
+
+def choose_text_backend(results: Mapping[str, Mapping[str, float]], samples: int) -> str:
+    """Pick the fastest backend that read every sample; pdfplumber is the safe default."""
+    complete = [name for name, values in results.items() if values["usable"] >= samples]
+    if not complete:
+        return "pdfplumber"
+    return min(complete, key=lambda name: results[name]["seconds"])
+
+
+def save_text_backend_choice(
+    path: Path, backend: str, results: Mapping[str, Mapping[str, float]]
+) -> None:
+    """Record the benchmark's pick so ``PDF_TEXT_BACKEND=auto`` runs use it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"backend": backend, "benchmarked_utc": iso_utc(), "results": results}
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    temp_path.replace(path)
+
+
+def load_text_backend_choice(path: Path | None) -> str | None:
+    """The backend saved by ``benchmark-pdf``, or None when there is no usable choice."""
+    if path is None or not path.exists():
+        return None
+    try:
+        backend = json.loads(path.read_text(encoding="utf-8")).get("backend")
+    except (OSError, ValueError, AttributeError) as exc:
+        LOGGER.warning("Ignoring unreadable PDF benchmark %s: %s", path, exc)
+        return None
+    if backend not in TEXT_BACKENDS or not TEXT_BACKENDS[backend].is_available():
+        LOGGER.warning("Ignoring benchmarked PDF text backend %r from %s", backend, path)
+        return None
+    return backend
+
+
+_TESSERACT_THREAD = threading.local()
+_TESSERACT_APIS: list[Any] = []
+_TESSERACT_LOCK = threading.Lock()
+
+
+def _tesserocr_api() -> Any | None:
+    """Return this thread's initialized Tesseract API, creating it on first use.
+
+    Loading the language model dominates a cold ``tesseract`` invocation, so each worker
+    thread keeps one engine for the life of the process.
+    """
+    if tesserocr is None:
+        return None
+    api = getattr(_TESSERACT_THREAD, "api", None)
+    if api is None and not getattr(_TESSERACT_THREAD, "failed", False):
+        try:
+            api = tesserocr.PyTessBaseAPI(lang=DEFAULT_OCR_LANGUAGE)
+        except Exception as exc:
+            _TESSERACT_THREAD.failed = True
+            LOGGER.warning("In-process Tesseract is unavailable; using pytesseract: %s", exc)
+            return None
+        _TESSERACT_THREAD.api = api
+        with _TESSERACT_LOCK:
+            _TESSERACT_APIS.append(api)
+    return api
+
+
+def close_ocr_engines() -> None:
+    with _TESSERACT_LOCK:
+        while _TESSERACT_APIS:
+            _TESSERACT_APIS.pop().End()
+    _TESSERACT_THREAD.__dict__.clear()
+
+
+def _tesserocr_recognize(image: Any) -> tuple[str, float]:
+    api = _tesserocr_api()
+    # Rendered pages are passed as in-memory PIL images; nothing is written to disk.
+    api.SetImage(image)
+    try:
+        return api.GetUTF8Text(), float(api.MeanTextConf())
+    finally:
+        api.Clear()
+
+
+def _pytesseract_recognize(image: Any) -> tuple[str, float]:
+    data = pytesseract.image_to_data(
+        image, lang=DEFAULT_OCR_LANGUAGE, output_type=pytesseract.Output.DICT
+    )
+    lines: dict[tuple[int, int, int], list[str]] = {}
+    confidences: list[float] = []
+    for index, word in enumerate(data["text"]):
+        word = str(word).strip()
+        if not word:
+            continue
+        key = (data["block_num"][index], data["par_num"][index], data["line_num"][index])
+        lines.setdefault(key, []).append(word)
+        confidence = float(data["conf"][index])
+        if confidence >= 0:
+            confidences.append(confidence)
+    text = "\n".join(" ".join(words) for words in lines.values())
+    return text, sum(confidences) / len(confidences) if confidences else 0.0
+
+
+@dataclass(frozen=True)
+class OcrEngine:
+    """Turns one rendered page image into text and a 0-100 mean word confidence."""
+
+    name: str
+    recognize: Callable[[Any], tuple[str, float]]
+    is_available: Callable[[], bool]
+
+
+OCR_ENGINES: dict[str, OcrEngine] = {
+    "tesserocr": OcrEngine(
+        "tesserocr", _tesserocr_recognize, lambda: _tesserocr_api() is not None
+    ),
+    "pytesseract": OcrEngine(
+        "pytesseract", _pytesseract_recognize, lambda: pytesseract is not None
+    ),
+}
+
+
+def select_ocr_engine(preferred: str = DEFAULT_OCR_ENGINE) -> OcrEngine | None:
+    if preferred == "auto":
+        names = ["tesserocr", "pytesseract"]
+    elif preferred in OCR_ENGINES:
+        names = [preferred, *(name for name in ("pytesseract",) if name != preferred)]
+    else:
+        raise ValueError(
+            f"Unknown OCR engine {preferred!r}; expected auto or {sorted(OCR_ENGINES)}"
+        )
+    for name in names:
+        if OCR_ENGINES[name].is_available():
+            return OCR_ENGINES[name]
+    return None
+
+
+@dataclass(frozen=True)
+class OcrOptions:
+    dpi: int = DEFAULT_OCR_DPI
+    retry_dpi: int = DEFAULT_OCR_RETRY_DPI
+    min_confidence: float = DEFAULT_OCR_MIN_CONFIDENCE
+    preprocess: bool = True
+
+
+def binarize_page(image: Any, radius: int = 15, offset: int = 12) -> Any:
+    """Adaptive mean threshold: ink is anything darker than its neighbourhood."""
+    gray = image.convert("L")
+    local_mean = gray.filter(ImageFilter.BoxBlur(radius))
+    darker = ImageChops.subtract(local_mean, gray)
+    return darker.point(lambda value: 0 if value > offset else 255)
+
+
+def _row_profile_score(image: Any) -> float:
+    # Averaging each row down to one pixel gives the horizontal projection profile;
+    # text lines aligned with the page axis make it sharply peaked.
+    rows = image.resize((1, image.height), Image.BOX).tobytes()
+    mean = sum(rows) / len(rows)
+    return sum((value - mean) ** 2 for value in rows)
+
+
+def estimate_skew_angle(binary: Any, max_angle: float = 5.0, step: float = 0.5) -> float:
+    preview = ImageOps.invert(binary)
+    preview.thumbnail((400, 400))
+    candidates = [
+        step * index for index in range(-int(max_angle / step), int(max_angle / step) + 1)
+    ]
+    return max(
+        candidates,
+        key=lambda angle: (
+            _row_profile_score(preview.rotate(angle, resample=Image.BILINEAR)),
+            -abs(angle),
+        ),
+    )
+
+
+def crop_blank_margins(binary: Any, padding: int = 10) -> Any:
+    bbox = ImageOps.invert(binary).getbbox()
+    if bbox is None:
+        return binary
+    left, top, right, bottom = bbox
+    return binary.crop(
+        (
+            max(0, left - padding),
+            max(0, top - padding),
+            min(binary.width, right + padding),
+            min(binary.height, bottom + padding),
+        )
+    )
+
+
+def preprocess_page_image(image: Any) -> Any:
+    """Binarize, deskew and crop a rendered page so Tesseract sees less, cleaner input."""
+    if Image is None:
+        return image
+    binary = binarize_page(image)
+    angle = estimate_skew_angle(binary)
+    if angle:
+        binary = binary.rotate(angle, resample=Image.NEAREST, expand=True, fillcolor=255)
+    return crop_blank_margins(binary)
+
+
+def _ocr_page(
+    pdf_bytes: bytes, page_number: int, dpi: int, engine: OcrEngine, options: OcrOptions
+) -> tuple[str, float]:
+    images = convert_from_bytes(
+        pdf_bytes,
+        dpi=dpi,
+        first_page=page_number,
+        last_page=page_number,
+        grayscale=True,
+        thread_count=1,
+    )
+    if len(images) != 1:
+        raise MonitorError(f"OCR renderer returned {len(images)} images for page {page_number}")
+    image = preprocess_page_image(images[0]) if options.preprocess else images[0]
+    _extraction_counts()["ocr_pages"] += 1
+    return engine.recognize(image)
+
+
+def extract_pdf_text(
+    pdf_bytes: bytes,
+    max_ocr_pages: int,
+    text_backend: str = DEFAULT_PDF_TEXT_BACKEND,
+    ocr_engine: str = DEFAULT_OCR_ENGINE,
+    ocr_options: OcrOptions | None = None,
+) -> str:
+    text, _ = _extract_pdf_text(pdf_bytes, max_ocr_pages, text_backend, ocr_engine, ocr_options)
+    return text
+
+
+def _extract_pdf_text(
+    pdf_bytes: bytes,
+    max_ocr_pages: int,
+    text_backend: str,
+    ocr_engine: str,
+    ocr_options: OcrOptions | None,
+    allow_ocr: bool = True,
+) -> tuple[str, bool]:
+    """Return the document text and whether it came from OCR.
+
+    With ``allow_ocr`` false a PDF without a usable text layer raises ``OcrRequired``.
+    """
     if not pdf_bytes.startswith(b"%PDF"):
         prefix = pdf_bytes[:80].decode("utf-8", errors="replace")
         raise SourceChangedError(f"Expected a PDF but received: {prefix!r}")
-    if pdfplumber is None:
-        raise MonitorError("pdfplumber is not installed")
-
-    extracted: list[str] = []
-    try:
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            for page in pdf.pages:
-                extracted.append(page.extract_text() or "")
-    except Exception as exc:
-        LOGGER.warning("PDF text extraction failed; trying OCR: %s", exc)
 
-    text = "\n".join(extracted).strip()
-    if len(normalize_text(text)) >= 20:
-        return text
+    text = extract_text_layer(pdf_bytes, text_backend)
+    if text:
+        _extraction_counts()["text_documents"] += 1
+        return text, False
+    if not allow_ocr:
+        raise OcrRequired(pdf_bytes)
 
-    if not all((pytesseract, convert_from_bytes, pdfinfo_from_bytes)):
+    engine = select_ocr_engine(ocr_engine)
+    if engine is None or not all((convert_from_bytes, pdfinfo_from_bytes)):
         raise MonitorError(
             "PDF has no usable text layer and OCR dependencies are not installed"
         )
@@ -677,22 +1462,29 @@ def extract_pdf_text(pdf_bytes: bytes, max_ocr_pages: int) -> str:
             f"PDF has {pages} pages, above OCR_MAX_PAGES={max_ocr_pages}; refusing partial scan"
         )
 
+    options = ocr_options or OcrOptions()
     ocr_text: list[str] = []
     try:
         for page_number in range(1, pages + 1):
-            images = convert_from_bytes(
-                pdf_bytes,
-                dpi=220,
-                first_page=page_number,
-                last_page=page_number,
-                fmt="jpeg",
-                thread_count=1,
+            page_text, confidence = _ocr_page(
+                pdf_bytes, page_number, options.dpi, engine, options
             )
-            if len(images) != 1:
-                raise MonitorError(
-                    f"OCR renderer returned {len(images)} images for page {page_number}"
+            # Low-DPI renders are usually enough; only re-render pages Tesseract was
+            # unsure about.
+            if confidence < options.min_confidence and options.retry_dpi > options.dpi:
+                LOGGER.debug(
+                    "OCR confidence %.0f on page %s; retrying at %s DPI",
+                    confidence,
+                    page_number,
+                    options.retry_dpi,
                 )
-            ocr_text.append(pytesseract.image_to_string(images[0]))
+                _extraction_counts()["ocr_retries"] += 1
+                retry_text, retry_confidence = _ocr_page(
+                    pdf_bytes, page_number, options.retry_dpi, engine, options
+                )
+                if retry_confidence >= confidence:
+                    page_text = retry_text
+            ocr_text.append(page_text)
     except MonitorError:
         raise
     except Exception as exc:
@@ -701,7 +1493,53 @@ def extract_pdf_text(pdf_bytes: bytes, max_ocr_pages: int) -> str:
     text = "\n".join(ocr_text).strip()
     if not normalize_text(text):
         raise MonitorError("PDF extraction and OCR both returned no text")
-    return text
+    _extraction_counts()["ocr_documents"] += 1
+    return text, True
+
+
+def extract_report_text(pdf_bytes: bytes, config: Config) -> tuple[str, bool]:
+    return _extract_pdf_text(
+        pdf_bytes,
+        config.max_ocr_pages,
+        config.pdf_text_backend,
+        config.ocr_engine,
+        OcrOptions(
+            dpi=config.ocr_dpi,
+            retry_dpi=config.ocr_retry_dpi,
+            min_confidence=config.ocr_min_confidence,
+            preprocess=config.ocr_preprocess,
+        ),
+        allow_ocr=config.ocr_queue_path is None,
+    )
+
+
+def pdf_text_alert(
+    report: Report,
+    pdf_bytes: bytes,
+    config: Config,
+    details: Sequence[str] = (),
+) -> Alert | None:
+    text, from_ocr = extract_report_text(pdf_bytes, config)
+    index_report_text(config, report, text)
+    hits = find_keyword_hits(text, config.keywords)
+    fuzzy_hits: tuple[str, ...] = ()
+    if from_ocr and config.fuzzy_ocr_match:
+        fuzzy_hits = find_fuzzy_keyword_hits(text, config.keywords, config.fuzzy_max_edits)
+    if not hits and not fuzzy_hits:
+        return None
+    return Alert(
+        report_id=report.report_id,
+        source=report.source,
+        filer=report.filer,
+        filed_date=report.filed_date,
+        url=report.url,
+        keywords=hits,
+        snippet=text_snippet(
+            text, hits, fuzzy_keywords=fuzzy_hits, max_edits=config.fuzzy_max_edits
+        ),
+        details=tuple(details),
+        fuzzy_keywords=fuzzy_hits,
+    )
 
 
 def fetch_pdf_bytes(session: Session, url: str, config: Config, context: str) -> bytes:
@@ -738,33 +1576,114 @@ def _senate_page_response(session: Session, report: Report) -> Response:
     return response
 
 
-def parse_senate_transaction_rows(html: str) -> list[str]:
+def _senate_transaction_cells(html: str) -> list[list[str]]:
     soup = BeautifulSoup(html, "html.parser")
-    transactions: list[str] = []
+    rows: list[list[str]] = []
     for table_row in soup.find_all("tr"):
         cells = [normalize_text(cell.get_text(" ", strip=True)) for cell in table_row.find_all("td")]
         # Electronic PTR rows currently have at least eight columns. Requiring this avoids
         # scanning navigation/footer tables and reduces false positives.
         if len(cells) >= 8:
-            transactions.append(" | ".join(cells))
-    if not transactions:
+            rows.append(cells)
+    if not rows:
         raise SourceChangedError(
             "Senate electronic PTR page contains no transaction rows with eight columns"
         )
+    return rows
+
+
+def parse_senate_transaction_rows(html: str) -> list[str]:
+    return [" | ".join(cells) for cells in _senate_transaction_cells(html)]
+
+
+def parse_senate_transactions(html: str) -> list[Transaction]:
+    # Columns: #, transaction date, owner, ticker, asset name, asset type, type, amount.
+    return [
+        Transaction(
+            asset=cells[4],
+            ticker="" if cells[3] in {"--", "-"} else cells[3],
+            transaction_type=cells[6],
+            transaction_date=cells[1],
+            amount=cells[7],
+            owner=cells[2],
+            asset_type=cells[5],
+        )
+        for cells in _senate_transaction_cells(html)
+    ]
+
+
+def _ticker_from_asset(asset: str) -> str:
+    match = re.search(r"\(([A-Z0-9.\-]{1,6})\)", asset)
+    return match.group(1) if match else ""
+
+
+def house_transactions_from_table(table: Sequence[Sequence[str | None]]) -> list[Transaction]:
+    """Map House PTR table rows the same way ReadHousePDF does for ingestion.
+
+    Columns: ID, owner, asset, transaction type, date, notification date, amount.
+    """
+    transactions: list[Transaction] = []
+    for row in table:
+        if len(row) < 7:
+            continue
+        transaction_type = str(row[3] or "").split("\n")[0].strip()
+        if transaction_type not in HOUSE_TRANSACTION_TYPES:
+            continue
+        asset = normalize_text(str(row[2] or "").replace("\x00", ""))
+        transactions.append(
+            Transaction(
+                asset=asset,
+                ticker=_ticker_from_asset(asset),
+                transaction_type=transaction_type,
+                transaction_date=normalize_text(str(row[4] or "")),
+                amount=normalize_text(str(row[6] or "")),
+                owner=normalize_text(str(row[1] or "")),
+            )
+        )
     return transactions
 
 
-def scan_house_report(session: Session, report: Report, config: Config) -> Alert | None:
-    pdf_bytes = fetch_pdf_bytes(
-        session,
-        report.url,
-        config,
-        f"House PTR {report.metadata.get('document_id', report.report_id)}",
-    )
-    text = extract_pdf_text(pdf_bytes, config.max_ocr_pages)
-    hits = find_keyword_hits(text, config.keywords)
-    if not hits:
+def extract_house_transactions(pdf_bytes: bytes) -> list[Transaction]:
+    """Read transaction tables from a text-layer House PTR; empty for scanned filings."""
+    if pdfplumber is None:
+        return []
+    transactions: list[Transaction] = []
+    try:
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            for page in pdf.pages:
+                # Same column detection as ReadHousePDF.pre_process_table_data.
+                column_lines = [cell[0] for cell in page.debug_tablefinder().cells]
+                table = page.extract_table(
+                    table_settings={
+                        "vertical_strategy": "lines",
+                        "horizontal_strategy": "lines",
+                        "explicit_vertical_lines": column_lines,
+                    }
+                )
+                transactions.extend(house_transactions_from_table(table or []))
+    except Exception as exc:
+        LOGGER.warning("House PTR table extraction failed; using full text: %s", exc)
+        return []
+    return transactions
+
+
+def transaction_alert(
+    report: Report,
+    transactions: Sequence[Transaction],
+    config: Config,
+    details: Sequence[str] = (),
+) -> Alert | None:
+    """Match keywords against ticker and asset fields only, not the whole filing."""
+    matching = [
+        transaction
+        for transaction in transactions
+        if find_keyword_hits(transaction.match_text(), config.keywords)
+    ]
+    if not matching:
         return None
+    summaries = [transaction.summary() for transaction in matching]
+    combined = "\n".join(summaries)
+    hits = find_keyword_hits(combined, config.keywords)
     return Alert(
         report_id=report.report_id,
         source=report.source,
@@ -772,18 +1691,46 @@ def scan_house_report(session: Session, report: Report, config: Config) -> Alert
         filed_date=report.filed_date,
         url=report.url,
         keywords=hits,
-        snippet=text_snippet(text, hits),
-        details=tuple(
-            value
-            for value in (
-                f"District: {report.metadata.get('district')}" if report.metadata.get("district") else "",
-                f"Document: {report.metadata.get('document_id')}" if report.metadata.get("document_id") else "",
-            )
-            if value
-        ),
+        snippet=text_snippet(combined, hits),
+        details=(*details, *summaries[:5]),
+        transactions=tuple(asdict(transaction) for transaction in matching),
+    )
+
+
+def house_report_details(report: Report) -> tuple[str, ...]:
+    return tuple(
+        value
+        for value in (
+            f"District: {report.metadata.get('district')}" if report.metadata.get("district") else "",
+            f"Document: {report.metadata.get('document_id')}" if report.metadata.get("document_id") else "",
+        )
+        if value
     )
 
 
+def scan_house_report(session: Session, report: Report, config: Config) -> Alert | None:
+    pdf_bytes = fetch_pdf_bytes(
+        session,
+        report.url,
+        config,
+        f"House PTR {report.metadata.get('document_id', report.report_id)}",
+    )
+    details = house_report_details(report)
+    if config.match_mode == "structured":
+        transactions = extract_house_transactions(pdf_bytes)
+        if transactions:
+            if config.search_index_path is not None:
+                # Search covers the whole filing, not just the parsed transaction columns.
+                text = extract_text_layer(pdf_bytes, config.pdf_text_backend)
+                index_report_text(
+                    config, report, text or "\n".join(t.summary() for t in transactions)
+                )
+            return transaction_alert(report, transactions, config, details)
+        # Scanned or unusual filings have no readable table; never skip them silently.
+        LOGGER.info("No transaction table in %s; scanning full text", report.url)
+    return pdf_text_alert(report, pdf_bytes, config, details)
+
+
 def scan_senate_report(session: Session, report: Report, config: Config) -> Alert | None:
     response = _senate_page_response(session, report)
     data = response_bytes(
@@ -817,22 +1764,15 @@ def scan_senate_report(session: Session, report: Report, config: Config) -> Aler
         content_type = pdf_response.headers.get("Content-Type", "").lower()
 
     if data.startswith(b"%PDF") or "application/pdf" in content_type:
-        text = extract_pdf_text(data, config.max_ocr_pages)
-        hits = find_keyword_hits(text, config.keywords)
-        if not hits:
-            return None
-        return Alert(
-            report_id=report.report_id,
-            source=report.source,
-            filer=report.filer,
-            filed_date=report.filed_date,
-            url=report.url,
-            keywords=hits,
-            snippet=text_snippet(text, hits),
-        )
+        return pdf_text_alert(report, data, config)
 
     html = data.decode(response.encoding or "utf-8", errors="replace")
+    if config.match_mode == "structured":
+        transactions = parse_senate_transactions(html)
+        index_report_text(config, report, "\n".join(parse_senate_transaction_rows(html)))
+        return transaction_alert(report, transactions, config)
     rows = parse_senate_transaction_rows(html)
+    index_report_text(config, report, "\n".join(rows))
     matching_rows = [row for row in rows if find_keyword_hits(row, config.keywords)]
     if not matching_rows:
         return None
@@ -870,8 +1810,11 @@ def send_pushover(session: Session, alert: Alert, config: Config) -> None:
     detail_lines = [
         f"Filer: {alert.filer}",
         f"Filed: {alert.filed_date}",
-        f"Matched: {', '.join(alert.keywords)}",
     ]
+    if alert.keywords:
+        detail_lines.append(f"Matched: {', '.join(alert.keywords)}")
+    if alert.fuzzy_keywords:
+        detail_lines.append(f"Possible OCR match: {', '.join(alert.fuzzy_keywords)}")
     detail_lines.extend(alert.details[:3])
     if alert.snippet:
         detail_lines.append(alert.snippet)
@@ -907,6 +1850,401 @@ def _selected_sources(value: str) -> tuple[str, ...]:
     return (value,)
 
 
+def _filed_date_ordinal(value: str) -> int:
+    for date_format in ("%m/%d/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value.strip(), date_format).toordinal()
+        except ValueError:
+            continue
+    return 0
+
+
+def report_cost_class(report: Report) -> int:
+    """Rough relative scan cost: electronic HTML, text-layer PDF, then paper PDF."""
+    if report.format == "html":
+        return 0
+    # Senate PDFs are scanned paper filings and nearly always need OCR.
+    if report.source == "senate":
+        return 2
+    return 1
+
+
+def report_priority(
+    report: Report, watched_filers: Sequence[str] = ()
+) -> tuple[int, int, int, str]:
+    filer = normalize_text(report.filer).casefold()
+    watched = any(name.casefold() in filer for name in watched_filers)
+    return (
+        0 if watched else 1,
+        report_cost_class(report),
+        -_filed_date_ordinal(report.filed_date),
+        report.report_id,
+    )
+
+
+_DEADLINE_LOCK = threading.Lock()
+
+
+@dataclass
+class RunDeadline:
+    """Scan budget measured from the start of the run.
+
+    A report is started only if the remaining time still covers the reserve kept for
+    writing state and results plus the slowest scan seen so far for its cost class.
+    """
+
+    seconds: float | None = None
+    reserve_seconds: float = DEFAULT_DEADLINE_RESERVE_SECONDS
+    started: float = field(default_factory=lambda: monotonic())
+    slowest_scan: dict[int, float] = field(default_factory=dict)
+
+    @classmethod
+    def for_config(cls, config: Config) -> RunDeadline:
+        if config.deadline_seconds is None:
+            return cls()
+        return cls(
+            seconds=config.deadline_seconds,
+            reserve_seconds=min(DEFAULT_DEADLINE_RESERVE_SECONDS, config.deadline_seconds / 10),
+        )
+
+    def remaining(self) -> float:
+        if self.seconds is None:
+            return float("inf")
+        return self.seconds - (monotonic() - self.started)
+
+    def allows(self, cost_class: int) -> bool:
+        budget = self.remaining() - self.reserve_seconds
+        return budget > 0 and budget >= self.slowest_scan.get(cost_class, 0.0)
+
+    def record(self, cost_class: int, elapsed: float) -> None:
+        with _DEADLINE_LOCK:
+            self.slowest_scan[cost_class] = max(
+                elapsed, self.slowest_scan.get(cost_class, 0.0)
+            )
+
+
+class StateWriter:
+    """Serializes state changes and saves from concurrently running source pipelines.
+
+    The lock also guards the shared ``RunResult``; sources only touch their own keys,
+    but the alert list and the state file are shared.
+    """
+
+    def __init__(self, path: Path, state: MonitorState) -> None:
+        self.path = path
+        self.state = state
+        self.lock = threading.Lock()
+
+    def is_seen(self, source: str, report_id: str) -> bool:
+        with self.lock:
+            return self.state.is_seen(source, report_id)
+
+    def has_seen_any(self, source: str) -> bool:
+        with self.lock:
+            return bool(self.state.seen.get(source))
+
+    def mark_seen(self, source: str, report_ids: Iterable[str], timestamp: str) -> None:
+        with self.lock:
+            for report_id in report_ids:
+                self.state.mark_seen(source, report_id, timestamp)
+            save_state(self.path, self.state)
+
+    def house_index(self) -> dict[str, dict[str, Any]]:
+        with self.lock:
+            return dict(self.state.house_index)
+
+    def set_house_index(self, house_index: Mapping[str, dict[str, Any]]) -> None:
+        with self.lock:
+            self.state.house_index = dict(house_index)
+            save_state(self.path, self.state)
+
+    def set_last_count(self, source: str, count: int) -> None:
+        with self.lock:
+            self.state.last_counts[source] = count
+
+    def save(self) -> None:
+        with self.lock:
+            save_state(self.path, self.state)
+
+
+class OcrQueue:
+    """SQLite-backed queue of reports whose PDFs need OCR.
+
+    The monitor enqueues a report (with its PDF) and marks it seen; ``run_ocr_worker``
+    later claims jobs, OCRs them and delivers matches. A job is finished only after its
+    alert was sent, and a claimed job whose worker died is handed out again once its
+    lease expires. Every call opens its own connection, so worker threads and a
+    concurrent monitor run can share the file.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS ocr_jobs (
+            source TEXT NOT NULL,
+            report_id TEXT NOT NULL,
+            report TEXT NOT NULL,
+            pdf BLOB NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            enqueued_utc TEXT NOT NULL,
+            claimed_utc TEXT,
+            finished_utc TEXT,
+            last_error TEXT,
+            alert TEXT,
+            PRIMARY KEY (source, report_id)
+        );
+        CREATE INDEX IF NOT EXISTS ocr_jobs_status ON ocr_jobs (status, enqueued_utc);
+    """
+
+    def __init__(self, path: Path, lease_seconds: int = DEFAULT_OCR_LEASE_SECONDS) -> None:
+        self.path = path
+        self.lease_seconds = lease_seconds
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def enqueue(self, report: Report, pdf_bytes: bytes, timestamp: str) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT INTO ocr_jobs (source, report_id, report, pdf, enqueued_utc) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (source, report_id) DO NOTHING",
+                (
+                    report.source,
+                    report.report_id,
+                    json.dumps(asdict(report), sort_keys=True),
+                    pdf_bytes,
+                    timestamp,
+                ),
+            )
+
+    def claim(self, now: datetime | None = None) -> tuple[Report, bytes, int] | None:
+        now = now or utc_now()
+        expired = iso_utc(now - timedelta(seconds=self.lease_seconds))
+        with closing(self._connect()) as connection, connection:
+            # A single UPDATE ... RETURNING, so two workers never claim the same job.
+            row = connection.execute(
+                "UPDATE ocr_jobs SET status = 'running', attempts = attempts + 1, "
+                "claimed_utc = ? WHERE rowid = ("
+                "  SELECT rowid FROM ocr_jobs"
+                "  WHERE status = 'pending' OR (status = 'running' AND claimed_utc < ?)"
+                "  ORDER BY enqueued_utc, rowid LIMIT 1"
+                ") RETURNING report, pdf, attempts",
+                (iso_utc(now), expired),
+            ).fetchone()
+        if row is None:
+            return None
+        return Report(**json.loads(row[0])), bytes(row[1]), int(row[2])
+
+    def complete(self, report: Report, alert: Alert | None, timestamp: str) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "UPDATE ocr_jobs SET status = 'done', finished_utc = ?, pdf = X'', "
+                "last_error = NULL, alert = ? WHERE source = ? AND report_id = ?",
+                (
+                    timestamp,
+                    json.dumps(asdict(alert), sort_keys=True) if alert else None,
+                    report.source,
+                    report.report_id,
+                ),
+            )
+
+    def fail(self, report: Report, error: str, final: bool, timestamp: str) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "UPDATE ocr_jobs SET status = ?, finished_utc = ?, last_error = ? "
+                "WHERE source = ? AND report_id = ?",
+                (
+                    "failed" if final else "pending",
+                    timestamp,
+                    error,
+                    report.source,
+                    report.report_id,
+                ),
+            )
+
+    def counts(self) -> dict[str, int]:
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT status, COUNT(*) FROM ocr_jobs GROUP BY status"
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+
+def run_ocr_worker(
+    config: Config,
+    queue: OcrQueue,
+    max_jobs: int | None = None,
+    session: Session | None = None,
+) -> Counter[str]:
+    """Drain queued OCR jobs with ``config.ocr_workers`` threads.
+
+    Failed jobs go back to the queue until ``config.ocr_max_attempts`` is reached and are
+    then left as ``failed`` for an operator to inspect.
+    """
+    scan_config = replace(config, ocr_queue_path=None)
+    stats: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def take_job() -> tuple[Report, bytes, int] | None:
+        with lock:
+            if max_jobs is not None and stats["claimed"] >= max_jobs:
+                return None
+            job = queue.claim()
+            if job is not None:
+                stats["claimed"] += 1
+            return job
+
+    def work() -> None:
+        worker_session = session or build_session(config.user_agent)
+        while (job := take_job()) is not None:
+            report, pdf_bytes, attempts = job
+            final = attempts >= config.ocr_max_attempts
+            LOGGER.info("OCR job %s %s (attempt %s)", report.source, report.report_id, attempts)
+            try:
+                details = house_report_details(report) if report.source == "house" else ()
+                alert = pdf_text_alert(report, pdf_bytes, scan_config, details)
+                if alert:
+                    send_pushover(worker_session, alert, config)
+            except Exception as exc:
+                LOGGER.error("OCR job %s failed: %s", report.report_id, exc)
+                queue.fail(report, f"{type(exc).__name__}: {exc}", final, iso_utc())
+                with lock:
+                    stats["failed" if final else "retried"] += 1
+                continue
+            queue.complete(report, alert, iso_utc())
+            with lock:
+                stats["done"] += 1
+                stats["matched"] += bool(alert)
+
+    workers = max(1, config.ocr_workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr") as executor:
+            for future in [executor.submit(work) for _ in range(workers)]:
+                future.result()
+    finally:
+        close_ocr_engines()
+    return stats
+
+
+class SearchIndex:
+    """Local SQLite FTS5 index of extracted report text.
+
+    ``reports`` holds one row per report; ``report_text`` is the FTS5 table keyed by the
+    same rowid, with full positional postings so phrase and NEAR queries work.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS reports (
+            id INTEGER PRIMARY KEY,
+            source TEXT NOT NULL,
+            report_id TEXT NOT NULL,
+            filer TEXT NOT NULL,
+            filed_date TEXT NOT NULL,
+            filed_on TEXT,
+            url TEXT NOT NULL,
+            indexed_utc TEXT NOT NULL,
+            UNIQUE (source, report_id)
+        );
+        CREATE INDEX IF NOT EXISTS reports_filed_on ON reports (filed_on);
+        CREATE VIRTUAL TABLE IF NOT EXISTS report_text USING fts5(
+            filer, body, tokenize = 'unicode61 remove_diacritics 2'
+        );
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def add(self, report: Report, text: str, timestamp: str) -> None:
+        ordinal = _filed_date_ordinal(report.filed_date)
+        filed_on = datetime.fromordinal(ordinal).date().isoformat() if ordinal else None
+        with closing(self._connect()) as connection, connection:
+            (row_id,) = connection.execute(
+                "INSERT INTO reports "
+                "(source, report_id, filer, filed_date, filed_on, url, indexed_utc) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (source, report_id) DO UPDATE SET filer = excluded.filer, "
+                "filed_date = excluded.filed_date, filed_on = excluded.filed_on, "
+                "url = excluded.url, indexed_utc = excluded.indexed_utc "
+                "RETURNING id",
+                (
+                    report.source,
+                    report.report_id,
+                    report.filer,
+                    report.filed_date,
+                    filed_on,
+                    report.url,
+                    timestamp,
+                ),
+            ).fetchone()
+            connection.execute("DELETE FROM report_text WHERE rowid = ?", (row_id,))
+            connection.execute(
+                "INSERT INTO report_text (rowid, filer, body) VALUES (?, ?, ?)",
+                (row_id, report.filer, normalize_text(text)),
+            )
+
+    def search(
+        self,
+        query: str,
+        since: str | None = None,
+        source: str | None = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """Run an FTS5 ``MATCH`` query, best matches first."""
+        sql = (
+            "SELECT reports.source, reports.report_id, reports.filer, reports.filed_date, "
+            "reports.url, snippet(report_text, 1, '[', ']', '…', 16) "
+            "FROM report_text JOIN reports ON reports.id = report_text.rowid "
+            "WHERE report_text MATCH ?"
+        )
+        params: list[Any] = [query]
+        if since:
+            sql += " AND reports.filed_on >= ?"
+            params.append(since)
+        if source:
+            sql += " AND reports.source = ?"
+            params.append(source)
+        sql += " ORDER BY bm25(report_text) LIMIT ?"
+        params.append(limit)
+        with closing(self._connect()) as connection:
+            rows = connection.execute(sql, params).fetchall()
+        keys = ("source", "report_id", "filer", "filed_date", "url", "snippet")
+        return [dict(zip(keys, row)) for row in rows]
+
+
+_SEARCH_INDEXES: dict[Path, SearchIndex] = {}
+_SEARCH_INDEX_LOCK = threading.Lock()
+
+
+def index_report_text(config: Config, report: Report, text: str) -> None:
+    """Add a scanned report's text to the optional search index.
+
+    The index is a convenience for later research; a failure to write it is logged and
+    never fails the scan.
+    """
+    if config.search_index_path is None:
+        return
+    try:
+        with _SEARCH_INDEX_LOCK:
+            index = _SEARCH_INDEXES.get(config.search_index_path)
+            if index is None:
+                index = _SEARCH_INDEXES[config.search_index_path] = SearchIndex(
+                    config.search_index_path
+                )
+        index.add(report, text, iso_utc())
+    except (OSError, sqlite3.Error) as exc:
+        LOGGER.warning("Could not index %s for search: %s", report.report_id, exc)
+
+
 def _write_step_summary(result: RunResult) -> None:
     path_text = os.environ.get("GITHUB_STEP_SUMMARY")
     if not path_text:
@@ -923,16 +2261,154 @@ def _write_step_summary(result: RunResult) -> None:
             f"- {source.title()}: {result.source_counts[source]} visible, "
             f"{result.new_counts.get(source, 0)} new, "
             f"{result.match_counts.get(source, 0)} matches, "
-            f"{result.baseline_counts.get(source, 0)} baselined"
+            f"{result.baseline_counts.get(source, 0)} baselined, "
+            f"{result.deferred_counts.get(source, 0)} deferred, "
+            f"{result.queued_counts.get(source, 0)} queued for OCR"
         )
     if result.errors:
         lines.extend(["", "### Errors", *[f"- {error}" for error in result.errors]])
     Path(path_text).open("a", encoding="utf-8").write("\n".join(lines) + "\n")
 
 
-def run_monitor(config: Config, session: Session | None = None) -> RunResult:
-    session = session or build_session(config.user_agent)
+def fetch_source_reports(
+    session: Session,
+    source: str,
+    config: Config,
+    index_delta: HouseIndexDelta | None = None,
+) -> list[Report]:
+    if source == "house":
+        return fetch_house_reports(
+            session,
+            years=house_index_years(),
+            max_download_bytes=config.max_download_bytes,
+            index_delta=index_delta,
+        )
+    return fetch_senate_reports(session, lookback_days=config.senate_lookback_days)
+
+
+def run_source_pipeline(
+    source: str,
+    session: Session,
+    config: Config,
+    writer: StateWriter,
+    result: RunResult,
+    brand_new_state: bool,
+    deadline: RunDeadline,
+    ocr_queue: OcrQueue | None = None,
+) -> None:
+    """List, baseline or scan, and alert for one source.
+
+    Sources use different hosts and share only ``writer``, so ``run_monitor`` runs one
+    pipeline per source concurrently.
+    """
+    index_delta = (
+        HouseIndexDelta(previous=writer.house_index())
+        if source == "house" and config.house_index_delta
+        else None
+    )
+    reports = fetch_source_reports(session, source, config, index_delta)
+    visible = len(reports)
+    if index_delta is not None and index_delta.visible is not None:
+        visible = index_delta.visible
+    if not visible and not config.allow_empty_sources:
+        raise SourceChangedError(
+            f"{source.title()} source returned zero PTRs; refusing to treat that as success"
+        )
+
+    source_bootstrap = brand_new_state or not writer.has_seen_any(source)
+    amended = index_delta.amended if index_delta is not None else set()
+    unseen = [
+        report
+        for report in reports
+        if report.report_id in amended or not writer.is_seen(source, report.report_id)
+    ]
+    with writer.lock:
+        result.source_counts[source] = visible
+        result.new_counts[source] = len(unseen)
+        result.match_counts[source] = 0
+        result.baseline_counts[source] = 0
+        result.deferred_counts[source] = 0
+        result.scanned_counts[source] = 0
+        result.ocr_counts[source] = 0
+        result.queued_counts[source] = 0
+    writer.set_last_count(source, visible)
+
+    if source_bootstrap and not config.bootstrap_alerts:
+        writer.mark_seen(source, (report.report_id for report in reports), iso_utc())
+        with writer.lock:
+            result.baseline_counts[source] = len(reports)
+        if index_delta is not None:
+            writer.set_house_index(index_delta.current)
+        LOGGER.info(
+            "Baselined %s existing %s reports without sending historical alerts",
+            len(reports),
+            source,
+        )
+        return
+
+    scanner = scan_house_report if source == "house" else scan_senate_report
+    # Scan from a priority queue so that, when a deadline cuts the run short, watched
+    # filers and cheap electronic filings have already been scanned.
+    queue = [(report_priority(report, config.watched_filers), report) for report in unseen]
+    heapq.heapify(queue)
+    counts = _extraction_counts()
+    while queue:
+        _priority, report = heapq.heappop(queue)
+        cost_class = report_cost_class(report)
+        if not deadline.allows(cost_class):
+            # Deferred reports stay unseen and are picked up by the next run.
+            with writer.lock:
+                result.deferred_counts[source] += 1
+            continue
+        LOGGER.info("Scanning new %s report: %s (%s)", source, report.filer, report.url)
+        scan_started = monotonic()
+        ocr_before = counts["ocr_documents"]
+        try:
+            alert = scanner(session, report, config)
+        except OcrRequired as pending:
+            if ocr_queue is None:
+                raise MonitorError("OCR was delegated, but no OCR queue is open") from pending
+            # The queue now owns the report; it is committed before the report is
+            # marked seen, so a crash in between only causes a duplicate enqueue.
+            ocr_queue.enqueue(report, pending.pdf_bytes, iso_utc())
+            writer.mark_seen(source, (report.report_id,), iso_utc())
+            with writer.lock:
+                result.queued_counts[source] += 1
+            LOGGER.info("Queued %s report %s for OCR", source, report.report_id)
+            deadline.record(cost_class, monotonic() - scan_started)
+            continue
+        with writer.lock:
+            result.scanned_counts[source] += 1
+            result.ocr_counts[source] += counts["ocr_documents"] - ocr_before
+        if alert:
+            # Mark a matching report seen only after notification succeeds.
+            send_pushover(session, alert, config)
+            with writer.lock:
+                result.alerts.append(asdict(alert))
+                result.match_counts[source] += 1
+            LOGGER.warning(
+                "Matched %s in %s report for %s",
+                ", ".join((*alert.keywords, *(f"~{k}" for k in alert.fuzzy_keywords))),
+                source,
+                report.filer,
+            )
+        # Persist incrementally so a later source/report failure does not duplicate
+        # already-delivered alerts on the next run.
+        writer.mark_seen(source, (report.report_id,), iso_utc())
+        deadline.record(cost_class, monotonic() - scan_started)
+
+    # Deferred rows must be emitted again next run, so keep the old fingerprints.
+    if index_delta is not None and not result.deferred_counts[source]:
+        writer.set_house_index(index_delta.current)
+
+
+def run_monitor(
+    config: Config,
+    session: Session | None = None,
+    session_factory: Callable[[str], Session] = build_session,
+) -> RunResult:
     started = iso_utc()
+    started_clock = monotonic()
     result = RunResult(started_utc=started)
 
     try:
@@ -953,83 +2429,70 @@ def run_monitor(config: Config, session: Session | None = None) -> RunResult:
 
         state, brand_new_state = load_state(config.state_path)
         state.last_attempt_utc = started
-        save_state(config.state_path, state)
-        current_year = utc_now().year
-        for source in _selected_sources(config.source):
-            if source == "house":
-                reports = fetch_house_reports(
-                    session,
-                    years=(current_year - 1, current_year),
-                    max_download_bytes=config.max_download_bytes,
-                )
-                scanner = scan_house_report
-            else:
-                reports = fetch_senate_reports(
-                    session,
-                    lookback_days=config.senate_lookback_days,
-                )
-                scanner = scan_senate_report
-
-            result.source_counts[source] = len(reports)
-            if not reports and not config.allow_empty_sources:
-                raise SourceChangedError(
-                    f"{source.title()} source returned zero PTRs; refusing to treat that as success"
-                )
-
-            source_has_state = bool(state.seen.get(source))
-            source_bootstrap = brand_new_state or not source_has_state
-            unseen = [report for report in reports if not state.is_seen(source, report.report_id)]
-            result.new_counts[source] = len(unseen)
-            result.match_counts[source] = 0
-            result.baseline_counts[source] = 0
-
-            if source_bootstrap and not config.bootstrap_alerts:
-                timestamp = iso_utc()
-                for report in reports:
-                    state.mark_seen(source, report.report_id, timestamp)
-                result.baseline_counts[source] = len(reports)
-                save_state(config.state_path, state)
-                LOGGER.info(
-                    "Baselined %s existing %s reports without sending historical alerts",
-                    len(reports),
+        writer = StateWriter(config.state_path, state)
+        writer.save()
+        deadline = RunDeadline.for_config(config)
+        ocr_queue = OcrQueue(config.ocr_queue_path) if config.ocr_queue_path else None
+        sources = _selected_sources(config.source)
+        # Each source gets its own session: requests sessions are not thread-safe.
+        if session is not None and len(sources) > 1:
+            raise ValueError(
+                "A single session cannot be shared by concurrent sources; pass session_factory"
+            )
+        sessions = {
+            source: session or session_factory(config.user_agent) for source in sources
+        }
+        with ThreadPoolExecutor(
+            max_workers=len(sources), thread_name_prefix="monitor"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    run_source_pipeline,
                     source,
+                    sessions[source],
+                    config,
+                    writer,
+                    result,
+                    brand_new_state,
+                    deadline,
+                    ocr_queue,
                 )
-                state.last_counts[source] = len(reports)
-                continue
-
-            for report in unseen:
-                LOGGER.info(
-                    "Scanning new %s report: %s (%s)", source, report.filer, report.url
-                )
-                alert = scanner(session, report, config)
-                if alert:
-                    # Mark a matching report seen only after notification succeeds.
-                    send_pushover(session, alert, config)
-                    result.alerts.append(asdict(alert))
-                    result.match_counts[source] += 1
-                    LOGGER.warning(
-                        "Matched %s in %s report for %s",
-                        ", ".join(alert.keywords),
-                        source,
-                        report.filer,
-                    )
-                state.mark_seen(source, report.report_id, iso_utc())
-                # Persist incrementally so a later source/report failure does not duplicate
-                # already-delivered alerts on the next run.
-                save_state(config.state_path, state)
-
-            state.last_counts[source] = len(reports)
+                for source in sources
+            ]
+        # Let every source finish and persist its progress before failing the run.
+        failures = [error for error in (future.exception() for future in futures) if error]
+        for failure in failures[1:]:
+            result.errors.append(f"{type(failure).__name__}: {failure}")
+        if failures:
+            raise failures[0]
+
+        deferred = sum(result.deferred_counts.values())
+        if deferred:
+            LOGGER.warning(
+                "Deadline of %ss reached; deferred %s unseen reports to the next run: %s",
+                config.deadline_seconds,
+                deferred,
+                result.deferred_counts,
+            )
+        if ocr_queue is not None:
+            LOGGER.info("OCR queue: %s", ocr_queue.counts())
 
         state.last_success_utc = iso_utc()
-        save_state(config.state_path, state)
+        writer.save()
         result.success = True
         return result
     except Exception as exc:
-        result.errors.append(f"{type(exc).__name__}: {exc}")
+        result.errors.insert(0, f"{type(exc).__name__}: {exc}")
         raise
     finally:
         result.finished_utc = iso_utc()
+        result.duration_seconds = round(monotonic() - started_clock, 3)
         write_result(config.result_path, result)
+        if config.history_path is not None:
+            try:
+                append_history(config.history_path, result, config.history_max_bytes)
+            except OSError as exc:
+                LOGGER.warning("Could not append run history %s: %s", config.history_path, exc)
         _write_step_summary(result)
 
 
@@ -1067,9 +2530,85 @@ def build_config(args: argparse.Namespace) -> Config:
         allow_state_initialization=parse_bool(
             env.get("ALLOW_STATE_INITIALIZATION"), default=True
         ),
+        deadline_seconds=parse_deadline(
+            args.deadline if args.deadline is not None else env.get("RUN_DEADLINE_SECONDS")
+        ),
+        watched_filers=parse_watched_filers(args.watched_filers or env.get("WATCHED_FILERS")),
+        history_path=_history_path(args, env),
+        history_max_bytes=int(env.get("HISTORY_MAX_BYTES", DEFAULT_HISTORY_MAX_BYTES)),
+        pdf_text_backend=_pdf_text_backend(
+            args.pdf_text_backend or env.get("PDF_TEXT_BACKEND", DEFAULT_PDF_TEXT_BACKEND),
+            _pdf_benchmark_path(args, env),
+        ),
+        ocr_engine=_ocr_engine_name(
+            args.ocr_engine or env.get("OCR_ENGINE", DEFAULT_OCR_ENGINE)
+        ),
+        ocr_dpi=int(args.ocr_dpi or env.get("OCR_DPI", DEFAULT_OCR_DPI)),
+        ocr_retry_dpi=int(env.get("OCR_RETRY_DPI", DEFAULT_OCR_RETRY_DPI)),
+        ocr_min_confidence=float(env.get("OCR_MIN_CONFIDENCE", DEFAULT_OCR_MIN_CONFIDENCE)),
+        house_index_delta=parse_bool(env.get("HOUSE_INDEX_DELTA"), default=True),
+        match_mode=_match_mode(args.match_mode or env.get("MATCH_MODE", "text")),
+        fuzzy_ocr_match=(
+            args.fuzzy_ocr_match or parse_bool(env.get("FUZZY_OCR_MATCH"), default=False)
+        ),
+        fuzzy_max_edits=int(env.get("FUZZY_MAX_EDITS", DEFAULT_FUZZY_MAX_EDITS)),
+        ocr_queue_path=_ocr_queue_path(args, env),
+        ocr_workers=int(
+            getattr(args, "workers", None) or env.get("OCR_WORKERS", DEFAULT_OCR_WORKERS)
+        ),
+        ocr_max_attempts=int(env.get("OCR_MAX_ATTEMPTS", DEFAULT_OCR_MAX_ATTEMPTS)),
+        search_index_path=_search_index_path(args, env),
+        ocr_preprocess=(
+            False
+            if args.no_ocr_preprocess
+            else parse_bool(env.get("OCR_PREPROCESS"), default=True)
+        ),
     )
 
 
+def _pdf_text_backend(value: str, benchmark_path: Path | None = None) -> str:
+    name = value.strip().lower()
+    text_backend_chain(name)  # Validates the name.
+    if name == "auto":
+        # The last benchmark-pdf run decides; without one, pdfium then pdfplumber.
+        return load_text_backend_choice(benchmark_path) or name
+    return name
+
+
+def _match_mode(value: str) -> str:
+    mode = value.strip().lower()
+    if mode not in MATCH_MODES:
+        raise ValueError(f"Unknown match mode {value!r}; expected one of {MATCH_MODES}")
+    return mode
+
+
+def _ocr_engine_name(value: str) -> str:
+    name = value.strip().lower()
+    if name != "auto" and name not in OCR_ENGINES:
+        raise ValueError(f"Unknown OCR engine {value!r}; expected auto or {sorted(OCR_ENGINES)}")
+    return name
+
+
+def _ocr_queue_path(args: argparse.Namespace, env: Mapping[str, str]) -> Path | None:
+    raw = args.ocr_queue_file or env.get("OCR_QUEUE_FILE", "")
+    return Path(raw) if raw.strip() else None
+
+
+def _search_index_path(args: argparse.Namespace, env: Mapping[str, str]) -> Path | None:
+    raw = args.search_index_file or env.get("SEARCH_INDEX_FILE", "")
+    return Path(raw) if raw.strip() else None
+
+
+def _pdf_benchmark_path(args: argparse.Namespace, env: Mapping[str, str]) -> Path | None:
+    raw = args.pdf_benchmark_file or env.get("PDF_BENCHMARK_FILE", str(DEFAULT_PDF_BENCHMARK_PATH))
+    return Path(raw) if raw.strip() else None
+
+
+def _history_path(args: argparse.Namespace, env: Mapping[str, str]) -> Path | None:
+    raw = args.history_file or env.get("HISTORY_FILE", str(DEFAULT_HISTORY_PATH))
+    return Path(raw) if raw.strip() else None
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -1099,10 +2638,196 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Log matches without sending Pushover notifications",
     )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        help=(
+            "Seconds after start to stop scanning; unscanned reports are deferred to the "
+            "next run (default: RUN_DEADLINE_SECONDS or no deadline)"
+        ),
+    )
+    parser.add_argument(
+        "--watched-filers",
+        help="Comma-separated filer names to scan first; defaults to WATCHED_FILERS",
+    )
+    parser.add_argument(
+        "--history-file",
+        help=f"Override HISTORY_FILE (default: {DEFAULT_HISTORY_PATH}; empty disables)",
+    )
+    parser.add_argument(
+        "--pdf-text-backend",
+        choices=("auto", *TEXT_BACKENDS),
+        help=(
+            "PDF text-layer extractor; auto uses the backend saved by benchmark-pdf and "
+            "pdfplumber is always the fallback "
+            f"(default: PDF_TEXT_BACKEND or {DEFAULT_PDF_TEXT_BACKEND})"
+        ),
+    )
+    parser.add_argument(
+        "--pdf-benchmark-file",
+        help=(
+            "Where benchmark-pdf saves its backend choice for auto "
+            f"(default: PDF_BENCHMARK_FILE or {DEFAULT_PDF_BENCHMARK_PATH}; empty disables)"
+        ),
+    )
+    parser.add_argument(
+        "--ocr-engine",
+        choices=("auto", *OCR_ENGINES),
+        help=(
+            "OCR engine; auto prefers a persistent in-process tesserocr engine and falls "
+            f"back to pytesseract (default: OCR_ENGINE or {DEFAULT_OCR_ENGINE})"
+        ),
+    )
+    parser.add_argument(
+        "--ocr-dpi",
+        type=int,
+        help=f"First-pass OCR render resolution (default: OCR_DPI or {DEFAULT_OCR_DPI})",
+    )
+    parser.add_argument(
+        "--no-ocr-preprocess",
+        action="store_true",
+        help="OCR raw renders without binarization, deskew and margin cropping",
+    )
+    parser.add_argument(
+        "--match-mode",
+        choices=MATCH_MODES,
+        help=(
+            "text matches keywords anywhere in a filing; structured matches ticker and "
+            "asset fields of extracted transaction rows (default: MATCH_MODE or text)"
+        ),
+    )
+    parser.add_argument(
+        "--fuzzy-ocr-match",
+        action="store_true",
+        help="Also report approximate keyword matches in OCR text (default: FUZZY_OCR_MATCH)",
+    )
+    parser.add_argument(
+        "--ocr-queue-file",
+        help=(
+            "Queue PDFs that need OCR in this SQLite file for `ocr-worker` instead of "
+            "OCRing them during the run (default: OCR_QUEUE_FILE, unset runs OCR inline)"
+        ),
+    )
+    parser.add_argument(
+        "--search-index-file",
+        help="SQLite full-text index of scanned report text (default: SEARCH_INDEX_FILE, unset disables)",
+    )
     parser.add_argument("--verbose", action="store_true")
+    subparsers = parser.add_subparsers(dest="command")
+    history = subparsers.add_parser(
+        "history", help="Summarize recent runs from the run-history log"
+    )
+    history.add_argument(
+        "--last",
+        type=int,
+        default=DEFAULT_HISTORY_RUNS,
+        help=f"Number of most recent runs to summarize (default: {DEFAULT_HISTORY_RUNS})",
+    )
+    history.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    benchmark = subparsers.add_parser(
+        "benchmark-pdf", help="Time PDF text backends on sample filings"
+    )
+    benchmark.add_argument("pdfs", nargs="+", type=Path, help="Sample PDF files")
+    benchmark.add_argument("--repeat", type=int, default=3)
+    worker = subparsers.add_parser(
+        "ocr-worker", help="OCR queued reports and deliver their matches"
+    )
+    worker.add_argument(
+        "--workers",
+        type=int,
+        help=f"Concurrent OCR jobs (default: OCR_WORKERS or {DEFAULT_OCR_WORKERS})",
+    )
+    worker.add_argument(
+        "--max-jobs", type=int, help="Stop after claiming this many jobs (default: drain)"
+    )
+    search = subparsers.add_parser(
+        "search", help="Query the local full-text index of scanned reports"
+    )
+    search.add_argument(
+        "query", help='FTS5 query, e.g. UnitedHealth, "UnitedHealth Group" or NEAR(UNH sale)'
+    )
+    search.add_argument("--since", help="Only reports filed on or after YYYY-MM-DD")
+    search.add_argument("--source", dest="search_source", choices=("house", "senate"))
+    search.add_argument("--limit", type=int, default=DEFAULT_SEARCH_LIMIT)
+    search.add_argument("--json", action="store_true", help="Print matches as JSON")
     return parser
 
 
+def print_backend_benchmark(args: argparse.Namespace) -> int:
+    pdfs = [path.read_bytes() for path in args.pdfs]
+    results = benchmark_text_backends(pdfs, args.repeat)
+    for name, values in sorted(results.items(), key=lambda item: item[1]["seconds"]):
+        print(
+            f"{name}: {values['seconds']:.3f}s for {len(pdfs)} PDFs, "
+            f"{int(values['usable'])} with usable text"
+        )
+    backend = choose_text_backend(results, len(pdfs))
+    print(f"Selected PDF_TEXT_BACKEND={backend}")
+    path = _pdf_benchmark_path(args, os.environ)
+    if path is not None:
+        save_text_backend_choice(path, backend, results)
+        print(f"Saved to {path}; runs with PDF_TEXT_BACKEND=auto now use {backend}")
+    return 0
+
+
+def run_ocr_worker_command(args: argparse.Namespace) -> int:
+    config = build_config(args)
+    if config.ocr_queue_path is None:
+        LOGGER.error("OCR_QUEUE_FILE is not set; there is no OCR queue to process")
+        return 1
+    queue = OcrQueue(config.ocr_queue_path)
+    stats = run_ocr_worker(config, queue, max_jobs=args.max_jobs)
+    counts = queue.counts()
+    LOGGER.info("OCR worker finished: %s; queue: %s", dict(stats), counts)
+    # Exhausted jobs need an operator; keep them visible as a failing run.
+    return 1 if counts.get("failed") else 0
+
+
+def print_search_results(args: argparse.Namespace) -> int:
+    path = _search_index_path(args, os.environ)
+    if path is None or not path.exists():
+        LOGGER.error("SEARCH_INDEX_FILE is not set or does not exist; nothing to search")
+        return 1
+    try:
+        matches = SearchIndex(path).search(
+            args.query, since=args.since, source=args.search_source, limit=args.limit
+        )
+    except sqlite3.OperationalError as exc:
+        LOGGER.error("Invalid search query %r: %s", args.query, exc)
+        return 1
+    if args.json:
+        print(json.dumps(matches, indent=2, sort_keys=True))
+        return 0
+    for match in matches:
+        print(f"{match['filed_date']} {match['source']} {match['filer']} {match['url']}")
+        print(f"    {match['snippet']}")
+    return 0
+
+
+def print_history_summary(args: argparse.Namespace) -> int:
+    path = _history_path(args, os.environ)
+    if path is None:
+        LOGGER.error("HISTORY_FILE is empty; there is no run history to summarize")
+        return 1
+    summary = summarize_history(read_history(path, args.last))
+    if args.json:
+        print(json.dumps(summary, indent=2, sort_keys=True))
+        return 0
+    print(f"Runs: {summary['runs']} ({summary['failures']} failed)")
+    print(f"Window: {summary['first_started_utc']} .. {summary['last_started_utc']}")
+    print(
+        f"Duration: p50 {summary['p50_duration_seconds']}s, "
+        f"p95 {summary['p95_duration_seconds']}s"
+    )
+    print(
+        f"Scanned: {summary['reports_scanned']} reports, "
+        f"{summary['reports_per_minute']}/min, OCR share {summary['ocr_share']:.1%}"
+    )
+    for error_type, count in summary["error_types"].items():
+        print(f"Error {error_type}: {count}")
+    return 0
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
@@ -1110,6 +2835,18 @@ def main(argv: Sequence[str] | None = None) -> int:
         level=logging.DEBUG if args.verbose else logging.INFO,
         format="%(asctime)s %(levelname)s %(message)s",
     )
+    if args.command == "history":
+        return print_history_summary(args)
+    if args.command == "benchmark-pdf":
+        return print_backend_benchmark(args)
+    if args.command == "search":
+        return print_search_results(args)
+    if args.command == "ocr-worker":
+        try:
+            return run_ocr_worker_command(args)
+        except (MonitorError, ValueError, sqlite3.Error) as exc:
+            LOGGER.error("OCR worker failed: %s", exc)
+            return 1
     try:
         config = build_config(args)
         result = run_monitor(config)
@@ -1119,13 +2856,16 @@ def main(argv: Sequence[str] | None = None) -> int:
     except Exception:
         LOGGER.exception("Unexpected monitoring failure")
         return 1
+    finally:
+        close_ocr_engines()
 
     LOGGER.info(
-        "Monitoring succeeded: visible=%s new=%s matches=%s baselined=%s",
+        "Monitoring succeeded: visible=%s new=%s matches=%s baselined=%s deferred=%s",
         result.source_counts,
         result.new_counts,
         result.match_counts,
         result.baseline_counts,
+        result.deferred_counts,
     )
     return 0
 
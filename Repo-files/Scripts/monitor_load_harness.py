@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""Run the disclosure monitor end to end against local stand-in servers.
+
+One threaded HTTP server plays the House clerk site (annual index ZIPs and PTR PDFs), the
+Senate eFD site (terms/CSRF flow, paginated JSON search, electronic and paper PTRs) and
+the Pushover API. The monitor's own sessions are routed to it, so ``run_monitor`` runs
+unmodified, including its retries, while the server injects latency and errors.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import logging
+import random
+import re
+import secrets
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Sequence
+from urllib.parse import parse_qs, urlsplit
+
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if __package__:
+    from . import monitor_disclosures as monitor
+else:
+    import monitor_disclosures as monitor
+
+
+HOUSE_ORIGIN = "https://disclosures-clerk.house.gov"
+HOUSE_INDEX_HEADER = "Prefix\tLast\tFirst\tSuffix\tFilingType\tStateDst\tYear\tFilingDate\tDocID\n"
+
+
+@dataclass(frozen=True)
+class HarnessOptions:
+    house_reports: int = 200
+    senate_reports: int = 100
+    # Share of Senate reports that are scanned paper filings rather than electronic PTRs.
+    paper_share: float = 0.2
+    match_rate: float = 0.05
+    latency_ms: float = 0.0
+    error_rate: float = 0.0
+    pushover_error_rate: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class FakeDisclosureSite:
+    """Generated filings plus the request log of the stand-in server."""
+
+    options: HarnessOptions
+    house_index: dict[int, bytes] = field(default_factory=dict)
+    house_pdfs: dict[str, bytes] = field(default_factory=dict)
+    senate_rows: list[list[str]] = field(default_factory=list)
+    senate_pages: dict[str, tuple[str, bytes]] = field(default_factory=dict)
+    matching_urls: set[str] = field(default_factory=set)
+    alerts: list[tuple[float, dict[str, str]]] = field(default_factory=list)
+    requests: int = 0
+    injected_errors: int = 0
+    csrf_token: str = field(default_factory=lambda: secrets.token_hex(16))
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @classmethod
+    def generate(cls, options: HarnessOptions, year: int) -> FakeDisclosureSite:
+        site = cls(options)
+        rng = random.Random(options.seed)
+        today = monitor.utc_now()
+
+        index_lines: dict[int, list[str]] = {year - 1: [], year: []}
+        for number in range(options.house_reports):
+            filing_year = year if number % 2 else year - 1
+            doc_id = f"{20000000 + number}"
+            matches = rng.random() < options.match_rate
+            filed = (today - timedelta(days=number % 300)).strftime("%m/%d/%Y")
+            index_lines[filing_year].append(
+                f"Hon.\tMember\tHouse{number}\t\tP\tCA{number % 50:02d}\t{filing_year}\t{filed}\t{doc_id}\n"
+            )
+            # Non-PTR filings share the index and must be ignored.
+            index_lines[filing_year].append(
+                f"\tMember\tOther{number}\t\tO\tCA01\t{filing_year}\t{filed}\t{30000000 + number}\n"
+            )
+            site.house_pdfs[f"/public_disc/ptr-pdfs/{filing_year}/{doc_id}.pdf"] = text_pdf(
+                _transaction_line(matches, rng)
+            )
+            if matches:
+                site.matching_urls.add(monitor.HOUSE_PTR_URL.format(year=filing_year, doc_id=doc_id))
+        for index_year, lines in index_lines.items():
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr(f"{index_year}FD.txt", HOUSE_INDEX_HEADER + "".join(lines))
+            site.house_index[index_year] = buffer.getvalue()
+
+        for number in range(options.senate_reports):
+            report_key = f"{number:08x}-0000-4000-8000-{number:012x}"
+            filer_first, filer_last = f"Senate{number}", "Member"
+            matches = rng.random() < options.match_rate
+            received = (today - timedelta(days=number % 90)).strftime("%m/%d/%Y")
+            if rng.random() < options.paper_share:
+                path = f"/search/view/paper/{report_key}/"
+                pdf_path = f"/media/paper/{report_key}.pdf"
+                viewer = f'<html><body><a href="{pdf_path}">Page 1</a></body></html>'
+                site.senate_pages[path] = ("text/html", viewer.encode("utf-8"))
+                site.senate_pages[pdf_path] = (
+                    "application/pdf",
+                    text_pdf(_transaction_line(matches, rng)),
+                )
+            else:
+                path = f"/search/view/ptr/{report_key}/"
+                site.senate_pages[path] = ("text/html", _senate_ptr_html(matches, received, rng))
+            site.senate_rows.append(
+                [
+                    filer_first,
+                    filer_last,
+                    "Periodic Transaction Report",
+                    f'<a href="{path}" target="_blank">Periodic Transaction Report</a>',
+                    received,
+                ]
+            )
+            if matches:
+                site.matching_urls.add(monitor.SENATE_ROOT + path)
+        return site
+
+    def record(self) -> None:
+        with self.lock:
+            self.requests += 1
+
+    def should_fail(self, rng: random.Random, rate: float) -> bool:
+        with self.lock:
+            if rate <= 0 or rng.random() >= rate:
+                return False
+            self.injected_errors += 1
+            return True
+
+
+def text_pdf(text: str) -> bytes:
+    """A minimal one-page PDF with ``text`` in its text layer."""
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    stream = f"BT /F1 12 Tf 72 720 Td ({escaped}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            b"<< /Type /Page /Parent 2 0 R /Resources << /Font << /F1 4 0 R >> >> "
+            b"/MediaBox [0 0 612 792] /Contents 5 0 R >>"
+        ),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length " + str(len(stream)).encode("ascii") + b" >>\nstream\n" + stream + b"\nendstream",
+    ]
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output.extend(f"{number} 0 obj\n".encode("ascii") + body + b"\nendobj\n")
+    xref = len(output)
+    output.extend(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("ascii"))
+    for offset in offsets:
+        output.extend(f"{offset:010d} 00000 n \n".encode("ascii"))
+    output.extend(
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode(
+            "ascii"
+        )
+    )
+    return bytes(output)
+
+
+_FILLER_ASSETS = (
+    ("AAPL", "Apple Inc."),
+    ("MSFT", "Microsoft Corporation"),
+    ("XOM", "Exxon Mobil Corporation"),
+    ("JNJ", "Johnson & Johnson"),
+)
+
+
+def _transaction_line(matches: bool, rng: random.Random) -> str:
+    ticker, asset = ("UNH", "UnitedHealth Group Inc") if matches else rng.choice(_FILLER_ASSETS)
+    return f"SP {asset} ({ticker}) [ST] P 07/01/2026 07/02/2026 $1,001 - $15,000"
+
+
+def _senate_ptr_html(matches: bool, received: str, rng: random.Random) -> bytes:
+    ticker, asset = ("UNH", "UnitedHealth Group Inc") if matches else rng.choice(_FILLER_ASSETS)
+    cells = ["1", received, "Self", ticker, asset, "Stock", "Purchase", "$1,001 - $15,000"]
+    row = "".join(f"<td>{cell}</td>" for cell in cells)
+    return f"<html><body><table><tbody><tr>{row}</tr></tbody></table></body></html>".encode()
+
+
+def make_handler(site: FakeDisclosureSite) -> type[BaseHTTPRequestHandler]:
+    rng = random.Random(site.options.seed + 1)
+    rng_lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return
+
+        def _send(
+            self,
+            status: int,
+            body: bytes,
+            content_type: str = "text/html",
+            headers: Sequence[tuple[str, str]] = (),
+        ) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers:
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _delay_or_fail(self, pushover: bool = False) -> bool:
+            site.record()
+            options = site.options
+            with rng_lock:
+                delay = options.latency_ms * rng.uniform(0.5, 1.5) / 1000
+                fail = site.should_fail(
+                    rng, options.pushover_error_rate if pushover else options.error_rate
+                )
+            if delay:
+                time.sleep(delay)
+            if fail:
+                self._send(503, b"injected failure", "text/plain")
+            return fail
+
+        def _form(self) -> dict[str, str]:
+            length = int(self.headers.get("Content-Length", "0"))
+            body = self.rfile.read(length).decode("utf-8")
+            return {key: values[0] for key, values in parse_qs(body).items()}
+
+        def do_GET(self) -> None:  # noqa: N802
+            path = urlsplit(self.path).path
+            if self._delay_or_fail():
+                return
+            index = re.fullmatch(r"/public_disc/financial-pdfs/(\d{4})FD\.ZIP", path)
+            if index:
+                data = site.house_index.get(int(index.group(1)))
+                if data is None:
+                    self._send(404, b"not found", "text/plain")
+                else:
+                    self._send(200, data, "application/zip")
+                return
+            if path in site.house_pdfs:
+                self._send(200, site.house_pdfs[path], "application/pdf")
+                return
+            if path == "/search/home/":
+                form = (
+                    '<form method="post"><input type="hidden" name="csrfmiddlewaretoken" '
+                    f'value="{site.csrf_token}"></form>'
+                )
+                self._send(200, form.encode("utf-8"))
+                return
+            if path == "/search/":
+                self._send(200, b"<html><body>Search</body></html>")
+                return
+            if path in site.senate_pages:
+                content_type, body = site.senate_pages[path]
+                self._send(200, body, content_type)
+                return
+            self._send(404, b"not found", "text/plain")
+
+        def do_POST(self) -> None:  # noqa: N802
+            path = urlsplit(self.path).path
+            form = self._form()
+            if self._delay_or_fail(pushover=path == "/1/messages.json"):
+                return
+            if path == "/search/home/":
+                if form.get("csrfmiddlewaretoken") != site.csrf_token:
+                    self._send(403, b"bad csrf", "text/plain")
+                    return
+                self._send(
+                    302,
+                    b"",
+                    headers=(
+                        ("Location", "/search/"),
+                        ("Set-Cookie", f"csrftoken={site.csrf_token}; Path=/"),
+                    ),
+                )
+                return
+            if path == "/search/report/data/":
+                if self.headers.get("X-CSRFToken") != site.csrf_token:
+                    self._send(403, b"bad csrf", "text/plain")
+                    return
+                start, length = int(form.get("start", 0)), int(form.get("length", 100))
+                body = {
+                    "draw": int(form.get("draw", 1)),
+                    "recordsTotal": len(site.senate_rows),
+                    "recordsFiltered": len(site.senate_rows),
+                    "data": site.senate_rows[start : start + length],
+                }
+                self._send(200, json.dumps(body).encode("utf-8"), "application/json")
+                return
+            if path == "/1/messages.json":
+                with site.lock:
+                    site.alerts.append((time.monotonic(), form))
+                self._send(200, b'{"status":1,"request":"harness"}', "application/json")
+                return
+            self._send(404, b"not found", "text/plain")
+
+    return Handler
+
+
+class LocalRouteAdapter(HTTPAdapter):
+    """Send requests for the real origins to the local server.
+
+    The request and the response keep the public URL, so cookies, redirects and the
+    monitor's URL checks behave as they do against the real sites.
+    """
+
+    def __init__(self, local_base: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.local_base = local_base
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:  # type: ignore[override]
+        public = urlsplit(request.url)
+        local = request.copy()
+        local.url = self.local_base + public.path + (f"?{public.query}" if public.query else "")
+        response = super().send(local, **kwargs)
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def harness_session_factory(local_base: str):
+    def build(user_agent: str) -> Session:
+        session = monitor.build_session(user_agent)
+        source_adapter = session.get_adapter("https://")
+        routed = LocalRouteAdapter(
+            local_base,
+            max_retries=source_adapter.max_retries,
+            pool_connections=8,
+            pool_maxsize=8,
+        )
+        for origin in (HOUSE_ORIGIN, monitor.SENATE_ROOT):
+            session.mount(origin, routed)
+        # Same no-retry rule as the real notification adapter.
+        session.mount(
+            monitor.PUSHOVER_MESSAGES_URL,
+            LocalRouteAdapter(local_base, max_retries=Retry(total=0)),
+        )
+        return session
+
+    return build
+
+
+def run_load_test(
+    options: HarnessOptions, config: monitor.Config | None = None
+) -> dict[str, Any]:
+    """Serve generated filings, run the monitor once over all of them and measure it."""
+    year = monitor.utc_now().year
+    site = FakeDisclosureSite.generate(options, year)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(site))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    local_base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    with tempfile.TemporaryDirectory(prefix="monitor-load-") as work_dir:
+        base = config or harness_config(Path(work_dir))
+        run_config = replace(
+            base,
+            state_path=Path(work_dir) / "state.json",
+            result_path=Path(work_dir) / "result.json",
+            history_path=None,
+        )
+        started = time.monotonic()
+        error = ""
+        try:
+            result = monitor.run_monitor(
+                run_config, session_factory=harness_session_factory(local_base)
+            )
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            result = None
+        elapsed = time.monotonic() - started
+    server.shutdown()
+    server.server_close()
+
+    alert_latencies = sorted(received - started for received, _ in site.alerts)
+    scanned = sum(result.scanned_counts.values()) if result else 0
+    alerted_urls = {form.get("url", "") for _, form in site.alerts}
+    return {
+        "success": result is not None,
+        "error": error,
+        "elapsed_seconds": round(elapsed, 3),
+        "reports_visible": sum(result.source_counts.values()) if result else 0,
+        "reports_scanned": scanned,
+        "reports_per_second": round(scanned / elapsed, 2) if elapsed else 0.0,
+        "expected_matches": len(site.matching_urls),
+        "alerts_received": len(site.alerts),
+        "missed_matches": sorted(site.matching_urls - alerted_urls),
+        "first_alert_seconds": round(alert_latencies[0], 3) if alert_latencies else None,
+        "p50_alert_seconds": round(monitor._percentile(alert_latencies, 0.50), 3),
+        "p95_alert_seconds": round(monitor._percentile(alert_latencies, 0.95), 3),
+        "server_requests": site.requests,
+        "injected_errors": site.injected_errors,
+    }
+
+
+def harness_config(work_dir: Path) -> monitor.Config:
+    """A config that scans every generated filing and alerts through the fake Pushover."""
+    return monitor.Config(
+        keywords=monitor.parse_keywords(None),
+        state_path=work_dir / "state.json",
+        result_path=work_dir / "result.json",
+        source="all",
+        bootstrap_alerts=True,
+        no_notify=False,
+        senate_lookback_days=monitor.DEFAULT_LOOKBACK_DAYS,
+        max_download_bytes=monitor.DEFAULT_MAX_DOWNLOAD_BYTES,
+        max_ocr_pages=monitor.DEFAULT_MAX_OCR_PAGES,
+        user_agent="MyETFDisclosureMonitor load harness",
+        pushover_api_token="harness-token",
+        pushover_user_key="harness-user",
+        require_pushover=True,
+        allow_empty_sources=False,
+        allow_state_initialization=True,
+        history_path=None,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    defaults = HarnessOptions()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--house-reports", type=int, default=defaults.house_reports)
+    parser.add_argument("--senate-reports", type=int, default=defaults.senate_reports)
+    parser.add_argument("--paper-share", type=float, default=defaults.paper_share)
+    parser.add_argument("--match-rate", type=float, default=defaults.match_rate)
+    parser.add_argument(
+        "--latency-ms", type=float, default=defaults.latency_ms,
+        help="Mean added latency per request; each request varies ±50%%",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=defaults.error_rate,
+        help="Share of source requests answered with HTTP 503",
+    )
+    parser.add_argument(
+        "--pushover-error-rate", type=float, default=defaults.pushover_error_rate,
+        help="Share of Pushover requests answered with HTTP 503",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--verbose", action="store_true")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    if not args.verbose:
+        # Every generated match is logged as a warning; keep the report readable.
+        logging.getLogger(monitor.LOGGER.name).setLevel(logging.ERROR)
+    options = HarnessOptions(
+        house_reports=args.house_reports,
+        senate_reports=args.senate_reports,
+        paper_share=args.paper_share,
+        match_rate=args.match_rate,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        pushover_error_rate=args.pushover_error_rate,
+        seed=args.seed,
+    )
+    report = run_load_test(options)
+    if args.json:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        for key, value in report.items():
+            print(f"{key}: {value}")
+    return 0 if report["success"] and not report["missed_matches"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -307,3 +307,654 @@ def test_failed_notification_does_not_mark_match_seen(tmp_path: Path, monkeypatc
     result = json.loads((tmp_path / "result.json").read_text())
     assert result["success"] is False
     assert "NotificationError" in result["errors"][0]
+
+
+def test_report_priority_prefers_watched_electronic_and_newest() -> None:
+    from scripts.monitor_disclosures import Report, report_priority
+
+    def report(report_id: str, filer: str, filed: str, source: str, fmt: str) -> Report:
+        return Report(report_id, source, filer, filed, "https://example.invalid/", fmt)
+
+    reports = [
+        report("senate:paper", "Alex Example", "07/21/2026", "senate", "pdf"),
+        report("house:old", "Casey Sample", "7/01/2026", "house", "pdf"),
+        report("house:new", "Casey Sample", "7/20/2026", "house", "pdf"),
+        report("senate:html", "Casey Sample", "06/01/2026", "senate", "html"),
+        report("house:watched", "Hon. Jordan Watch", "1/02/2026", "house", "pdf"),
+    ]
+    ordered = sorted(reports, key=lambda item: report_priority(item, ("jordan watch",)))
+    assert [item.report_id for item in ordered] == [
+        "house:watched",
+        "senate:html",
+        "house:new",
+        "house:old",
+        "senate:paper",
+    ]
+
+
+def test_run_monitor_defers_reports_past_the_deadline(tmp_path: Path, monkeypatch) -> None:
+    import dataclasses
+
+    import scripts.monitor_disclosures as monitor
+
+    old = sample_report("house:2026:old")
+    first = sample_report("house:2026:first")
+    second = sample_report("house:2026:second")
+    state = MonitorState()
+    state.mark_seen("house", old.report_id, "2026-07-21T00:00:00Z")
+    save_state(tmp_path / "state.json", state)
+    monkeypatch.setattr(
+        monitor, "fetch_house_reports", lambda *args, **kwargs: [old, first, second]
+    )
+
+    clock = [1000.0]
+    monkeypatch.setattr(monitor, "monotonic", lambda: clock[0])
+    scanned = []
+
+    def slow_scan(_session, report, _config):
+        scanned.append(report.report_id)
+        clock[0] += 50.0
+        return None
+
+    monkeypatch.setattr(monitor, "scan_house_report", slow_scan)
+    config = dataclasses.replace(make_config(tmp_path), deadline_seconds=100.0)
+    result = monitor.run_monitor(config, session=object())
+
+    assert result.success is True
+    assert len(scanned) == 1
+    assert result.deferred_counts == {"house": 1}
+    loaded, _ = load_state(tmp_path / "state.json")
+    assert loaded.is_seen("house", scanned[0])
+    deferred = {first.report_id, second.report_id} - set(scanned)
+    assert not loaded.is_seen("house", deferred.pop())
+    written = json.loads((tmp_path / "result.json").read_text())
+    assert written["deferred_counts"] == {"house": 1}
+
+
+def test_run_history_appends_rotates_and_summarizes(tmp_path: Path) -> None:
+    from scripts.monitor_disclosures import (
+        RunResult,
+        append_history,
+        read_history,
+        summarize_history,
+    )
+
+    path = tmp_path / "history.ndjson.gz"
+    for index in range(4):
+        result = RunResult(
+            started_utc=f"2026-07-2{index}T12:00:00Z",
+            duration_seconds=60.0 * (index + 1),
+            scanned_counts={"house": 10, "senate": 2},
+            ocr_counts={"senate": 3},
+            errors=[] if index else ["SourceChangedError: bad index"],
+            success=bool(index),
+        )
+        append_history(path, result, max_bytes=1)
+
+    assert (tmp_path / "history.ndjson.gz.3").exists()
+    records = read_history(path, last=3)
+    assert [record["started_utc"] for record in records] == [
+        "2026-07-21T12:00:00Z",
+        "2026-07-22T12:00:00Z",
+        "2026-07-23T12:00:00Z",
+    ]
+
+    summary = summarize_history(read_history(path, last=10))
+    assert summary["runs"] == 4
+    assert summary["failures"] == 1
+    assert summary["p50_duration_seconds"] == 120.0
+    assert summary["p95_duration_seconds"] == 240.0
+    assert summary["reports_per_minute"] == 4.8
+    assert summary["ocr_share"] == 0.25
+    assert summary["error_types"] == {"SourceChangedError": 1}
+
+
+def test_text_layer_falls_back_to_pdfplumber_when_fast_output_is_unusable(
+    monkeypatch,
+) -> None:
+    import scripts.monitor_disclosures as monitor
+
+    pdf = simple_text_pdf("Purchased UNH common stock")
+    assert "UNH" in monitor.extract_text_layer(pdf, "pdfium")
+
+    garbled = monitor.TextBackend("pdfium", lambda _pdf: ["��" * 20], lambda: True)
+    monkeypatch.setitem(monitor.TEXT_BACKENDS, "pdfium", garbled)
+    assert [backend.name for backend in monitor.text_backend_chain("auto")] == [
+        "pdfium",
+        "pdfplumber",
+    ]
+    assert "UNH" in monitor.extract_text_layer(pdf, "auto")
+
+
+def test_text_layer_tolerates_a_few_unmapped_glyphs() -> None:
+    from scripts.monitor_disclosures import text_layer_is_usable
+
+    text = "Purchased UnitedHealth Group common stock (UNH) on 07/20/2026 " * 5
+    assert text_layer_is_usable(text + "(cid:31) \ufffd")
+    assert not text_layer_is_usable("(cid:31)(cid:42)(cid:17) " * 10 + text[:60])
+
+
+def test_choose_text_backend_requires_complete_coverage() -> None:
+    from scripts.monitor_disclosures import choose_text_backend
+
+    results = {
+        "pdfium": {"seconds": 0.2, "usable": 9},
+        "pdfplumber": {"seconds": 1.5, "usable": 10},
+    }
+    assert choose_text_backend(results, samples=10) == "pdfplumber"
+    results["pdfium"]["usable"] = 10
+    assert choose_text_backend(results, samples=10) == "pdfium"
+
+
+def test_auto_text_backend_uses_the_saved_benchmark_choice(tmp_path: Path, monkeypatch) -> None:
+    import scripts.monitor_disclosures as monitor
+
+    monkeypatch.setenv("PDF_BENCHMARK_FILE", str(tmp_path / "pdf-text-backend.json"))
+    monkeypatch.delenv("PDF_TEXT_BACKEND", raising=False)
+    parser = monitor.build_parser()
+    assert monitor.build_config(parser.parse_args([])).pdf_text_backend == "auto"
+
+    sample = tmp_path / "sample.pdf"
+    sample.write_bytes(simple_text_pdf("Purchased UNH common stock"))
+    fast = monitor.TextBackend("pdfium", lambda _pdf: ["unreadable"], lambda: True)
+    monkeypatch.setitem(monitor.TEXT_BACKENDS, "pdfium", fast)
+    assert monitor.main(["benchmark-pdf", str(sample), "--repeat", "1"]) == 0
+
+    assert monitor.build_config(parser.parse_args([])).pdf_text_backend == "pdfplumber"
+    assert monitor.build_config(parser.parse_args(["--pdf-text-backend", "pdfium"])).pdf_text_backend == "pdfium"
+
+
+def _patch_ocr_renderer(monkeypatch, monitor, pages: int) -> None:
+    monkeypatch.setattr(monitor, "extract_text_layer", lambda *_args: "")
+    monkeypatch.setattr(monitor, "pdfinfo_from_bytes", lambda _pdf: {"Pages": pages})
+    monkeypatch.setattr(
+        monitor, "convert_from_bytes", lambda _pdf, **kwargs: [f"page-{kwargs['first_page']}"]
+    )
+
+
+def test_ocr_reuses_one_in_process_tesseract_engine(monkeypatch) -> None:
+    import types
+
+    import scripts.monitor_disclosures as monitor
+
+    created = []
+
+    class FakeApi:
+        def __init__(self, lang: str) -> None:
+            created.append(lang)
+            self.image = None
+
+        def SetImage(self, image) -> None:
+            self.image = image
+
+        def GetUTF8Text(self) -> str:
+            return f"UNH on {self.image}"
+
+        def MeanTextConf(self) -> int:
+            return 91
+
+        def Clear(self) -> None:
+            self.image = None
+
+        def End(self) -> None:
+            pass
+
+    monkeypatch.setattr(monitor, "tesserocr", types.SimpleNamespace(PyTessBaseAPI=FakeApi))
+    monkeypatch.setattr(monitor, "pytesseract", None)
+    _patch_ocr_renderer(monkeypatch, monitor, pages=3)
+    options = monitor.OcrOptions(preprocess=False)
+    monitor.close_ocr_engines()
+    try:
+        text = monitor.extract_pdf_text(b"%PDF-1.4 scanned", 5, ocr_options=options)
+        text += monitor.extract_pdf_text(b"%PDF-1.4 scanned", 5, ocr_options=options)
+    finally:
+        monitor.close_ocr_engines()
+    assert "UNH on page-3" in text
+    assert created == ["eng"]
+
+
+def test_ocr_falls_back_to_pytesseract_without_tesserocr(monkeypatch) -> None:
+    import types
+
+    import scripts.monitor_disclosures as monitor
+
+    monkeypatch.setattr(monitor, "tesserocr", None)
+
+    def image_to_data(image, lang, output_type):
+        return {
+            "text": ["UnitedHealth", "", image],
+            "conf": ["88", "-1", "90"],
+            "block_num": [1, 1, 1],
+            "par_num": [1, 1, 1],
+            "line_num": [1, 1, 2],
+        }
+
+    monkeypatch.setattr(
+        monitor,
+        "pytesseract",
+        types.SimpleNamespace(
+            image_to_data=image_to_data, Output=types.SimpleNamespace(DICT="dict")
+        ),
+    )
+    _patch_ocr_renderer(monkeypatch, monitor, pages=2)
+    assert monitor.select_ocr_engine("auto").name == "pytesseract"
+    text = monitor.extract_pdf_text(
+        b"%PDF-1.4 scanned", 5, ocr_options=monitor.OcrOptions(preprocess=False)
+    )
+    assert text == "UnitedHealth\npage-1\nUnitedHealth\npage-2"
+
+
+def test_ocr_retries_at_higher_dpi_only_for_low_confidence_pages(monkeypatch) -> None:
+    import scripts.monitor_disclosures as monitor
+
+    renders = []
+    monkeypatch.setattr(monitor, "extract_text_layer", lambda *_args: "")
+    monkeypatch.setattr(monitor, "pdfinfo_from_bytes", lambda _pdf: {"Pages": 2})
+
+    def render(_pdf, **kwargs):
+        renders.append((kwargs["first_page"], kwargs["dpi"]))
+        return [(kwargs["first_page"], kwargs["dpi"])]
+
+    def recognize(image):
+        page, dpi = image
+        confidence = 30.0 if page == 2 and dpi < 300 else 85.0
+        return f"page {page} at {dpi}", confidence
+
+    monkeypatch.setattr(monitor, "convert_from_bytes", render)
+    engine = monitor.OcrEngine("fake", recognize, lambda: True)
+    monkeypatch.setattr(monitor, "select_ocr_engine", lambda _name: engine)
+    options = monitor.OcrOptions(dpi=150, retry_dpi=300, preprocess=False)
+    text = monitor.extract_pdf_text(b"%PDF-1.4 scanned", 5, ocr_options=options)
+    assert renders == [(1, 150), (2, 150), (2, 300)]
+    assert text == "page 1 at 150\npage 2 at 300"
+
+
+def test_preprocess_binarizes_deskews_and_crops_margins() -> None:
+    from PIL import Image, ImageDraw
+
+    from scripts.monitor_disclosures import (
+        binarize_page,
+        estimate_skew_angle,
+        preprocess_page_image,
+    )
+
+    page = Image.new("L", (800, 1000), 235)
+    draw = ImageDraw.Draw(page)
+    for row in range(12):
+        top = 300 + row * 30
+        draw.rectangle((200, top, 600, top + 10), fill=40)
+    skewed = page.rotate(3, resample=Image.BILINEAR, fillcolor=235)
+
+    binary = binarize_page(skewed)
+    assert set(binary.tobytes()) <= {0, 255}
+    assert estimate_skew_angle(binary) == -3.0
+    cleaned = preprocess_page_image(skewed)
+    assert cleaned.width < 500 and cleaned.height < 500
+
+
+def test_run_monitor_runs_sources_concurrently(tmp_path: Path, monkeypatch) -> None:
+    import dataclasses
+    import threading
+
+    import scripts.monitor_disclosures as monitor
+
+    state = MonitorState()
+    state.mark_seen("house", "house:2026:old", "2026-07-21T00:00:00Z")
+    state.mark_seen("senate", "senate:old", "2026-07-21T00:00:00Z")
+    save_state(tmp_path / "state.json", state)
+
+    # Each fetch waits for the other; run sequentially, the barrier would time out.
+    both_fetching = threading.Barrier(2, timeout=5)
+
+    def fetch(_session, source, _config, _index_delta=None):
+        both_fetching.wait()
+        if source == "senate":
+            raise SourceChangedError("Senate search changed")
+        return [sample_report("house:2026:old"), sample_report("house:2026:new")]
+
+    monkeypatch.setattr(monitor, "fetch_source_reports", fetch)
+    monkeypatch.setattr(monitor, "scan_house_report", lambda *_: None)
+    config = dataclasses.replace(make_config(tmp_path), source="all")
+
+    with pytest.raises(ValueError, match="cannot be shared"):
+        monitor.run_monitor(config, session=object())
+
+    sessions = []
+
+    def session_factory(_user_agent):
+        sessions.append(object())
+        return sessions[-1]
+
+    with pytest.raises(SourceChangedError, match="Senate search changed"):
+        monitor.run_monitor(config, session_factory=session_factory)
+    assert len(sessions) == 2
+    loaded, _ = load_state(tmp_path / "state.json")
+    assert loaded.is_seen("house", "house:2026:new")
+    result = json.loads((tmp_path / "result.json").read_text())
+    assert result["scanned_counts"] == {"house": 1}
+    assert "SourceChangedError" in result["errors"][0]
+
+
+def test_house_index_delta_emits_only_new_or_amended_rows() -> None:
+    from scripts.monitor_disclosures import HouseIndexDelta
+
+    header = "Prefix\tLast\tFirst\tSuffix\tFilingType\tStateDst\tYear\tFilingDate\tDocID\n"
+    first = header + "\tExample\tAlex\t\tP\tNY01\t2026\t7/20/2026\t1\n"
+    first_zip = house_zip(first)
+
+    initial = HouseIndexDelta()
+    assert [report.report_id for report in initial.changed_reports(first_zip, 2026)] == [
+        "house:2026:1"
+    ]
+
+    unchanged = HouseIndexDelta(previous=initial.current)
+    assert unchanged.changed_reports(first_zip, 2026) == []
+    assert unchanged.visible == 1
+
+    second = (
+        header
+        + "\tExample\tAlex\t\tP\tNY01\t2026\t7/21/2026\t1\n"
+        + "\tSample\tCasey\t\tP\tCA12\t2026\t7/21/2026\t2\n"
+        + "\tAnnual\tJordan\t\tA\tTX02\t2026\t7/21/2026\t3\n"
+    )
+    later = HouseIndexDelta(previous=initial.current)
+    changed = later.changed_reports(house_zip(second), 2026)
+    assert [report.report_id for report in changed] == ["house:2026:1", "house:2026:2"]
+    assert later.visible == 2
+    assert later.current["2026"]["ptrs"] == 2
+
+
+def test_house_index_fingerprints_persist_only_after_processing(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import dataclasses
+    import itertools
+
+    import scripts.monitor_disclosures as monitor
+
+    header = "Prefix\tLast\tFirst\tSuffix\tFilingType\tStateDst\tYear\tFilingDate\tDocID\n"
+    rows = "\tExample\tAlex\t\tP\tNY01\t2026\t7/20/2026\t1\n"
+
+    def fetch(_session, years, max_download_bytes, index_delta=None):
+        return index_delta.changed_reports(house_zip(header + rows), 2026)
+
+    monkeypatch.setattr(monitor, "fetch_house_reports", fetch)
+    monkeypatch.setattr(monitor, "scan_house_report", lambda *_: None)
+    config = make_config(tmp_path)
+    first = monitor.run_monitor(config, session=object())
+    assert first.baseline_counts == {"house": 1}
+    state, _ = load_state(tmp_path / "state.json")
+    assert state.house_index["2026"]["ptrs"] == 1
+
+    rows += "\tSample\tCasey\t\tP\tCA12\t2026\t7/21/2026\t2\n"
+    ticks = itertools.count(step=10.0)
+    monkeypatch.setattr(monitor, "monotonic", lambda: next(ticks))
+    deferred = monitor.run_monitor(
+        dataclasses.replace(config, deadline_seconds=1.0), session=object()
+    )
+    assert deferred.new_counts == {"house": 1}
+    assert deferred.deferred_counts == {"house": 1}
+    state, _ = load_state(tmp_path / "state.json")
+    assert state.house_index["2026"]["ptrs"] == 1
+
+    monkeypatch.undo()
+    monkeypatch.setattr(monitor, "fetch_house_reports", fetch)
+    monkeypatch.setattr(monitor, "scan_house_report", lambda *_: None)
+    finished = monitor.run_monitor(config, session=object())
+    assert finished.source_counts == {"house": 2}
+    assert finished.scanned_counts == {"house": 1}
+    state, _ = load_state(tmp_path / "state.json")
+    assert state.house_index["2026"]["ptrs"] == 2
+
+
+def test_house_index_fingerprints_of_old_years_are_pruned(tmp_path: Path) -> None:
+    from scripts.monitor_disclosures import house_index_years
+
+    previous, current = house_index_years()
+    state = MonitorState()
+    for year in (previous - 3, previous, current):
+        state.house_index[str(year)] = {"digest": "d", "ptrs": 1, "rows": ["f"]}
+    save_state(tmp_path / "state.json", state)
+
+    loaded, _ = load_state(tmp_path / "state.json")
+    assert sorted(loaded.house_index) == [str(previous), str(current)]
+
+
+def test_amended_house_row_is_scanned_again(tmp_path: Path, monkeypatch) -> None:
+    import scripts.monitor_disclosures as monitor
+
+    header = "Prefix\tLast\tFirst\tSuffix\tFilingType\tStateDst\tYear\tFilingDate\tDocID\n"
+    index = {"rows": header + "\tExample\tAlex\t\tP\tNY01\t2026\t7/20/2026\t1\n"}
+
+    def fetch(_session, years, max_download_bytes, index_delta=None):
+        return index_delta.changed_reports(house_zip(index["rows"]), 2026)
+
+    scanned = []
+
+    def scan(_session, report, _config):
+        scanned.append((report.report_id, report.filed_date))
+        return None
+
+    monkeypatch.setattr(monitor, "fetch_house_reports", fetch)
+    monkeypatch.setattr(monitor, "scan_house_report", scan)
+    config = make_config(tmp_path)
+    assert monitor.run_monitor(config, session=object()).baseline_counts == {"house": 1}
+
+    index["rows"] = header + "\tExample\tAlex\t\tP\tNY01\t2026\t7/24/2026\t1\n"
+    amended = monitor.run_monitor(config, session=object())
+    assert amended.new_counts == {"house": 1}
+    assert scanned == [("house:2026:1", "7/24/2026")]
+
+    assert monitor.run_monitor(config, session=object()).new_counts == {"house": 0}
+    assert len(scanned) == 1
+
+
+def test_house_transactions_from_table_matches_ingestion_columns() -> None:
+    import scripts.monitor_disclosures as monitor
+
+    table = [
+        ["ID", "Owner", "Asset", "Transaction\nType", "Date", "Notification\nDate", "Amount"],
+        ["", "SP", "UnitedHealth Group Inc (UNH) [ST]", "P", "07/01/2026", "07/02/2026", "$1,001 - $15,000"],
+        ["", "", "F S: New\nD: Filing status", None, None, None, None],
+        ["", "", "Apple Inc. (AAPL)\x00 [ST]", "S (partial)", "07/03/2026", "07/04/2026", "$15,001 - $50,000"],
+    ]
+    transactions = monitor.house_transactions_from_table(table)
+    assert [(t.ticker, t.transaction_type, t.owner) for t in transactions] == [
+        ("UNH", "P", "SP"),
+        ("AAPL", "S (partial)", ""),
+    ]
+    assert transactions[1].asset == "Apple Inc. (AAPL) [ST]"
+
+
+def test_parse_senate_transactions_reads_named_columns() -> None:
+    import scripts.monitor_disclosures as monitor
+
+    html = """
+    <table><tbody>
+      <tr>
+        <td>1</td><td>07/01/2026</td><td>Spouse</td><td>--</td>
+        <td>UnitedHealth Group Inc. bond</td><td>Corporate Bond</td><td>Sale (Full)</td>
+        <td>$1,001-$15,000</td>
+      </tr>
+    </tbody></table>
+    """
+    (transaction,) = monitor.parse_senate_transactions(html)
+    assert transaction.ticker == ""
+    assert transaction.owner == "Spouse"
+    assert transaction.asset_type == "Corporate Bond"
+    assert transaction.transaction_type == "Sale (Full)"
+
+
+def test_structured_mode_matches_transaction_fields_and_falls_back_to_text(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import dataclasses
+
+    import scripts.monitor_disclosures as monitor
+
+    config = dataclasses.replace(make_config(tmp_path), match_mode="structured")
+    pdf = simple_text_pdf("Comment: filer discussed UNH in a footnote")
+    monkeypatch.setattr(monitor, "fetch_pdf_bytes", lambda *_: pdf)
+    rows = [
+        ["", "", "Apple Inc. (AAPL) [ST]", "P", "07/01/2026", "07/02/2026", "$1,001 - $15,000"],
+        ["", "JT", "UnitedHealth Group Inc (UNH) [ST]", "S", "07/05/2026", "07/06/2026", "$15,001 - $50,000"],
+    ]
+    monkeypatch.setattr(
+        monitor,
+        "extract_house_transactions",
+        lambda _pdf: monitor.house_transactions_from_table(rows),
+    )
+
+    alert = monitor.scan_house_report(
+        object(),
+        sample_report("h1"),
+        dataclasses.replace(config, search_index_path=tmp_path / "search.db"),
+    )
+    assert alert is not None
+    # The footnote is outside the parsed columns but still searchable.
+    index = monitor.SearchIndex(tmp_path / "search.db")
+    assert [match["report_id"] for match in index.search("footnote")] == ["h1"]
+    assert alert.keywords == ("UNH", "UnitedHealth")
+    assert [row["ticker"] for row in alert.transactions] == ["UNH"]
+    assert "AAPL" not in alert.snippet
+
+    monkeypatch.setattr(
+        monitor,
+        "extract_house_transactions",
+        lambda _pdf: monitor.house_transactions_from_table(rows[:1]),
+    )
+    assert monitor.scan_house_report(object(), sample_report("h2"), config) is None
+
+    monkeypatch.setattr(monitor, "extract_house_transactions", lambda _pdf: [])
+    fallback = monitor.scan_house_report(object(), sample_report("h3"), config)
+    assert fallback is not None
+    assert fallback.transactions == ()
+
+
+def test_fuzzy_matching_tolerates_ocr_damage_but_not_short_edits() -> None:
+    import scripts.monitor_disclosures as monitor
+
+    keywords = ("UNH", "UnitedHealth")
+    assert monitor.find_fuzzy_keyword_hits("Bought UNI-I common", keywords) == ("UNH",)
+    assert monitor.find_fuzzy_keyword_hits("UnitedHea1th Group", keywords) == ("UnitedHealth",)
+    # Exact hits are reported by find_keyword_hits, not repeated as fuzzy ones.
+    assert monitor.find_fuzzy_keyword_hits("UNH and UnitedHea1th", keywords) == ("UnitedHealth",)
+    # Tickers get no edit budget and keep their token boundaries.
+    assert monitor.find_fuzzy_keyword_hits("UNHX UN UNK", keywords) == ()
+
+
+def test_fuzzy_hits_apply_only_to_ocr_text(tmp_path: Path, monkeypatch) -> None:
+    import dataclasses
+
+    import scripts.monitor_disclosures as monitor
+
+    report = sample_report("h1")
+    config = dataclasses.replace(make_config(tmp_path), fuzzy_ocr_match=True)
+    monkeypatch.setattr(
+        monitor, "extract_report_text", lambda *_: ("Sold UnitedHea1th Group", False)
+    )
+    assert monitor.pdf_text_alert(report, b"%PDF", config) is None
+
+    monkeypatch.setattr(
+        monitor, "extract_report_text", lambda *_: ("Sold UnitedHea1th Group", True)
+    )
+    alert = monitor.pdf_text_alert(report, b"%PDF", config)
+    assert alert is not None
+    assert alert.keywords == ()
+    assert alert.fuzzy_keywords == ("UnitedHealth",)
+    assert "UnitedHea1th" in alert.snippet
+
+    default_config = dataclasses.replace(config, fuzzy_ocr_match=False)
+    assert monitor.pdf_text_alert(report, b"%PDF", default_config) is None
+
+
+def test_ocr_queue_defers_scanned_pdfs_to_the_worker(tmp_path: Path, monkeypatch) -> None:
+    import dataclasses
+
+    import scripts.monitor_disclosures as monitor
+
+    old = sample_report("house:2026:old")
+    scanned = sample_report("house:2026:scanned")
+    state = MonitorState()
+    state.mark_seen("house", old.report_id, "2026-07-21T00:00:00Z")
+    save_state(tmp_path / "state.json", state)
+    monkeypatch.setattr(
+        monitor, "fetch_house_reports", lambda *args, **kwargs: [old, scanned]
+    )
+    monkeypatch.setattr(monitor, "fetch_pdf_bytes", lambda *_: b"%PDF-1.4 scanned")
+    monkeypatch.setattr(monitor, "extract_text_layer", lambda *_: "")
+    config = dataclasses.replace(
+        make_config(tmp_path),
+        ocr_queue_path=tmp_path / "ocr.sqlite3",
+        ocr_max_attempts=2,
+    )
+
+    result = monitor.run_monitor(config, session=object())
+    assert result.queued_counts == {"house": 1}
+    assert result.scanned_counts == {"house": 0}
+    loaded, _ = load_state(tmp_path / "state.json")
+    assert loaded.is_seen("house", scanned.report_id)
+    queue = monitor.OcrQueue(config.ocr_queue_path)
+    assert queue.counts() == {"pending": 1}
+
+    def broken_ocr(*_args, **_kwargs):
+        raise monitor.MonitorError("OCR failed: tesseract crashed")
+
+    monkeypatch.setattr(monitor, "extract_report_text", broken_ocr)
+    stats = monitor.run_ocr_worker(config, queue, max_jobs=1, session=object())
+    assert stats["retried"] == 1
+    assert queue.counts() == {"pending": 1}
+
+    sent = []
+    monkeypatch.setattr(monitor, "extract_report_text", lambda *_: ("Sold UNH stock", True))
+    monkeypatch.setattr(monitor, "send_pushover", lambda _session, alert, _config: sent.append(alert))
+    stats = monitor.run_ocr_worker(config, queue, session=object())
+    assert stats["done"] == 1 and stats["matched"] == 1
+    assert [alert.report_id for alert in sent] == [scanned.report_id]
+    assert sent[0].details == ()
+    assert queue.counts() == {"done": 1}
+    assert queue.claim() is None
+
+
+def test_ocr_queue_gives_up_after_max_attempts(tmp_path: Path, monkeypatch) -> None:
+    import dataclasses
+
+    import scripts.monitor_disclosures as monitor
+
+    config = dataclasses.replace(
+        make_config(tmp_path), ocr_queue_path=tmp_path / "ocr.sqlite3", ocr_max_attempts=2
+    )
+    queue = monitor.OcrQueue(config.ocr_queue_path)
+    queue.enqueue(sample_report("house:2026:bad"), b"%PDF-1.4", "2026-07-21T00:00:00Z")
+    monkeypatch.setattr(
+        monitor,
+        "extract_report_text",
+        lambda *_: (_ for _ in ()).throw(monitor.MonitorError("unreadable")),
+    )
+    stats = monitor.run_ocr_worker(config, queue, session=object())
+    assert stats == {"claimed": 2, "retried": 1, "failed": 1}
+    assert queue.counts() == {"failed": 1}
+
+
+def test_search_index_updates_and_queries_report_text(tmp_path: Path, monkeypatch) -> None:
+    import dataclasses
+
+    import scripts.monitor_disclosures as monitor
+    from scripts.monitor_disclosures import Report
+
+    config = dataclasses.replace(make_config(tmp_path), search_index_path=tmp_path / "search.db")
+    old = Report("house:2024:1", "house", "Alex Example", "03/02/2024", "https://e.invalid/1", "pdf")
+    new = Report("senate:abc", "senate", "Casey Sample", "07/20/2026", "https://e.invalid/2", "html")
+    monitor.index_report_text(config, old, "Purchase of UnitedHealth Group Inc (UNH) stock")
+    monitor.index_report_text(config, new, "Sale of UnitedHealth Group bonds")
+    monitor.index_report_text(config, new, "Sale of UnitedHealth Group Inc shares")
+
+    index = monitor.SearchIndex(config.search_index_path)
+    assert sorted(match["report_id"] for match in index.search("unitedhealth")) == [
+        "house:2024:1",
+        "senate:abc",
+    ]
+    assert [match["report_id"] for match in index.search("bonds")] == []
+    assert [m["report_id"] for m in index.search('"group inc"', since="2025-01-01")] == ["senate:abc"]
+    assert [m["report_id"] for m in index.search("unh", source="house")] == ["house:2024:1"]
+    assert "[UNH]" in index.search("unh")[0]["snippet"]
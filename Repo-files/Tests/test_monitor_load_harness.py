@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from scripts.monitor_load_harness import HarnessOptions, run_load_test
+
+
+def test_load_harness_runs_monitor_end_to_end_with_injected_errors() -> None:
+    report = run_load_test(
+        HarnessOptions(
+            house_reports=12,
+            senate_reports=10,
+            paper_share=0.3,
+            match_rate=0.3,
+            error_rate=0.05,
+            seed=7,
+        )
+    )
+    assert report["success"], report["error"]
+    assert report["reports_visible"] == 22
+    assert report["reports_scanned"] == 22
+    assert report["expected_matches"] > 0
+    assert report["alerts_received"] == report["expected_matches"]
+    assert report["missed_matches"] == []
+    assert report["first_alert_seconds"] is not None
+
+
+def test_load_harness_reports_undelivered_alerts_as_failure() -> None:
+    report = run_load_test(
+        HarnessOptions(
+            house_reports=4,
+            senate_reports=2,
+            match_rate=1.0,
+            pushover_error_rate=1.0,
+        )
+    )
+    assert report["success"] is False
+    assert "NotificationError" in report["error"]
+    assert report["alerts_received"] == 0
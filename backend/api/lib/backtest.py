@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+
+from backend.api.lib.trading_calendar import nyse_calendar
+
+# STOCK Act deadline; used when a trade has no recorded disclosure date
+DISCLOSURE_DEADLINE = pd.Timedelta(days=45)
+
+
+def amount_midpoints(amounts):
+    """Midpoint of each disclosed range ('$15,001 - $50,000' -> 32500.5); a single bound
+    ('Over $50,000,000') counts as itself and anything unparseable as NaN."""
+    amounts = pd.Series(list(amounts), dtype='object')
+    # parse each distinct label once; a whole chamber only has a handful of ranges
+    labels = pd.Series(amounts.dropna().unique(), dtype='object')
+    bounds = labels.astype('string').str.extractall(r'\$\s*([\d,]+)')[0]
+    bounds = pd.to_numeric(bounds.str.replace(',', '', regex=False), errors='coerce').astype('float64').unstack()
+    midpoints = bounds.iloc[:, :2].mean(axis=1).reindex(range(len(labels)))
+    return amounts.map(dict(zip(labels, midpoints))).to_numpy(dtype='float64')
+
+
+def trade_flows(sides, midpoints):
+    """Signed dollar flows: buys add their midpoint, partial sales remove it, and full sales
+    are marked with -inf so the position is closed whatever it had grown to."""
+    sides = pd.Series(list(sides), dtype='object').fillna('').str.lower()
+    sale = sides.str.startswith('sale')
+    partial = sides.str.contains('partial')
+    flows = np.where(sides.str.startswith('purchase'), midpoints, 0.0)
+    flows = np.where(sale & partial, -midpoints, flows)
+    return np.where(sale & ~partial, -np.inf, flows)
+
+
+def mirror_backtest(trades, closes, start=None, end=None):
+    """Backtest a portfolio that mirrors disclosed trades.
+
+    `trades` needs stock_ticker, purchased_or_sold, amount, transaction_date and
+    disclosure_date; `closes` is a date x ticker frame of daily closes. Each disclosed trade
+    changes a per-ticker dollar position by the midpoint of its amount range (never below
+    zero), and on the first session on or after its disclosure date the portfolio is
+    rebalanced to weights proportional to those positions, trading at that close. Between
+    rebalances holdings drift with prices; with no positions the portfolio sits in cash.
+
+    Returns a frame indexed by session with nav (starting at 1), turnover (one-way, as a
+    fraction of NAV), drawdown and positions.
+    """
+    closes = closes.sort_index()
+    closes.index = pd.to_datetime(closes.index).astype('datetime64[ns]')
+    trades = trades.reset_index(drop=True)
+    disclosed = pd.to_datetime(trades['disclosure_date']).astype('datetime64[ns]')
+    disclosed = disclosed.fillna(pd.to_datetime(trades['transaction_date']).astype('datetime64[ns]') + DISCLOSURE_DEADLINE)
+    effective = nyse_calendar().sessions_on_or_after(disclosed).astype('datetime64[ns]')
+    known = ~np.isnat(effective)
+
+    dates = closes.index
+    if start is not None: dates = dates[dates >= pd.Timestamp(start)]
+    elif known.any(): dates = dates[dates >= effective[known].min()]
+    if end is not None: dates = dates[dates <= pd.Timestamp(end)]
+    tickers = closes.columns
+    empty = pd.DataFrame({'nav': [], 'turnover': [], 'drawdown': [], 'positions': []}, index=dates[:0])
+    if len(dates) == 0: return empty
+
+    # prices carried forward so a stale quote still values a holding; no quote yet means untradeable
+    prices = closes.loc[dates].ffill().to_numpy(dtype='float64')
+    rows = np.searchsorted(dates.values, effective, side='left')
+    columns = tickers.get_indexer(trades['stock_ticker'])
+    flows = trade_flows(trades['purchased_or_sold'], amount_midpoints(trades['amount']))
+    usable = known & (rows < len(dates)) & (columns >= 0) & ~np.isnan(flows) & (flows != 0)
+    rows, columns, flows = rows[usable], columns[usable], flows[usable]
+
+    # full sales become a flow larger than everything ever bought in that ticker
+    bought = np.bincount(columns, weights=np.where(flows > 0, flows, 0), minlength=len(tickers))
+    flows = np.where(np.isinf(flows), -(bought[columns] + 1), flows)
+    flow_matrix = np.zeros((len(dates), len(tickers)))
+    np.add.at(flow_matrix, (rows, columns), flows)
+
+    # cumulative flows floored at zero: X_t = S_t - min(0, min_{k<=t} S_k)
+    cumulative = np.cumsum(flow_matrix, axis=0)
+    positions = cumulative - np.minimum(0, np.minimum.accumulate(cumulative, axis=0))
+    positions = np.where(np.isnan(prices), 0, positions)
+
+    # segments start at the first session and at every session with a disclosure
+    rebalance = flow_matrix.any(axis=1)
+    rebalance[0] = True
+    starts = np.flatnonzero(rebalance)
+    totals = positions[starts].sum(axis=1, keepdims=True)
+    weights = np.divide(positions[starts], totals, out=np.zeros_like(positions[starts]), where=totals > 0)
+    cash = 1 - weights.sum(axis=1)
+    start_prices = prices[starts]
+
+    # growth of the weights held coming into each session since their segment began
+    held = np.searchsorted(starts, np.arange(len(dates)) - 1, side='right') - 1
+    held[0] = 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative = np.where(weights[held] > 0, weights[held] * prices / start_prices[held], 0)
+    growth = cash[held] + relative.sum(axis=1)
+    growth[0] = 1.0
+
+    # NAV at each segment start compounds the growth of every earlier segment
+    segment_nav = np.cumprod(np.concatenate([[1.0], growth[starts[1:]]]))
+    nav = segment_nav[held] * growth
+    nav[0] = 1.0
+
+    # one-way turnover at rebalances: drifted weights coming in vs target weights going out
+    drifted = relative[starts] / growth[starts, None]
+    drifted[0] = 0
+    drifted_cash = np.where(np.arange(len(starts)) == 0, 1.0, cash[held[starts]] / growth[starts])
+    turnover = np.zeros(len(dates))
+    turnover[starts] = 0.5 * (np.abs(weights - drifted).sum(axis=1) + np.abs(cash - drifted_cash))
+
+    result = pd.DataFrame({
+        'nav': nav,
+        'turnover': turnover,
+        'drawdown': nav / np.maximum.accumulate(nav) - 1,
+        'positions': (weights > 0).sum(axis=1)[np.searchsorted(starts, np.arange(len(dates)), side='right') - 1],
+    }, index=dates)
+    return result
+
+
+def backtest_summary(result):
+    if result.empty: return {'sessions': 0}
+    years = max((result.index[-1] - result.index[0]).days / 365.25, 1 / 365.25)
+    nav = result['nav']
+    return {
+        'sessions': len(result),
+        'start': result.index[0].date().isoformat(),
+        'end': result.index[-1].date().isoformat(),
+        'total_return': round(float(nav.iloc[-1] - 1) * 100, 2),
+        'annualized_return': round(float(nav.iloc[-1] ** (1 / years) - 1) * 100, 2),
+        'max_drawdown': round(float(result['drawdown'].min()) * 100, 2),
+        'annualized_turnover': round(float(result['turnover'].sum() / years), 2),
+        'rebalances': int((result['turnover'] > 0).sum()),
+    }
@@ -0,0 +1,46 @@
+class BatchWriter:
+    """Buffers rows and hands them to `write` in batches.
+
+    `write` receives a list of rows and is expected to insert them in one transaction,
+    e.g. `add_records_to_house_trades`. Rows are flushed when `batch_size` is reached,
+    on `flush()`, and when the `with` block exits without an error. With `batch_size=None`
+    only `flush()` and the block exit write, so a caller can write one unit (a report) in
+    one transaction and decide what to do if it fails.
+    """
+
+    def __init__(self, write, batch_size=500, width=None):
+        self.write = write
+        self.batch_size = batch_size
+        self.width = width
+        self.records = []
+        self.written = 0
+        self.rejected = 0
+
+    def add(self, record):
+        record = list(record)
+        # One malformed row would otherwise fail the whole multi-row insert.
+        if self.width is not None and len(record) != self.width:
+            print(f'Skipping record with {len(record)} columns, expected {self.width}:', record)
+            self.rejected += 1
+            return
+        self.records.append(record)
+        if self.batch_size is not None and len(self.records) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.records:
+            return 0
+        records, self.records = self.records, []
+        self.write(records)
+        self.written += len(records)
+        return len(records)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.records = []
+        return False
@@ -1,7 +1,11 @@
 import psycopg2
+from psycopg2.extras import execute_values
 from flask import g, current_app
 from settings import DATABASE, SUPA_USER, TEST_DB, HOST, SUPA_PASSWORD, SUPA_CONN_URL, SUPA_KEY
+from settings import DB_POOL_MAX_SIZE, DB_POOL_TIMEOUT, DB_POOL_HEALTH_CHECK_SECONDS
+from settings import EXPORT_MAX_CONCURRENT, EXPORT_QUEUE_TIMEOUT
 from backend.api.lib.orm import build_from_record
+from backend.api.lib.pool import ConnectionPool
 from supabase import create_client
 from supabase.lib.client_options import ClientOptions
 
@@ -11,74 +15,162 @@ cursor = conn.cursor()
 # test_conn = psycopg2.connect(dbname=TEST_DB, user=USER)
 # test_cursor = test_conn.cursor()
 
+# Shared by the ingestion helpers and the API models so each insert or request reuses an
+# open TLS connection instead of paying for a new handshake.
+connection_pool = ConnectionPool(lambda: psycopg2.connect(conn_string),
+                                 max_size=DB_POOL_MAX_SIZE,
+                                 timeout=DB_POOL_TIMEOUT,
+                                 health_check_after=DB_POOL_HEALTH_CHECK_SECONDS)
+
+# Exports hold their connection for the whole download, so they get a separate, smaller pool:
+# a burst of downloads queues for these slots (or times out) instead of starving the API's pool.
+export_pool = ConnectionPool(lambda: psycopg2.connect(conn_string),
+                             max_size=EXPORT_MAX_CONCURRENT,
+                             timeout=EXPORT_QUEUE_TIMEOUT,
+                             health_check_after=DB_POOL_HEALTH_CHECK_SECONDS)
+
+def pooled_connection():
+    return connection_pool.connection()
+
+def pool_metrics():
+    return connection_pool.stats()
+
 def add_record_to_house_trades(record: list):
-    conn = psycopg2.connect(conn_string)
-    cursor = conn.cursor()
     statement = """INSERT INTO house_trades (owner, politician_name, stock_information, purchased_or_sold, transaction_date, report_date, amount)
                             VALUES(%s, %s, %s, %s, %s, %s, %s);"""
     print(statement, record)
-    cursor.execute(statement, record)
-    conn.commit()
-    conn.close()
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(statement, record)
 
 def add_record_to_senate_trades(record: list):
-    conn = psycopg2.connect(conn_string)
-    cursor = conn.cursor()
-    statement = """INSERT INTO senate_trades (politician_name, transaction_date, owner, stock_ticker, asset_name, asset_type, purchased_or_sold, amount, comment)
-                            VALUES(%s, %s, %s, %s, %s, %s, %s, %s, %s);"""
+    statement = """INSERT INTO senate_trades (politician_name, transaction_date, owner, stock_ticker, asset_name, asset_type, purchased_or_sold, amount, comment, report_date)
+                            VALUES(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s);"""
     print(statement, record)
-    cursor.execute(statement, record)
-    conn.commit()
-    conn.close()
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(statement, record)
+
+REPORT_LINK_STATEMENT = """INSERT INTO report_links (link)
+                            VALUES(%s)
+                            ON CONFLICT (link) DO NOTHING;"""
+
+HOUSE_TRADE_COLUMNS = ['owner', 'politician_name', 'stock_information', 'purchased_or_sold', 'transaction_date', 'report_date', 'amount']
+SENATE_TRADE_COLUMNS = ['politician_name', 'transaction_date', 'owner', 'stock_ticker', 'asset_name', 'asset_type', 'purchased_or_sold', 'amount', 'comment', 'report_date']
+
+def insert_records(table: str, columns: list, records: list, page_size: int = 1000, report_link: str = None):
+    # One transaction and one multi-row INSERT per page_size rows instead of a round trip per row.
+    # With report_link, the link is recorded in the same transaction, so a report's rows and the
+    # mark that it was processed commit together or not at all.
+    if not records: return 0
+    statement = f"""INSERT INTO {table} ({', '.join(columns)}) VALUES %s;"""
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        execute_values(cursor, statement, records, page_size=page_size)
+        if report_link is not None:
+            cursor.execute(REPORT_LINK_STATEMENT, (report_link,))
+    print(f'Inserted {len(records)} records into {table}')
+    return len(records)
+
+def add_records_to_house_trades(records: list, report_link: str = None):
+    return insert_records('house_trades', HOUSE_TRADE_COLUMNS, records, report_link=report_link)
+
+def add_records_to_senate_trades(records: list, report_link: str = None):
+    return insert_records('senate_trades', SENATE_TRADE_COLUMNS, records, report_link=report_link)
+
+TRADE_PERFORMANCE_COLUMNS = ['stock_ticker', 'transaction_date', 'transaction_price', 'current_price',
+                             'return_since_transaction', 'return_30d', 'return_90d', 'return_180d']
+
+def run_migration(path):
+    # For idempotent files in migrations/ (CREATE ... IF NOT EXISTS) that a job needs applied.
+    with open(path) as file:
+        statement = file.read()
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(statement)
+
+def replace_trade_performance(records: list, page_size: int = 1000):
+    # Swaps the whole table in one transaction so the API never reads a half-written table.
+    # The table comes from migrations/create_trade_performance_table.sql.
+    statement = f"""INSERT INTO dev.trade_performance ({', '.join(TRADE_PERFORMANCE_COLUMNS)}) VALUES %s;"""
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("""DELETE FROM dev.trade_performance;""")
+        execute_values(cursor, statement, records, page_size=page_size)
+    print(f'Wrote {len(records)} records to dev.trade_performance')
+    return len(records)
+
+def bump_data_version():
+    # Called once the pipeline has rebuilt the dbt models; API response caches key on this.
+    # The table comes from migrations/create_data_version_table.sql.
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("""INSERT INTO data_version (version) VALUES (1)
+                          ON CONFLICT (id) DO UPDATE SET version = data_version.version + 1, updated_at = now()
+                          RETURNING version;""")
+        return cursor.fetchone()[0]
+
+def current_data_version():
+    try:
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""SELECT version FROM data_version;""")
+            row = cursor.fetchone()
+    except psycopg2.errors.UndefinedTable:
+        # the pipeline has not finished a run since this was deployed
+        return 0
+    return row[0] if row else 0
+
+def stream_query(statement: str, params: list, batch_size: int = 2000):
+    # Server-side cursor, so only batch_size rows are in memory at a time. Yields the column
+    # descriptions first, then lists of rows; the connection, taken from export_pool rather than
+    # the API's pool, is held until the generator ends.
+    with export_pool.connection() as conn, conn.cursor(name='stream_query') as cursor:
+        cursor.itersize = batch_size
+        cursor.execute(statement, params)
+        rows = cursor.fetchmany(batch_size)
+        yield cursor.description
+        while rows:
+            yield rows
+            rows = cursor.fetchmany(batch_size)
 
 def add_asset_record(record: list):
-    conn = psycopg2.connect(conn_string)
-    cursor = conn.cursor()
     statement = """INSERT INTO stocks (company_name, asset_type)
                             VALUES(%s, %s);"""
     if not check_asset_existence(record):
         print(statement, record)
-        cursor.execute(statement, record)
-        conn.commit()
-        conn.close()
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute(statement, record)
 
 def add_report_record(record: list):
-    conn = psycopg2.connect(conn_string)
-    cursor = conn.cursor()
-    statement = """INSERT INTO report_links (link)
-                            VALUES(%s);"""
-    cursor.execute(statement, (record,))
-    conn.commit()
-    conn.close()
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(REPORT_LINK_STATEMENT, (record,))
+
+def existing_report_links(links: list):
+    # Which of these links were already processed, in one round trip. Read-only: a link is
+    # recorded in the same transaction as its report's rows (see insert_records).
+    links = list(dict.fromkeys(links))
+    if not links: return set()
+    statement = """SELECT link FROM report_links
+                            WHERE link = ANY(%s);"""
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(statement, (links,))
+        return {row[0] for row in cursor.fetchall()}
 
 def add_congress_image(name, image):
     pass
 
 def check_asset_existence(record: dict):
-    conn = psycopg2.connect(conn_string)
-    cursor = conn.cursor()
     check_statement = """SELECT EXISTS(
                             SELECT 1 FROM stocks
                             WHERE company_name = %s 
                             AND asset_type = %s
                         );"""
-    cursor.execute(check_statement, record)
-    exists = cursor.fetchone()[0]
-    conn.close()
-    return exists
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(check_statement, record)
+        return cursor.fetchone()[0]
 
 def check_report_link_existence(link:str):
-    conn = psycopg2.connect(conn_string)
-    cursor = conn.cursor()
-    
     check_statement = """SELECT EXISTS(
                             SELECT 1 FROM report_links
                             WHERE link = %s
                         );"""
-    cursor.execute(check_statement, (link,))
-    exists = cursor.fetchone()[0]
-    conn.close()
-    return exists
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(check_statement, (link,))
+        return cursor.fetchone()[0]
 
 def drop_all_tables(conn, cursor):
     tables = ['stocks', 'politicians', 'trades']
@@ -0,0 +1,113 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+    'arrow': 'application/vnd.apache.arrow.stream',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+# postgres type OIDs -> arrow type names; anything else is exported as a string
+ARROW_TYPES = {
+    16: 'bool',
+    20: 'int64', 21: 'int64', 23: 'int64',
+    700: 'float64', 701: 'float64', 1700: 'float64',
+    1082: 'date32',
+    1114: 'timestamp', 1184: 'timestamptz',
+}
+
+
+def export_chunks(format, description, batches):
+    """Encoded chunks for `format`, one per batch of rows, so memory stays flat for any row count."""
+    columns = [column.name for column in description]
+    if format == 'ndjson': return ndjson_chunks(columns, batches)
+    if format == 'csv': return csv_chunks(columns, batches)
+    return arrow_chunks(format, description, batches)
+
+
+def json_value(value):
+    if isinstance(value, (date, datetime)): return value.isoformat()
+    if isinstance(value, Decimal): return float(value)
+    return str(value)
+
+
+def ndjson_chunks(columns, batches):
+    for rows in batches:
+        yield ''.join(json.dumps(dict(zip(columns, row)), default=json_value) + '\n' for row in rows).encode()
+
+
+def csv_chunks(columns, batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class ChunkSink(io.RawIOBase):
+    """Write-only file that hands back whatever has been written since the last drain."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data, self._chunks = b''.join(self._chunks), []
+        return data
+
+
+def arrow_schema(pa, description):
+    types = {
+        'bool': pa.bool_(), 'int64': pa.int64(), 'float64': pa.float64(), 'date32': pa.date32(),
+        'timestamp': pa.timestamp('us'), 'timestamptz': pa.timestamp('us', tz='UTC'),
+    }
+    return pa.schema([(column.name, types.get(ARROW_TYPES.get(column.type_code), pa.string()))
+                      for column in description])
+
+
+def arrow_value(value, kind):
+    if value is None: return None
+    if kind == 'float64': return float(value)
+    if kind == 'string' and not isinstance(value, str): return json_value(value)
+    return value
+
+
+def arrow_chunks(format, description, batches):
+    """Arrow IPC stream or Parquet, one record batch (row group for Parquet) per batch of rows."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = arrow_schema(pa, description)
+    kinds = [ARROW_TYPES.get(column.type_code, 'string') for column in description]
+    sink = ChunkSink()
+    writer = pa.ipc.new_stream(sink, schema) if format == 'arrow' else pq.ParquetWriter(sink, schema)
+    try:
+        for rows in batches:
+            arrays = [pa.array([arrow_value(row[i], kind) for row in rows], type=field.type)
+                      for i, (kind, field) in enumerate(zip(kinds, schema))]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
@@ -0,0 +1,45 @@
+import base64
+import json
+from datetime import date
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+class InvalidQuery(ValueError):
+    pass
+
+
+def page_size(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    # Missing means the default; anything above the cap is clamped rather than rejected.
+    if value in (None, ''): return default
+    try:
+        size = int(value)
+    except ValueError:
+        raise InvalidQuery(f'invalid limit: {value!r}')
+    if size < 1:
+        raise InvalidQuery(f'invalid limit: {value!r}')
+    return min(size, maximum)
+
+
+def parse_date(value, name):
+    if value in (None, ''): return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise InvalidQuery(f'invalid {name}: {value!r}, expected YYYY-MM-DD')
+
+
+def encode_cursor(transaction_date, id):
+    """Opaque cursor for the (transaction_date, id) of the last row on a page."""
+    payload = json.dumps([transaction_date.isoformat(), id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    if not cursor: return None
+    try:
+        transaction_date, id = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        return date.fromisoformat(transaction_date), id
+    except (ValueError, TypeError):
+        raise InvalidQuery(f'invalid cursor: {cursor!r}')
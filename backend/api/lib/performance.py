@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+from backend.api.lib.trading_calendar import nyse_calendar
+
+FORWARD_WINDOWS = (30, 90, 180)
+PERFORMANCE_COLUMNS = ['stock_ticker', 'transaction_date', 'transaction_price', 'current_price',
+                       'return_since_transaction'] + [f'return_{days}d' for days in FORWARD_WINDOWS]
+
+# a session with no bar (halt, missing data) falls through to the next close, but not one further out than this
+MAX_PRICE_GAP = pd.Timedelta(days=7)
+
+
+def price_symbol(ticker):
+    # Yahoo uses '-' for share classes (BRK.B -> BRK-B)
+    return ticker.replace('.', '-')
+
+
+def long_closes(closes):
+    """(stock_ticker, date, close) rows sorted by date, from a date x ticker frame of closes."""
+    prices = closes.rename_axis(index='date', columns='stock_ticker').stack().rename('close').reset_index()
+    prices['date'] = pd.to_datetime(prices['date']).astype('datetime64[ns]')
+    return prices.dropna(subset=['close']).sort_values('date', kind='stable')
+
+
+def price_on_or_after(trades, prices, date_column):
+    """The first close on or after each trade's `date_column`, matched per ticker in one pass."""
+    ordered = trades[['stock_ticker', date_column]].reset_index().sort_values(date_column, kind='stable')
+    matched = pd.merge_asof(ordered, prices, left_on=date_column, right_on='date', by='stock_ticker',
+                            direction='forward', tolerance=MAX_PRICE_GAP)
+    return matched.set_index('index')['close'].reindex(trades.index)
+
+
+def percent_change(current, start):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return ((current - start) / start * 100).round(2)
+
+
+def trade_performance(trades, closes):
+    """Return since the transaction date and 30/90/180-day forward returns for every trade.
+
+    `trades` needs `stock_ticker` and `transaction_date`; `closes` is a date x ticker frame of
+    daily closes. Each distinct (ticker, date) pair gets one row. Forward windows that have not
+    elapsed yet, and tickers without prices, are left as NaN.
+    """
+    trades = trades[['stock_ticker', 'transaction_date']].dropna().drop_duplicates().reset_index(drop=True)
+    trades['transaction_date'] = pd.to_datetime(trades['transaction_date']).astype('datetime64[ns]')
+    prices = long_closes(closes)
+
+    # price each trade at its effective session, and each window at the first session after it
+    calendar = nyse_calendar()
+    trades['session'] = calendar.sessions_on_or_after(trades['transaction_date']).astype('datetime64[ns]')
+
+    result = trades.copy()
+    result['transaction_price'] = price_on_or_after(trades, prices, 'session')
+    latest = prices.groupby('stock_ticker')['close'].last()
+    result['current_price'] = trades['stock_ticker'].map(latest)
+    result['return_since_transaction'] = percent_change(result['current_price'], result['transaction_price'])
+
+    for days in FORWARD_WINDOWS:
+        target = calendar.sessions_on_or_after(trades['transaction_date'] + pd.Timedelta(days=days))
+        shifted = trades.assign(target_session=target.astype('datetime64[ns]'))
+        forward_price = price_on_or_after(shifted, prices, 'target_session')
+        result[f'return_{days}d'] = percent_change(forward_price, result['transaction_price'])
+
+    result['transaction_date'] = result['transaction_date'].dt.date
+    return result[PERFORMANCE_COLUMNS]
@@ -0,0 +1,156 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """Thread-safe pool of DB-API connections created by `connect`.
+
+    Connections are opened lazily up to `max_size`; callers beyond that wait up to
+    `timeout` seconds for one to be returned. A connection that has been idle longer
+    than `health_check_after` seconds is pinged before it is handed out, and closed or
+    failed connections are replaced instead of being reused.
+    """
+
+    def __init__(self, connect, max_size=10, timeout=30.0, health_check_after=30.0):
+        if max_size < 1:
+            raise ValueError(f'invalid pool size: max_size={max_size}')
+        self.connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_after = health_check_after
+        self._idle = []  # (connection, returned_at) pairs, most recently returned last
+        self._open = 0
+        self._in_use = 0
+        self._condition = threading.Condition()
+        self._metrics = dict.fromkeys(
+            ['checkouts', 'waits', 'timeouts', 'opened', 'discarded', 'health_check_failures'], 0)
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._peak_in_use = 0
+
+    def getconn(self):
+        started = time.monotonic()
+        waited = False
+        with self._condition:
+            while not self._idle and self._open >= self.max_size:
+                waited = True
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    self._record_wait(time.monotonic() - started)
+                    self._metrics['timeouts'] += 1
+                    raise PoolTimeout(f'no database connection available after {self.timeout}s '
+                                      f'({self.max_size} in use)')
+                self._condition.wait(remaining)
+            idle = self._idle.pop() if self._idle else None
+            if idle is None:
+                # Reserve the slot now; the connection is opened outside the lock.
+                self._open += 1
+                self._metrics['opened'] += 1
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            self._metrics['checkouts'] += 1
+            if waited:
+                self._record_wait(time.monotonic() - started)
+
+        try:
+            if idle is not None:
+                conn, returned_at = idle
+                if self._healthy(conn, time.monotonic() - returned_at):
+                    return conn
+                self._close_quietly(conn)
+                with self._condition:
+                    self._metrics['discarded'] += 1
+                    self._metrics['opened'] += 1
+            return self.connect()
+        except Exception:
+            with self._condition:
+                self._open -= 1
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+    def putconn(self, conn, discard=False):
+        broken = discard or getattr(conn, 'closed', False)
+        if broken:
+            self._close_quietly(conn)
+        with self._condition:
+            self._in_use -= 1
+            if broken:
+                self._open -= 1
+                self._metrics['discarded'] += 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection; commit on success, roll back on error, then return it."""
+        conn = self.getconn()
+        discard = False
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            # includes GeneratorExit from a streaming response the client abandoned
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+            raise
+        finally:
+            self.putconn(conn, discard=discard)
+
+    def closeall(self):
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self):
+        with self._condition:
+            return {
+                'max_size': self.max_size,
+                'open': self._open,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'peak_in_use': self._peak_in_use,
+                'utilization': round(self._in_use / self.max_size, 3),
+                'total_wait_seconds': round(self._wait_seconds, 3),
+                'max_wait_seconds': round(self._max_wait_seconds, 3),
+                **self._metrics,
+            }
+
+    def _record_wait(self, seconds):
+        self._metrics['waits'] += 1
+        self._wait_seconds += seconds
+        self._max_wait_seconds = max(self._max_wait_seconds, seconds)
+
+    def _healthy(self, conn, idle_seconds):
+        if getattr(conn, 'closed', False):
+            return False
+        if idle_seconds < self.health_check_after:
+            return True
+        try:
+            cursor = conn.cursor()
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+            cursor.close()
+            conn.rollback()
+            return True
+        except Exception:
+            with self._condition:
+                self._metrics['health_check_failures'] += 1
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
@@ -0,0 +1,178 @@
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    ticker TEXT NOT NULL,
+    date TEXT NOT NULL,
+    open REAL, high REAL, low REAL, close REAL, adj_close REAL, volume REAL,
+    PRIMARY KEY (ticker, date)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    ticker TEXT PRIMARY KEY,
+    covered_from TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def yfinance_download(tickers, start, end):
+    # one symbol, or a list for a grouped download with (field, ticker) columns
+    import yfinance as yf
+    return yf.download(tickers, start=start, end=end, progress=False, auto_adjust=False, group_by='column')
+
+
+def normalize_bars(data):
+    """Daily bars indexed by date with PRICE_COLUMNS, whatever shape the downloader returned."""
+    if data is None or data.empty:
+        return pd.DataFrame(columns=PRICE_COLUMNS, index=pd.DatetimeIndex([], name='Date'), dtype=float)
+    if isinstance(data.columns, pd.MultiIndex):
+        # Newer yfinance returns (field, ticker) columns even for a single ticker.
+        data = data.droplevel(-1, axis=1)
+    data = data.reindex(columns=PRICE_COLUMNS)
+    data.index = pd.DatetimeIndex(pd.to_datetime(data.index).date, name='Date')
+    return data[~data.index.duplicated(keep='last')].sort_index().astype(float)
+
+
+def split_bars(data, tickers):
+    """Per-ticker bars from a single-ticker frame or a grouped (field, ticker) download."""
+    if len(tickers) == 1:
+        return {tickers[0]: normalize_bars(data)}
+    if data is None or data.empty or not isinstance(data.columns, pd.MultiIndex):
+        return {ticker: normalize_bars(None) for ticker in tickers}
+    downloaded = set(data.columns.get_level_values(-1))
+    return {ticker: normalize_bars(data.xs(ticker, axis=1, level=-1) if ticker in downloaded else None)
+            for ticker in tickers}
+
+
+class PriceCache:
+    """Read-through cache of daily bars in SQLite with an in-memory copy per ticker.
+
+    Bars before today never change, so only the range after the last cached bar is
+    downloaded, and only once `ttl_seconds` have passed since the previous download.
+    Requests for an earlier start date download just the missing leading range.
+    """
+
+    def __init__(self, path, downloader=yfinance_download, ttl_seconds=900, clock=time.time, today=date.today):
+        self.path = Path(path)
+        self.downloader = downloader
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.today = today
+        self._memory = {}
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+        self._downloads = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path)) as conn:
+            conn.executescript(SCHEMA)
+
+    def history(self, ticker, start):
+        """Daily bars for `ticker` from `start` (a date or 'YYYY-MM-DD') through today."""
+        return self.history_many([ticker], start)[ticker]
+
+    def history_many(self, tickers, start):
+        """Bars for several tickers, with one grouped download per distinct missing range."""
+        start = _as_date(start)
+        tickers = sorted(set(tickers))
+        # always taken in sorted order so concurrent batches cannot deadlock
+        locks = [self._ticker_lock(ticker) for ticker in tickers]
+        for lock in locks: lock.acquire()
+        try:
+            groups = {}
+            for ticker in tickers:
+                for window in self._missing_ranges(ticker, start):
+                    groups.setdefault(window, []).append(ticker)
+            for (fetch_start, fetch_end, keep_fetched_at), group in groups.items():
+                self._fetch(group, fetch_start, fetch_end, keep_fetched_at)
+            histories = {ticker: self._bars(ticker) for ticker in tickers}
+        finally:
+            for lock in reversed(locks): lock.release()
+        return {ticker: bars[bars.index >= pd.Timestamp(start)] for ticker, bars in histories.items()}
+
+    def invalidate(self, ticker=None):
+        with self._locks_lock:
+            if ticker is None:
+                self._memory.clear()
+            else:
+                self._memory.pop(ticker, None)
+
+    def stats(self):
+        with self._locks_lock:
+            return {'downloads': self._downloads, 'tickers_in_memory': len(self._memory)}
+
+    def _ticker_lock(self, ticker):
+        with self._locks_lock:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _coverage(self, ticker):
+        with closing(self._connect()) as conn:
+            row = conn.execute('SELECT covered_from, fetched_at FROM coverage WHERE ticker = ?', (ticker,)).fetchone()
+        if row is None: return None
+        return date.fromisoformat(row[0]), row[1]
+
+    def _last_bar_date(self, ticker):
+        with closing(self._connect()) as conn:
+            (last,) = conn.execute('SELECT MAX(date) FROM bars WHERE ticker = ?', (ticker,)).fetchone()
+        return date.fromisoformat(last) if last else None
+
+    def _missing_ranges(self, ticker, start):
+        # (start, end, keep_fetched_at) windows to download before `ticker` can be served from `start`
+        coverage = self._coverage(ticker)
+        if coverage is None:
+            return [(start, self.today(), False)]
+        covered_from, fetched_at = coverage
+        ranges = []
+        if start < covered_from:
+            ranges.append((start, covered_from - timedelta(days=1), True))
+        if self.clock() - fetched_at >= self.ttl_seconds:
+            # Re-read the last cached bar too: it may have been today's partial bar.
+            ranges.append((self._last_bar_date(ticker) or covered_from, self.today(), False))
+        return ranges
+
+    def _fetch(self, tickers, start, end, keep_fetched_at=False):
+        with self._locks_lock:
+            self._downloads += 1
+        # The downloader's end date is exclusive.
+        data = self.downloader(tickers[0] if len(tickers) == 1 else tickers, start.isoformat(),
+                               (end + timedelta(days=1)).isoformat())
+        with closing(self._connect()) as conn, conn:
+            for ticker, bars in split_bars(data, tickers).items():
+                rows = [(ticker, index.date().isoformat(), *[None if pd.isna(v) else float(v) for v in values])
+                        for index, values in zip(bars.index, bars[PRICE_COLUMNS].itertuples(index=False))]
+                conn.executemany('INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+                previous = conn.execute('SELECT covered_from, fetched_at FROM coverage WHERE ticker = ?', (ticker,)).fetchone()
+                covered_from = min(start.isoformat(), previous[0]) if previous else start.isoformat()
+                fetched_at = previous[1] if previous and keep_fetched_at else self.clock()
+                conn.execute('INSERT OR REPLACE INTO coverage VALUES (?, ?, ?)', (ticker, covered_from, fetched_at))
+        for ticker in tickers: self.invalidate(ticker)
+
+    def _bars(self, ticker):
+        cached = self._memory.get(ticker)
+        if cached is not None:
+            return cached
+        with closing(self._connect()) as conn:
+            rows = conn.execute('SELECT date, open, high, low, close, adj_close, volume FROM bars '
+                                'WHERE ticker = ? ORDER BY date', (ticker,)).fetchall()
+        bars = pd.DataFrame([row[1:] for row in rows], columns=PRICE_COLUMNS,
+                            index=pd.DatetimeIndex([row[0] for row in rows], name='Date'), dtype=float)
+        with self._locks_lock:
+            self._memory[ticker] = bars
+        return bars
+
+
+def _as_date(value):
+    if isinstance(value, datetime): return value.date()
+    if isinstance(value, date): return value
+    return date.fromisoformat(str(value))
@@ -0,0 +1,148 @@
+import csv
+import json
+import os
+import threading
+from collections import namedtuple
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import quote
+
+import numpy as np
+
+from backend.api.lib.price_cache import PRICE_COLUMNS, split_bars, yfinance_download
+
+FIELDS = ['open', 'high', 'low', 'close', 'adj_close', 'volume']
+DEFAULT_START = date(2010, 1, 1)
+
+Bars = namedtuple('Bars', ['dates'] + FIELDS)
+
+
+def build_directory(csv_path):
+    """{symbol: name} from a Symbol,Name listing such as migrations/combined_stocks.csv."""
+    directory = {}
+    with open(csv_path, newline='', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            symbol = (row.get('Symbol') or '').strip()
+            if symbol and symbol not in directory:
+                directory[symbol] = (row.get('Name') or '').strip()
+    return directory
+
+
+class PriceWarehouse:
+    """Daily bars on disk, one memory-mapped .npy file per ticker.
+
+    Each file holds an int64 array of shape (7, n): row 0 is the session date as
+    datetime64[D], rows 1-6 are FIELDS stored as float64 bit patterns. Every column is
+    contiguous, and reads return views into the mapping, so a date-range slice or a
+    cross-ticker scan copies nothing until it is used. Mappings are reused only while the
+    file is unchanged, so a long-lived reader picks up another process's updates.
+    """
+
+    def __init__(self, root, downloader=yfinance_download, today=date.today):
+        self.root = Path(root)
+        self.downloader = downloader
+        self.today = today
+        self._maps = {}
+        self._lock = threading.Lock()
+        (self.root / 'bars').mkdir(parents=True, exist_ok=True)
+
+    # symbol directory
+
+    def write_directory(self, directory):
+        self._write_atomic(self.root / 'symbols.json', lambda file: file.write(json.dumps(directory, indent=0).encode()))
+
+    def directory(self):
+        path = self.root / 'symbols.json'
+        return json.loads(path.read_text()) if path.exists() else {}
+
+    # reads
+
+    def bars(self, symbol, start=None, end=None):
+        """Bars for `symbol` with start <= date <= end, as zero-copy views; None when not stored."""
+        data = self._map(symbol)
+        if data is None: return None
+        dates = data[0].view('datetime64[D]')
+        lo = 0 if start is None else np.searchsorted(dates, np.datetime64(start, 'D'), side='left')
+        hi = len(dates) if end is None else np.searchsorted(dates, np.datetime64(end, 'D'), side='right')
+        return Bars(dates[lo:hi], *(data[row, lo:hi].view('float64') for row in range(1, len(FIELDS) + 1)))
+
+    def panel(self, symbols, field='close', start=None, end=None):
+        """(dates, matrix) with one column per symbol aligned on the union of their dates; NaN where missing."""
+        slices = {symbol: self.bars(symbol, start, end) for symbol in symbols}
+        present = [bars for bars in slices.values() if bars is not None and len(bars.dates)]
+        dates = np.unique(np.concatenate([bars.dates for bars in present])) if present else np.array([], 'datetime64[D]')
+        matrix = np.full((len(dates), len(symbols)), np.nan)
+        for column, bars in enumerate(slices.values()):
+            if bars is not None and len(bars.dates):
+                matrix[np.searchsorted(dates, bars.dates), column] = getattr(bars, field)
+        return dates, matrix
+
+    def last_date(self, symbol):
+        data = self._map(symbol)
+        if data is None or data.shape[1] == 0: return None
+        return data[0, -1].astype('datetime64[D]').item()
+
+    # updates
+
+    def update(self, symbols=None, batch_size=100, start=DEFAULT_START):
+        """Download bars after each symbol's last stored date (re-reading that date, which may
+        have been a partial bar) and append them; returns {symbol: rows written}."""
+        symbols = list(symbols if symbols is not None else self.directory())
+        end = self.today()
+        written = {}
+        for offset in range(0, len(symbols), batch_size):
+            groups = {}
+            for symbol in symbols[offset:offset + batch_size]:
+                groups.setdefault(self.last_date(symbol) or start, []).append(symbol)
+            for fetch_start, group in groups.items():
+                if fetch_start > end: continue
+                data = self.downloader(group[0] if len(group) == 1 else group, fetch_start.isoformat(),
+                                       (end + timedelta(days=1)).isoformat())
+                for symbol, frame in split_bars(data, group).items():
+                    written[symbol] = self._append(symbol, frame)
+        return written
+
+    def _append(self, symbol, frame):
+        frame = frame.dropna(subset=['Close'])
+        if frame.empty: return 0
+        new = np.empty((len(FIELDS) + 1, len(frame)), dtype='int64')
+        new[0] = frame.index.values.astype('datetime64[D]').view('int64')
+        new[1:] = np.ascontiguousarray(frame[PRICE_COLUMNS].to_numpy(dtype='float64').T).view('int64')
+        existing = self._map(symbol)
+        if existing is not None:
+            # keep stored bars before the first downloaded date; the download replaces the rest
+            keep = np.searchsorted(existing[0], new[0, 0], side='left')
+            new = np.concatenate([existing[:, :keep], new], axis=1)
+        self._write_atomic(self._path(symbol), lambda file: np.save(file, new, allow_pickle=False))
+        with self._lock:
+            self._maps.pop(symbol, None)
+        return len(frame)
+
+    def _map(self, symbol):
+        path = self._path(symbol)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # not cached, so a symbol written later by another process is found
+            with self._lock:
+                self._maps.pop(symbol, None)
+            return None
+        # updates replace the file, so a new inode or mtime means the mapping is stale
+        version = (stat.st_mtime_ns, stat.st_ino)
+        with self._lock:
+            cached = self._maps.get(symbol)
+        if cached is not None and cached[0] == version: return cached[1]
+        data = np.load(path, mmap_mode='r', allow_pickle=False)
+        with self._lock:
+            self._maps[symbol] = (version, data)
+        return data
+
+    def _path(self, symbol):
+        return self.root / 'bars' / f"{quote(symbol, safe='-.^=')}.npy"
+
+    def _write_atomic(self, path, write):
+        # readers holding the old mapping keep a valid file; new readers see the whole new one
+        temporary = path.with_name(path.name + '.tmp')
+        with open(temporary, 'wb') as file:
+            write(file)
+        os.replace(temporary, path)
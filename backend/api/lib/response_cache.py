@@ -0,0 +1,113 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import make_response, request
+
+# headers worth replaying from a cached response; everything else is rebuilt by Flask
+CACHED_HEADERS = ['Content-Type', 'X-Next-Cursor']
+
+
+class DataVersion:
+    """The pipeline's data-version stamp, re-read at most every `check_every` seconds."""
+
+    def __init__(self, read, check_every=30.0, clock=time.monotonic):
+        self.read = read
+        self.check_every = check_every
+        self.clock = clock
+        self._version = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            now = self.clock()
+            if self._checked_at is None or now - self._checked_at >= self.check_every:
+                self._version = self.read()
+                self._checked_at = now
+            return self._version
+
+
+class ResponseCache:
+    """LRU cache of successful responses keyed by data version, path and query arguments.
+
+    A new data version makes every older entry unreachable, so nothing has to be purged when
+    the pipeline runs; stale entries simply age out of the LRU. Responses carry a strong ETag
+    of their body, so clients revalidating with If-None-Match get a 304.
+    """
+
+    def __init__(self, version, max_entries=1024, clock=time.monotonic):
+        self.version = version
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics = dict.fromkeys(['hits', 'misses', 'not_modified', 'expired', 'evicted'], 0)
+
+    def cached(self, ttl=None):
+        """Decorator for Flask views; `ttl` bounds entries whose data also ages within a version."""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                key = (self.version(), request.path, tuple(sorted(request.args.items(multi=True))))
+                entry = self._get(key, ttl)
+                if entry is None:
+                    response = make_response(view(*args, **kwargs))
+                    if response.status_code != 200 or response.direct_passthrough:
+                        return response
+                    body = response.get_data()
+                    entry = (body, hashlib.sha256(body).hexdigest()[:32],
+                             {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers},
+                             self.clock())
+                    self._put(key, entry)
+                    state = 'miss'
+                else:
+                    state = 'hit'
+                body, etag, headers, _ = entry
+                response = make_response(body, 200, headers)
+                response.set_etag(etag)
+                # clients must revalidate, which is cheap: a 304 unless the data version moved
+                response.headers['Cache-Control'] = 'no-cache'
+                response.headers['X-Cache'] = state
+                response = response.make_conditional(request)
+                if response.status_code == 304:
+                    self._count('not_modified')
+                return response
+            return wrapper
+        return decorator
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'max_entries': self.max_entries, **self._metrics}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key, ttl):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and ttl is not None and self.clock() - entry[3] >= ttl:
+                del self._entries[key]
+                self._metrics['expired'] += 1
+                entry = None
+            if entry is None:
+                self._metrics['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._metrics['hits'] += 1
+            return entry
+
+    def _put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._metrics['evicted'] += 1
+
+    def _count(self, name):
+        with self._lock:
+            self._metrics[name] += 1
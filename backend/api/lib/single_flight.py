@@ -0,0 +1,59 @@
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers with the same key wait for
+    it and share its result or exception instead of issuing their own.
+
+    Nothing is remembered once a call finishes, so this only collapses overlapping work;
+    caching across time is the caller's job.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._metrics = dict.fromkeys(['issued', 'coalesced', 'errors'], 0)
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._metrics['issued'] += 1
+            else:
+                self._metrics['coalesced'] += 1
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = fn(*args, **kwargs)
+            except BaseException as error:
+                call.error = error
+                with self._lock:
+                    self._metrics['errors'] += 1
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self):
+        with self._lock:
+            issued, coalesced = self._metrics['issued'], self._metrics['coalesced']
+            return {
+                'in_flight': len(self._calls),
+                'coalesced_ratio': round(coalesced / (issued + coalesced), 3) if issued + coalesced else 0.0,
+                **self._metrics,
+            }
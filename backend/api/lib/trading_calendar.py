@@ -0,0 +1,136 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from functools import lru_cache
+
+import numpy as np
+
+FIRST_YEAR = 1990
+
+# one-off NYSE closures that no holiday rule produces
+SPECIAL_CLOSURES = {
+    date(1994, 4, 27),   # Nixon funeral
+    date(2001, 9, 11), date(2001, 9, 12), date(2001, 9, 13), date(2001, 9, 14),
+    date(2004, 6, 11),   # Reagan funeral
+    date(2007, 1, 2),    # Ford funeral
+    date(2012, 10, 29), date(2012, 10, 30),   # Hurricane Sandy
+    date(2018, 12, 5),   # G.H.W. Bush funeral
+    date(2025, 1, 9),    # Carter funeral
+}
+
+
+def easter(year):
+    # Anonymous Gregorian algorithm
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def nth_weekday(year, month, weekday, n):
+    # n-th (1-based) weekday of the month, or the last one when n is -1
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def observed(day):
+    # Saturday holidays close the Friday before, Sunday holidays the Monday after
+    if day.weekday() == 5: return day - timedelta(days=1)
+    if day.weekday() == 6: return day + timedelta(days=1)
+    return day
+
+
+def nyse_holidays(year):
+    holidays = {
+        nth_weekday(year, 2, 0, 3),   # Washington's Birthday
+        easter(year) - timedelta(days=2),   # Good Friday
+        nth_weekday(year, 5, 0, -1),  # Memorial Day
+        observed(date(year, 7, 4)),
+        nth_weekday(year, 9, 0, 1),   # Labor Day
+        nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        observed(date(year, 12, 25)),
+    }
+    # New Year's Day on a Saturday is not observed on the Friday before
+    if date(year, 1, 1).weekday() != 5:
+        holidays.add(observed(date(year, 1, 1)))
+    if year >= 1998: holidays.add(nth_weekday(year, 1, 0, 3))   # Martin Luther King Jr. Day
+    if year >= 2022: holidays.add(observed(date(year, 6, 19)))  # Juneteenth
+    return holidays
+
+
+class TradingCalendar:
+    """Sorted exchange session dates with O(log n) nearest-session lookups."""
+
+    def __init__(self, sessions):
+        self.sessions = sorted(sessions)
+        self._array = np.array(self.sessions, dtype='datetime64[D]')
+
+    @classmethod
+    def nyse(cls, first_year, last_year):
+        holidays = set().union(*(nyse_holidays(year) for year in range(first_year, last_year + 1)))
+        day, last = date(first_year, 1, 1), date(last_year, 12, 31)
+        sessions = []
+        while day <= last:
+            if day.weekday() < 5 and day not in holidays and day not in SPECIAL_CLOSURES:
+                sessions.append(day)
+            day += timedelta(days=1)
+        return cls(sessions)
+
+    def is_session(self, day):
+        index = bisect_left(self.sessions, day)
+        return index < len(self.sessions) and self.sessions[index] == day
+
+    def session_on_or_after(self, day):
+        """The session a trade on `day` is priced at: `day` itself, or the next open day."""
+        index = bisect_left(self.sessions, day)
+        if index == len(self.sessions):
+            raise LookupError(f'{day} is after the last session in the calendar')
+        return self.sessions[index]
+
+    def session_on_or_before(self, day):
+        """The latest session that has opened by `day`."""
+        index = bisect_right(self.sessions, day)
+        if index == 0:
+            raise LookupError(f'{day} is before the first session in the calendar')
+        return self.sessions[index - 1]
+
+    def sessions_on_or_after(self, days):
+        """Vectorized session_on_or_after for an array of dates; NaT past the end of the calendar."""
+        days = np.asarray(days, dtype='datetime64[D]')
+        index = np.searchsorted(self._array, days, side='left')
+        resolved = self._array[np.minimum(index, len(self._array) - 1)]
+        return np.where((index < len(self._array)) & ~np.isnat(days), resolved, np.datetime64('NaT'))
+
+
+def nyse_calendar():
+    """NYSE sessions from FIRST_YEAR through the end of next year, rebuilt when the year turns."""
+    return _nyse_calendar(date.today().year)
+
+
+@lru_cache(maxsize=1)
+def _nyse_calendar(year):
+    return TradingCalendar.nyse(FIRST_YEAR, year + 1)
+
+
+def close_on_or_after(bars, day):
+    """(date, close) of the first bar on or after `day`, found by binary search on the index."""
+    index = bars.index.searchsorted(np.datetime64(day, 'D'), side='left')
+    if index == len(bars):
+        raise LookupError(f'no close on or after {day}')
+    return bars.index[index].date(), bars['Close'].iloc[index]
+
+
+def close_on_or_before(bars, day):
+    """(date, close) of the latest bar on or before `day`."""
+    index = bars.index.searchsorted(np.datetime64(day, 'D'), side='right')
+    if index == 0:
+        raise LookupError(f'no close on or before {day}')
+    return bars.index[index - 1].date(), bars['Close'].iloc[index - 1]
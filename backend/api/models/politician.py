@@ -2,8 +2,7 @@ import backend.api.models as models
 from backend.api.lib.orm import build_from_record, build_from_records
 from backend.api import db
 from sqlalchemy.orm import relationship
-from backend.api.lib.db import create_supabase_connection, conn_string
-import psycopg2
+from backend.api.lib.db import create_supabase_connection, pooled_connection
 
 class Politician(db.Model):
     __tablename__ = 'public.politicians'
@@ -39,10 +38,16 @@ class Politician(db.Model):
 
     @classmethod
     def politician(cls, id):
-        conn = psycopg2.connect(conn_string)
-        cursor = conn.cursor()
-        cursor.execute(f"select * from dev.stg_politicians where id = {int(id)}")
-        record = cursor.fetchone()
-        conn.close()
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("select * from dev.stg_politicians where id = %s", (int(id),))
+            record = cursor.fetchone()
 
-        return record
\ No newline at end of file
+        return record
+
+    @classmethod
+    def politicians(cls, ids):
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("select * from dev.stg_politicians where id = any(%s)", ([int(id) for id in ids],))
+            records = cursor.fetchall()
+
+        return {record[0]: record for record in records}
\ No newline at end of file
@@ -2,12 +2,18 @@ import backend.api.models as models
 from backend.api.lib.orm import build_from_record, build_from_records
 import backend.api.models as models
 from backend.api import db
-from backend.api.lib.db import conn_string
+from backend.api.lib.db import pooled_connection
 from sqlalchemy.orm import relationship
-import yfinance as yf
-from datetime import datetime, timedelta
+from backend.api.lib.price_cache import PriceCache
+from backend.api.lib.single_flight import SingleFlight
+from settings import PRICE_CACHE_PATH, PRICE_CACHE_TTL_SECONDS
+from backend.api.lib.trading_calendar import nyse_calendar, close_on_or_after, close_on_or_before
+from datetime import date, datetime, timedelta
 import pandas as pd
-import psycopg2
+
+price_cache = PriceCache(PRICE_CACHE_PATH, ttl_seconds=PRICE_CACHE_TTL_SECONDS)
+# concurrent /stock-info requests for the same trade share one cache read or download
+history_flights = SingleFlight()
 
 class Stock(db.Model):
     __tablename__ = 'stocks'
@@ -23,10 +29,9 @@ class Stock(db.Model):
 
     @classmethod
     def find_by_stock_marker(cls, marker: str):
-        conn = psycopg2.connect(conn_string)
-        cursor = conn.cursor()
-        cursor.execute("""select * from dev.stg_stocks where stock_marker = %s;""", (marker,))
-        stock = cursor.fetchone()
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""select * from dev.stg_stocks where stock_marker = %s;""", (marker,))
+            stock = cursor.fetchone()
         return stock
     
     @classmethod
@@ -36,34 +41,76 @@ class Stock(db.Model):
         return build_from_records(Stock, records)
     
     @classmethod
-    def find_stock_history(cls, name:str, start_date:str, end_date:str=None):
-        decoded_date = '-'.join(start_date.split('%2F'))
+    def find_by_stock_markers(cls, markers: list):
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""select * from dev.stg_stocks where stock_marker = any(%s);""", (list(markers),))
+            records = cursor.fetchall()
+        # stock_marker is the second column of stg_stocks
+        return {record[1]: record for record in records}
+
+# price symbol, the trade's effective session, and the first/last days to chart for a /stock-info request
+    @classmethod
+    def history_window(cls, name:str, start_date:str):
+        decoded_date = start_date.replace('%2F', '-').replace('/', '-')
         month, day, year = decoded_date.split('-')
         if '.' in name: name = name.replace('.', '-')
-        transaction_date = datetime.strptime(f'{year}-{month}-{day}', '%Y-%m-%d')
+        calendar = nyse_calendar()
+        # weekends and market holidays resolve to the next session; today to the latest session
+        transaction_session = calendar.session_on_or_after(date(int(year), int(month), int(day)))
+        start = transaction_session - timedelta(days=180)
+        end = calendar.session_on_or_before(datetime.now().date())
+        return name, transaction_session.isoformat(), start.isoformat(), end.isoformat()
+
+    @classmethod
+    def stock_history(cls, data, transaction_date_str:str, new_start_date_str:str, new_end_date_str:str):
+        data = data[data.index >= new_start_date_str].copy()
+        # nearest bars rather than exact lookups, so a session without a bar yet (e.g. today
+        # before the close is published) falls back to the previous close
+        _, current_price = close_on_or_before(data, new_end_date_str)
+        _, transaction_price = close_on_or_after(data, transaction_date_str)
 
-        while transaction_date.weekday() >= 5:
-        # If the date is Saturday (5) or Sunday (6), increment by one day
-            transaction_date += timedelta(days=1)
+        percent_difference = round(((current_price - transaction_price) / transaction_price) * 100, 2)
 
-        transaction_date_str = transaction_date.strftime('%Y-%m-%d')
+        data.index = data.index.astype(str)
         
-        new_start_date = transaction_date - timedelta(days=180)
-        new_start_date_str = new_start_date.strftime('%Y-%m-%d')
+        return data.to_dict(orient='index'), percent_difference
 
-        new_end_date = datetime.now().date() 
-        while new_end_date.weekday() >= 5:
-        # If the date is Saturday (5) or Sunday (6), increment by one day
-            new_end_date -= timedelta(days=1)
+    @classmethod
+    def find_stock_history(cls, name:str, start_date:str, end_date:str=None):
+        window = cls.history_window(name, start_date)
+        return history_flights.do(window, cls.load_stock_history, *window)
 
-        new_end_date_str = new_end_date.strftime('%Y-%m-%d')
-        data = yf.download(name, start=new_start_date_str)
-        
-        current_price = data.loc[new_end_date_str, 'Close']
-        transaction_price = data.loc[transaction_date_str, 'Close']
+    @classmethod
+    def load_stock_history(cls, name:str, transaction_date_str:str, new_start_date_str:str, new_end_date_str:str):
+        data = price_cache.history(name, new_start_date_str)
+        return cls.stock_history(data, transaction_date_str, new_start_date_str, new_end_date_str)
 
-        percent_difference = round(((current_price - transaction_price) / transaction_price) * 100, 2)
+# date x symbol frame of daily closes from the price cache, one grouped download per missing range
+    @classmethod
+    def closes(cls, symbols: list, start):
+        histories = price_cache.history_many(symbols, start)
+        return pd.DataFrame({symbol: bars['Close'] for symbol, bars in histories.items()}, columns=sorted(histories))
 
-        data.index = data.index.astype(str)
-        
-        return data.to_dict(orient='index'), percent_difference
\ No newline at end of file
+    @classmethod
+    def price_metrics(cls):
+        return {'flights': history_flights.stats(), 'price_cache': price_cache.stats()}
+
+# histories for many (ticker, date) pairs: each distinct ticker is read or downloaded once
+    @classmethod
+    def find_stock_histories(cls, requests: dict):
+        windows = {}
+        results = {}
+        for request_id, (name, start_date) in requests.items():
+            try:
+                windows[request_id] = cls.history_window(name, start_date)
+            except (ValueError, LookupError) as error:
+                results[request_id] = error
+        if windows:
+            earliest = min(window[2] for window in windows.values())
+            prices = price_cache.history_many({window[0] for window in windows.values()}, earliest)
+        for request_id, (name, *window) in windows.items():
+            try:
+                results[request_id] = cls.stock_history(prices[name], *window)
+            except LookupError as error:
+                results[request_id] = LookupError(f'{name}: {error}')
+        return results
@@ -1,15 +1,18 @@
 import backend.api.models as models
+import psycopg2
+from itertools import chain
 from backend.api.lib.orm import build_from_record
 from backend.api import db
 from sqlalchemy.orm import relationship
-from backend.api.lib.db import create_supabase_connection, conn_string
-import psycopg2
+from backend.api.lib.db import create_supabase_connection, pooled_connection, stream_query
+from backend.api.lib.pagination import DEFAULT_PAGE_SIZE, InvalidQuery, encode_cursor
+import pandas as pd
 
 class Trade(db.Model):
     __tablename__ = 'dev.int_trades'
     attributes = ['id', 'politician_name', 'stock ticker', 'stock_information', 'purchased_or_sold', 'transaction_date', 'amount']
 
-    id = db.Column(db.Integer, primary_key=True)
+    id = db.Column(db.String(32), primary_key=True)
     politician_name = db.Column(db.Integer)
     # stock_id = db.Column(db.Integer, db.ForeignKey('stocks.id'))
     stock_ticker = db.Column(db.String(150))
@@ -21,16 +24,112 @@ class Trade(db.Model):
     # politician = relationship('Politician', back_populates='trades', overlaps='stocks,politicians')
     # stock = relationship('Stock', back_populates='trades', overlaps='politicians,stocks')
 
+    # purchased_or_sold values start with the side, e.g. 'Sale (partial)' or 'Sale (Full)'
+    sides = {'purchase': 'Purchase', 'sale': 'Sale', 'exchange': 'Exchange'}
+
+    # every filter is a plain comparison on an indexed column, so the (transaction_date, id)
+    # scan can stop as soon as it has enough rows
+    @classmethod
+    def filters(cls, start_date=None, end_date=None, politician_id=None, politician=None, ticker=None,
+                side=None):
+        predicates = ['t.transaction_date is not null']
+        params = []
+        if start_date:
+            predicates.append('t.transaction_date >= %s')
+            params.append(start_date)
+        if end_date:
+            predicates.append('t.transaction_date <= %s')
+            params.append(end_date)
+        if politician_id:
+            predicates.append('t.politician_id = %s')
+            params.append(politician_id)
+        if politician:
+            predicates.append('t.politician_name = %s')
+            params.append(politician)
+        if ticker:
+            predicates.append('t.stock_ticker = %s')
+            params.append(ticker.upper())
+        if side:
+            if side.lower() not in cls.sides:
+                raise InvalidQuery(f'invalid side: {side!r}, expected one of {", ".join(cls.sides)}')
+            predicates.append('t.purchased_or_sold like %s')
+            params.append(cls.sides[side.lower()] + '%')
+        return predicates, params
+
+    # appended from dev.trade_performance, after the int_trades columns
+    returns = ['return_since_transaction', 'return_30d', 'return_90d', 'return_180d']
+
+    # performance=False is for databases where the trade_performance job or migration has not
+    # run yet: same columns, with the returns left null
     @classmethod
-    def trades(cls):
-        conn = psycopg2.connect(conn_string)
-        cursor = conn.cursor()
-        cursor.execute("select * from dev.int_trades where EXTRACT(YEAR from transaction_date) = 2024 order by transaction_date desc")
-        records = cursor.fetchall()
-        conn.close()
+    def statement(cls, predicates, suffix='', performance=True):
+        if performance:
+            returns = ', '.join(f'p.{column}' for column in cls.returns)
+            join = """left join dev.trade_performance p
+                   on p.stock_ticker = t.stock_ticker and p.transaction_date = t.transaction_date"""
+        else:
+            returns = ', '.join(f'null::double precision as {column}' for column in cls.returns)
+            join = ''
+        return f"""select t.*, {returns}
+                   from dev.int_trades t
+                   {join}
+                   where {' and '.join(predicates)}
+                   order by t.transaction_date desc, t.id desc
+                   {suffix}"""
 
-        return records
-    
+    @classmethod
+    def page(cls, predicates, params, limit, performance=True):
+        with pooled_connection() as conn, conn.cursor() as db_cursor:
+            # one extra row tells us whether there is a next page
+            db_cursor.execute(cls.statement(predicates, 'limit %s', performance), params + [limit + 1])
+            return db_cursor.fetchall(), [column.name for column in db_cursor.description]
+
+    # newest first, one page at a time
+    @classmethod
+    def trades(cls, cursor=None, limit=DEFAULT_PAGE_SIZE, **filters):
+        predicates, params = cls.filters(**filters)
+        if cursor:
+            predicates.append('(t.transaction_date, t.id) < (%s, %s)')
+            params.extend(cursor)
 
+        try:
+            records, columns = cls.page(predicates, params, limit)
+        except psycopg2.errors.UndefinedTable:
+            records, columns = cls.page(predicates, params, limit, performance=False)
 
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            last = dict(zip(columns, records[-1]))
+            next_cursor = encode_cursor(last['transaction_date'], last['id'])
+        return records, next_cursor
 
+    # every matching trade, read from a server-side cursor: column descriptions, then row batches
+    @classmethod
+    def export(cls, **filters):
+        predicates, params = cls.filters(**filters)
+        stream = stream_query(cls.statement(predicates), params)
+        try:
+            # the query runs when the first item (the descriptions) is read
+            description = next(stream)
+        except psycopg2.errors.UndefinedTable:
+            stream = stream_query(cls.statement(predicates, performance=False), params)
+            description = next(stream)
+        return chain([description], stream)
+
+    # disclosed trades for a politician, party and/or chamber, oldest first, for mirror backtests
+    @classmethod
+    def mirror_trades(cls, politician=None, party=None, chamber=None):
+        predicates = ["t.stock_ticker is not null", "t.stock_ticker not in ('--', '')", 't.transaction_date is not null']
+        params = []
+        for column, value in [('politician_name', politician), ('political_party', party), ('part_of_congress', chamber)]:
+            if value:
+                predicates.append(f't.{column} = %s')
+                params.append(value)
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute(f"""select t.stock_ticker, t.purchased_or_sold, t.amount, t.transaction_date, t.disclosure_date
+                               from dev.int_trades t
+                               where {' and '.join(predicates)}
+                               order by t.transaction_date""", params)
+            records = cursor.fetchall()
+        return pd.DataFrame(records, columns=['stock_ticker', 'purchased_or_sold', 'amount', 'transaction_date', 'disclosure_date'])
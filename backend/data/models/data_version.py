@@ -0,0 +1,9 @@
+from pathlib import Path
+from backend.api.lib.db import bump_data_version, run_migration
+
+MIGRATION = Path(__file__).resolve().parents[3] / 'migrations' / 'create_data_version_table.sql'
+
+# run last in entrypoint.sh: tells the API that the dbt models and derived tables changed
+if __name__ == '__main__':
+    run_migration(MIGRATION)
+    print(f'Published data version {bump_data_version()}')
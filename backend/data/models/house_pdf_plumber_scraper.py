@@ -2,7 +2,9 @@ import pdfplumber
 import pandas as pd
 import urllib3
 import io
-from backend.api.lib.db import add_record_to_house_trades, check_report_link_existence, add_report_record
+from functools import partial
+from backend.api.lib.batch import BatchWriter
+from backend.api.lib.db import add_records_to_house_trades, add_report_record, existing_report_links, HOUSE_TRADE_COLUMNS
 
 class ReadHousePDF:
 # split purchase/sold row on newline and keep first line
@@ -25,22 +27,35 @@ class ReadHousePDF:
         except Exception as Error:
             print(Error)
 
-# proccess and coerce raw pdf data before adding record to database
+# proccess and coerce raw pdf data before adding records to database, one insert per report
     def read_pdfs(self, reports):
-        for report in reports:
-            if not self.verify_new_report(report): continue
-            pages = self.extract_pdf_pages(report)
-            for page in pages:
-                pre_processed_table = self.pre_process_table_data(page)
-                try:
-                    all_row_data = []
-                    for index, row in pre_processed_table.iterrows():
-                        table_data = [row[i] for i in range(1,7)]
-                        table_data.insert(1, report['name'])
-                        all_row_data.append(table_data)
-                        add_record_to_house_trades(table_data)
-                except Exception as Error:
-                    print(Error)
+        for report in self.new_reports(reports):
+            # the rows and the report's link commit in one transaction; an unreadable PDF or a
+            # failed insert leaves the report unrecorded for the next run and moves on
+            writer = BatchWriter(partial(add_records_to_house_trades, report_link=report['report_link']),
+                                 batch_size=None, width=len(HOUSE_TRADE_COLUMNS))
+            try:
+                pages = self.extract_pdf_pages(report)
+                for page in pages:
+                    pre_processed_table = self.pre_process_table_data(page)
+                    try:
+                        for table_data in self.table_rows(pre_processed_table, report['name']):
+                            writer.add(table_data)
+                    except Exception as Error:
+                        print(Error)
+                if not writer.flush():
+                    add_report_record(report['report_link'])
+            except Exception as Error:
+                print('Records could not be stored for report', report['report_link'], Error)
+
+# owner, politician name, then the remaining table columns in house_trades order
+    def table_rows(self, pre_processed_table, name):
+        rows = []
+        for index, row in pre_processed_table.iterrows():
+            table_data = [row[i] for i in range(1,7)]
+            table_data.insert(1, name)
+            rows.append(table_data)
+        return rows
 
 # find the number of pages in the pdf document 
     def extract_pdf_pages(self, report):
@@ -51,12 +66,15 @@ class ReadHousePDF:
         pages = pdf.pages
         return pages
     
-# check to see if report has already been processed, if so skip   
-    def verify_new_report(self, report):
-        exists = check_report_link_existence(report['report_link'])
-        if exists: return False
-        add_report_record(report['report_link'])
-        return True
+# keep only reports whose links have not been processed, checking all links in one query
+    def new_reports(self, reports):
+        seen = existing_report_links([report['report_link'] for report in reports])
+        new = []
+        for report in reports:
+            if report['report_link'] in seen: continue
+            seen.add(report['report_link'])
+            new.append(report)
+        return new
 
 # utilize pdf plumber to find column boundaries of table 
     def pre_process_table_data(self, page):
@@ -0,0 +1,25 @@
+import sys
+from backend.api.lib.db import pooled_connection
+from backend.api.lib.performance import price_symbol
+from backend.api.lib.price_warehouse import PriceWarehouse, build_directory
+from settings import PRICE_WAREHOUSE_PATH
+
+SYMBOLS_CSV = 'migrations/combined_stocks.csv'
+
+# price symbols of every traded ticker in the dbt output
+def trade_symbols():
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("""select distinct stock_ticker from dev.int_trades
+                          where stock_ticker is not null and stock_ticker not in ('--', '');""")
+        return sorted({price_symbol(row[0]) for row in cursor.fetchall()})
+
+# python3 -m backend.data.models.price_warehouse [--trades | SYMBOL ...]
+# refreshes the symbol directory, then appends new bars for the traded tickers (--trades), the
+# given symbols, or every listed symbol
+if __name__ == '__main__':
+    warehouse = PriceWarehouse(PRICE_WAREHOUSE_PATH)
+    directory = build_directory(SYMBOLS_CSV)
+    warehouse.write_directory(directory)
+    symbols = trade_symbols() if sys.argv[1:] == ['--trades'] else sys.argv[1:] or list(directory)
+    written = warehouse.update(symbols)
+    print(f'Updated {sum(1 for rows in written.values() if rows)} of {len(written)} symbols, {sum(written.values())} bars')
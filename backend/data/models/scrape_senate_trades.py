@@ -85,5 +85,5 @@ class SenateScraper:
         link_element = cols[3]
         anchor_tag = link_element.find_element(By.TAG_NAME, 'a')
         href = anchor_tag.get_attribute('href')
-        return {'name': name, 'report_link': href}
+        return {'name': name, 'report_link': href, 'report_date': cols[4].text}
     
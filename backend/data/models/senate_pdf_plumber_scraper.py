@@ -6,7 +6,9 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 import time
-from backend.api.lib.db import add_record_to_senate_trades, check_report_link_existence, add_report_record
+from functools import partial
+from backend.api.lib.batch import BatchWriter
+from backend.api.lib.db import add_records_to_senate_trades, add_report_record, existing_report_links, SENATE_TRADE_COLUMNS
 soup = BeautifulSoup('html', 'lxml')
 options = webdriver.ChromeOptions()
 options.add_argument('--no-sandbox')
@@ -16,11 +18,22 @@ options.add_argument('--disable-gpu')
 
 class TransformSenateRecordsData:
     def process_transactions(self, transactions: list):
+        seen = existing_report_links([transaction['report_link'] for transaction in transactions])
         driver = self.bypass_agree_statement()
         for transaction in transactions:
-            if check_report_link_existence(transaction['report_link']): continue
-            add_report_record(transaction['report_link'])
-            self.read_table_data(transaction, driver)
+            if transaction['report_link'] in seen: continue
+            seen.add(transaction['report_link'])
+            # the rows and the report's link commit in one transaction; a failed insert leaves
+            # the report unrecorded for the next run
+            writer = BatchWriter(partial(add_records_to_senate_trades, report_link=transaction['report_link']),
+                                 batch_size=None, width=len(SENATE_TRADE_COLUMNS))
+            try:
+                for record in self.read_table_data(transaction, driver):
+                    writer.add(record)
+                if not writer.flush():
+                    add_report_record(transaction['report_link'])
+            except Exception as error:
+                print('Records could not be stored for report', transaction['report_link'], error)
         driver.quit()
 
     def bypass_agree_statement(self):
@@ -35,7 +48,8 @@ class TransformSenateRecordsData:
         driver.get(transaction['report_link'])
         time.sleep(2)
         politician_name = self.parse_politician_name(transaction['name'])
-        self.process_table_data(driver, politician_name)
+        # the filing date from the search results is when the trade became public
+        return [record + [transaction.get('report_date')] for record in self.process_table_data(driver, politician_name)]
 
     def parse_politician_name(self, name:str):
         name_split = name.split(' ')
@@ -46,6 +60,7 @@ class TransformSenateRecordsData:
         return name
 
     def process_table_data(self, driver: object, politician: str):
+        records = []
         try:
             driver.find_element(By.XPATH, '//*[@id="content"]/div/div/section/div/div/table/tbody')
             rows = WebDriverWait(driver, 20).until(EC.presence_of_all_elements_located((By.XPATH, "//*[@id='content']/div/div/section/div/div/table/tbody/tr")))
@@ -53,6 +68,7 @@ class TransformSenateRecordsData:
                 cols = row.find_elements(By.TAG_NAME,'td')
                 text = [col.text for col in cols]
                 text[0] = politician
-                add_record_to_senate_trades(text)
+                records.append(text)
         except Exception as error:
-            print('Record could not be added to database', error)
\ No newline at end of file
+            print('Records could not be read from report', error)
+        return records
\ No newline at end of file
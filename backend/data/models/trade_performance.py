@@ -0,0 +1,42 @@
+from pathlib import Path
+import pandas as pd
+from backend.api.lib.db import pooled_connection, replace_trade_performance, run_migration
+from backend.api.lib.performance import trade_performance, price_symbol
+from backend.api.lib.price_warehouse import PriceWarehouse
+from settings import PRICE_WAREHOUSE_PATH
+
+MIGRATION = Path(__file__).resolve().parents[3] / 'migrations' / 'create_trade_performance_table.sql'
+
+class TradePerformance:
+# distinct priced (ticker, date) pairs from the dbt output
+    def load_trades(self):
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""select distinct stock_ticker, transaction_date from dev.int_trades
+                              where stock_ticker is not null and stock_ticker not in ('--', '')
+                              and transaction_date is not null;""")
+            records = cursor.fetchall()
+        return pd.DataFrame(records, columns=['stock_ticker', 'transaction_date'])
+
+# every ticker's closes from the price warehouse, which entrypoint.sh fills just before this
+# runs, as a date x ticker frame keyed by our ticker; tickers it lacks are all NaN
+    def load_closes(self, tickers, start):
+        tickers = list(tickers)
+        dates, matrix = PriceWarehouse(PRICE_WAREHOUSE_PATH).panel([price_symbol(ticker) for ticker in tickers], 'close', start)
+        return pd.DataFrame(matrix, index=pd.DatetimeIndex(dates), columns=tickers)
+
+    def run(self):
+        run_migration(MIGRATION)
+        trades = self.load_trades()
+        if trades.empty:
+            print('No trades to price')
+            return 0
+        start = pd.to_datetime(trades['transaction_date']).min().strftime('%Y-%m-%d')
+        closes = self.load_closes(trades['stock_ticker'].unique(), start)
+        performance = trade_performance(trades, closes)
+        records = [tuple(None if pd.isna(value) else value for value in row)
+                   for row in performance.itertuples(index=False)]
+        return replace_trade_performance(records)
+
+if __name__ == '__main__':
+    TradePerformance().run()
+    print('Finished computing trade performance')
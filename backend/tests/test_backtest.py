@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+from api.lib.backtest import amount_midpoints, backtest_summary, mirror_backtest, trade_flows
+
+def closes():
+    days = pd.bdate_range('2024-01-02', '2024-03-28')
+    return pd.DataFrame({'AAPL': np.linspace(100, 200, len(days)), 'MSFT': np.full(len(days), 50.0)}, index=days)
+
+def trades(rows):
+    return pd.DataFrame(rows, columns=['stock_ticker', 'purchased_or_sold', 'amount', 'transaction_date', 'disclosure_date'])
+
+def test_amount_ranges_become_midpoints():
+    midpoints = amount_midpoints(['$1,001 - $15,000', '$15,001 - $50,000', 'Over $50,000,000', None, 'Spouse/DC'])
+    assert list(midpoints[:3]) == [8000.5, 32500.5, 50_000_000.0]
+    assert np.isnan(midpoints[3:]).all()
+
+def test_sides_map_to_signed_flows():
+    flows = trade_flows(['Purchase', 'Sale (partial)', 'Sale', 'Sale (Full)', 'Exchange'], np.full(5, 10.0))
+    assert list(flows) == [10.0, -10.0, -np.inf, -np.inf, 0.0]
+
+def test_portfolio_rebalances_on_disclosure_not_transaction_date():
+    result = mirror_backtest(trades([
+        ('AAPL', 'Purchase', '$1,001 - $15,000', '2024-01-02', '2024-01-10'),
+        # no disclosure date: the 45-day deadline applies (Feb 17, a Saturday, then Presidents' Day)
+        ('MSFT', 'Purchase', '$1,001 - $15,000', '2024-01-03', None),
+        ('AAPL', 'Sale', '$1,001 - $15,000', '2024-02-01', '2024-03-01'),
+    ]), closes())
+    aapl = closes()['AAPL']
+    assert result.index[0] == pd.Timestamp('2024-01-10')
+    assert result.loc['2024-01-10', 'turnover'] == 1.0
+    # fully in AAPL until MSFT is added on Feb 20
+    expected = aapl['2024-02-20'] / aapl['2024-01-10']
+    assert result.loc['2024-02-20', 'nav'] == pytest.approx(expected)
+    # then half in each; the AAPL sale on Mar 1 leaves only the flat MSFT leg
+    half = 0.5 * aapl['2024-03-01'] / aapl['2024-02-20'] + 0.5
+    assert result.loc['2024-03-01', 'nav'] == pytest.approx(expected * half)
+    assert result['nav'].iloc[-1] == pytest.approx(expected * half)
+    assert result.loc['2024-03-01', 'positions'] == 1
+    assert result.loc['2024-01-11', 'turnover'] == 0.0 and (result['drawdown'] <= 0).all()
+
+def test_drawdown_and_summary():
+    prices = closes()
+    prices['AAPL'] = np.concatenate([np.full(30, 100.0), np.full(len(prices) - 30, 80.0)])
+    result = mirror_backtest(trades([('AAPL', 'Purchase', '$15,001 - $50,000', '2024-01-02', '2024-01-02')]), prices)
+    assert result['drawdown'].min() == pytest.approx(-0.2)
+    summary = backtest_summary(result)
+    assert summary['total_return'] == -20.0 and summary['max_drawdown'] == -20.0 and summary['rebalances'] == 1
+
+def test_partial_sales_never_go_short_and_unknown_tickers_are_ignored():
+    result = mirror_backtest(trades([
+        ('MSFT', 'Purchase', '$1,001 - $15,000', '2024-01-02', '2024-01-02'),
+        ('MSFT', 'Sale (partial)', '$15,001 - $50,000', '2024-01-05', '2024-01-05'),
+        ('ZZZZ', 'Purchase', '$1,001 - $15,000', '2024-01-05', '2024-01-05'),
+        ('MSFT', 'Purchase', '$1,001 - $15,000', '2024-01-09', '2024-01-09'),
+    ]), closes())
+    assert list(result.loc['2024-01-04':'2024-01-09', 'positions']) == [1, 0, 0, 1]
+    assert (result['nav'] == 1.0).all()
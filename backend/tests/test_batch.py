@@ -0,0 +1,37 @@
+import pytest
+from api.lib.batch import BatchWriter
+
+def test_rows_are_written_in_batches_and_on_exit():
+    batches = []
+    with BatchWriter(batches.append, batch_size=2, width=3) as writer:
+        writer.add(('owner', 'name', 'AAPL'))
+        writer.add(['owner', 'name', 'MSFT'])
+        writer.add(['owner', 'name', 'T'])
+    assert batches == [[['owner', 'name', 'AAPL'], ['owner', 'name', 'MSFT']], [['owner', 'name', 'T']]]
+    assert writer.written == 3
+
+def test_malformed_rows_are_rejected_instead_of_failing_the_batch():
+    batches = []
+    with BatchWriter(batches.append, width=3) as writer:
+        writer.add(['too', 'short'])
+        writer.add(['owner', 'name', 'AAPL'])
+    assert batches == [[['owner', 'name', 'AAPL']]]
+    assert writer.rejected == 1
+
+def test_buffer_is_dropped_when_the_block_fails():
+    batches = []
+    with pytest.raises(RuntimeError):
+        with BatchWriter(batches.append) as writer:
+            writer.add(['owner', 'name', 'AAPL'])
+            raise RuntimeError('report could not be read')
+    assert batches == []
+    assert writer.flush() == 0
+
+def test_unbounded_batches_wait_for_an_explicit_flush():
+    batches = []
+    writer = BatchWriter(batches.append, batch_size=None, width=3)
+    for ticker in ['AAPL', 'MSFT', 'T']:
+        writer.add(['owner', 'name', ticker])
+    assert batches == []
+    assert writer.flush() == 3
+    assert len(batches) == 1
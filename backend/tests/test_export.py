@@ -0,0 +1,41 @@
+import csv
+import io
+import json
+from collections import namedtuple
+from datetime import date
+import pytest
+from api.lib.export import export_chunks
+
+Column = namedtuple('Column', ['name', 'type_code'])
+DESCRIPTION = [Column('politician_name', 1043), Column('transaction_date', 1082), Column('return_30d', 701)]
+BATCHES = [[('Nancy Pelosi', date(2024, 1, 5), 1.5), ('Ted Cruz', date(2024, 1, 4), None)],
+           [('Tommy Tuberville', date(2024, 1, 3), -2.25)]]
+
+def test_ndjson_is_one_object_per_line_and_one_chunk_per_batch():
+    chunks = list(export_chunks('ndjson', DESCRIPTION, iter(BATCHES)))
+    assert len(chunks) == 2
+    rows = [json.loads(line) for line in b''.join(chunks).decode().splitlines()]
+    assert rows[0] == {'politician_name': 'Nancy Pelosi', 'transaction_date': '2024-01-05', 'return_30d': 1.5}
+    assert rows[1]['return_30d'] is None and len(rows) == 3
+
+def test_csv_has_a_header_and_streams_per_batch():
+    chunks = list(export_chunks('csv', DESCRIPTION, iter(BATCHES)))
+    assert len(chunks) == 2
+    rows = list(csv.reader(io.StringIO(b''.join(chunks).decode())))
+    assert rows[0] == ['politician_name', 'transaction_date', 'return_30d']
+    assert rows[2] == ['Ted Cruz', '2024-01-04', ''] and len(rows) == 4
+
+def test_csv_header_is_sent_for_empty_results():
+    assert b''.join(export_chunks('csv', DESCRIPTION, iter([]))) == b'politician_name,transaction_date,return_30d\r\n'
+
+@pytest.mark.parametrize('format', ['arrow', 'parquet'])
+def test_arrow_formats_round_trip(format):
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+    data = b''.join(export_chunks(format, DESCRIPTION, iter(BATCHES)))
+    if format == 'arrow':
+        table = pa.ipc.open_stream(data).read_all()
+    else:
+        table = pq.read_table(pa.BufferReader(data))
+    assert table.schema.field('transaction_date').type == pa.date32()
+    assert table.column('return_30d').to_pylist() == [1.5, None, -2.25]
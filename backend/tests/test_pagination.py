@@ -0,0 +1,28 @@
+from datetime import date
+import pytest
+from api.lib.pagination import InvalidQuery, decode_cursor, encode_cursor, page_size, parse_date, MAX_PAGE_SIZE
+
+def test_cursor_round_trips():
+    cursor = encode_cursor(date(2024, 5, 1), '0cc175b9c0f1b6a831c399e269772661')
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == (date(2024, 5, 1), '0cc175b9c0f1b6a831c399e269772661')
+    assert decode_cursor(None) is None
+
+@pytest.mark.parametrize('cursor', ['not-a-cursor', encode_cursor(date(2024, 5, 1), 'x')[:-4], 'WzFd'])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(InvalidQuery):
+        decode_cursor(cursor)
+
+def test_page_size_is_capped():
+    assert page_size(None) == 100
+    assert page_size('25') == 25
+    assert page_size('100000') == MAX_PAGE_SIZE
+    for value in ['0', '-3', 'ten']:
+        with pytest.raises(InvalidQuery):
+            page_size(value)
+
+def test_dates_must_be_iso():
+    assert parse_date('2024-02-29', 'start_date') == date(2024, 2, 29)
+    assert parse_date('', 'start_date') is None
+    with pytest.raises(InvalidQuery, match='start_date'):
+        parse_date('02/29/2024', 'start_date')
@@ -0,0 +1,33 @@
+from datetime import date
+import numpy as np
+import pandas as pd
+from api.lib.performance import trade_performance, price_symbol
+
+def closes():
+    days = pd.bdate_range('2024-01-01', '2024-12-31')
+    return pd.DataFrame({'AAPL': np.arange(len(days), dtype=float) + 100,
+                         'MSFT': np.full(len(days), 50.0)}, index=days)
+
+def test_returns_are_computed_for_every_distinct_trade():
+    trades = pd.DataFrame({'stock_ticker': ['AAPL', 'AAPL', 'MSFT', 'ZZZZ'],
+                           'transaction_date': [date(2024, 1, 6), date(2024, 1, 6), date(2024, 3, 1), date(2024, 3, 1)]})
+    result = trade_performance(trades, closes()).set_index('stock_ticker')
+    assert len(result) == 3
+    aapl = result.loc['AAPL']
+    # Saturday trade is priced at Monday's close (the 6th business day)
+    assert aapl['transaction_price'] == 105.0
+    assert aapl['current_price'] == 100.0 + len(closes()) - 1
+    assert aapl['return_since_transaction'] == round((aapl['current_price'] - 105) / 105 * 100, 2)
+    # 30 days after Jan 6 is Monday Feb 5, the 26th business day
+    assert aapl['return_30d'] == round((125 - 105) / 105 * 100, 2)
+    assert result.loc['MSFT', 'return_90d'] == 0.0
+    assert np.isnan(result.loc['ZZZZ', 'transaction_price'])
+
+def test_forward_windows_that_have_not_elapsed_are_empty():
+    trades = pd.DataFrame({'stock_ticker': ['MSFT'], 'transaction_date': ['2024-11-01']})
+    result = trade_performance(trades, closes()).iloc[0]
+    assert result['return_30d'] == 0.0
+    assert np.isnan(result['return_90d']) and np.isnan(result['return_180d'])
+
+def test_share_classes_use_yahoo_symbols():
+    assert price_symbol('BRK.B') == 'BRK-B'
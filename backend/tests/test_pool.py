@@ -0,0 +1,97 @@
+import threading
+import pytest
+from api.lib.pool import ConnectionPool, PoolTimeout
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, statement, params=None):
+        if self.conn.broken:
+            raise RuntimeError('server closed the connection unexpectedly')
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+@pytest.fixture()
+def opened():
+    return []
+
+@pytest.fixture()
+def pool(opened):
+    def connect():
+        conn = FakeConnection()
+        opened.append(conn)
+        return conn
+    return ConnectionPool(connect, max_size=2, timeout=0.2, health_check_after=0)
+
+def test_connections_are_reused_and_committed(pool, opened):
+    with pool.connection() as conn:
+        first = conn
+    with pool.connection() as conn:
+        assert conn is first
+    assert len(opened) == 1
+    assert first.commits == 2
+    stats = pool.stats()
+    assert stats['checkouts'] == 2 and stats['opened'] == 1 and stats['idle'] == 1
+
+def test_errors_roll_back_and_return_the_connection(pool, opened):
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            raise ValueError('bad row')
+    assert opened[0].rollbacks == 1 and opened[0].commits == 0
+    assert pool.stats()['in_use'] == 0
+
+def test_abandoned_generator_rolls_back(pool, opened):
+    def rows():
+        with pool.connection():
+            yield 1
+            yield 2
+    stream = rows()
+    next(stream)
+    stream.close()
+    assert opened[0].rollbacks == 1 and opened[0].commits == 0
+    assert pool.stats()['in_use'] == 0
+
+def test_failed_health_check_replaces_the_connection(pool, opened):
+    with pool.connection():
+        pass
+    opened[0].broken = True
+    with pool.connection() as conn:
+        assert conn is opened[1]
+    stats = pool.stats()
+    assert opened[0].closed
+    assert stats['health_check_failures'] == 1 and stats['open'] == 1
+
+def test_exhausted_pool_waits_then_times_out(pool):
+    first, second = pool.getconn(), pool.getconn()
+    assert pool.stats()['utilization'] == 1.0
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+    threading.Timer(0.05, pool.putconn, args=(first,)).start()
+    assert pool.getconn() is first
+    stats = pool.stats()
+    assert stats['timeouts'] == 1 and stats['waits'] == 2 and stats['peak_in_use'] == 2
+    pool.putconn(second)
@@ -0,0 +1,88 @@
+from datetime import date
+import pandas as pd
+from api.lib.price_cache import PriceCache
+
+class StubDownloader:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, tickers, start, end):
+        self.calls.append((tickers, start, end))
+        days = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+        close = [float(day.day) for day in days]
+        frame = pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close,
+                              'Adj Close': close, 'Volume': 100.0}, index=days)
+        if isinstance(tickers, str):
+            return frame
+        return pd.concat({ticker: frame for ticker in tickers if ticker != 'GONE'}, axis=1).swaplevel(axis=1)
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def make_cache(tmp_path, downloader, clock, today=date(2024, 3, 15)):
+    return PriceCache(tmp_path / 'prices.sqlite3', downloader=downloader, ttl_seconds=60,
+                      clock=clock, today=lambda: today)
+
+def test_repeat_requests_are_served_without_downloading(tmp_path):
+    downloader, clock = StubDownloader(), Clock()
+    cache = make_cache(tmp_path, downloader, clock)
+    first = cache.history('AAPL', '2024-03-01')
+    second = cache.history('AAPL', '2024-03-05')
+    assert downloader.calls == [('AAPL', '2024-03-01', '2024-03-16')]
+    assert first.loc['2024-03-15', 'Close'] == 15.0
+    assert list(second.index.strftime('%Y-%m-%d'))[:2] == ['2024-03-05', '2024-03-06']
+
+def test_bars_persist_on_disk_across_instances(tmp_path):
+    downloader, clock = StubDownloader(), Clock()
+    make_cache(tmp_path, downloader, clock).history('AAPL', '2024-03-01')
+    bars = make_cache(tmp_path, downloader, clock).history('AAPL', '2024-03-01')
+    assert len(downloader.calls) == 1
+    assert len(bars) == 11
+
+def test_only_missing_ranges_are_fetched(tmp_path):
+    downloader, clock = StubDownloader(), Clock()
+    cache = make_cache(tmp_path, downloader, clock)
+    cache.history('AAPL', '2024-03-01')
+    cache.history('AAPL', '2024-02-26')
+    assert downloader.calls[-1] == ('AAPL', '2024-02-26', '2024-03-01')
+
+    clock.now += 61
+    later = make_cache(tmp_path, downloader, clock, today=date(2024, 3, 20))
+    bars = later.history('AAPL', '2024-02-26')
+    assert downloader.calls[-1] == ('AAPL', '2024-03-15', '2024-03-21')
+    assert bars.index[0] == pd.Timestamp('2024-02-26') and bars.index[-1] == pd.Timestamp('2024-03-20')
+
+def test_current_day_is_refreshed_after_ttl(tmp_path):
+    downloader, clock = StubDownloader(), Clock()
+    cache = make_cache(tmp_path, downloader, clock)
+    cache.history('MSFT', '2024-03-11')
+    clock.now += 30
+    cache.history('MSFT', '2024-03-11')
+    assert len(downloader.calls) == 1
+    clock.now += 31
+    cache.history('MSFT', '2024-03-11')
+    assert downloader.calls[-1] == ('MSFT', '2024-03-15', '2024-03-16')
+
+def test_multi_index_columns_are_flattened(tmp_path):
+    def downloader(ticker, start, end):
+        frame = StubDownloader()(ticker, start, end)
+        frame.columns = pd.MultiIndex.from_product([frame.columns, [ticker]])
+        return frame
+    cache = make_cache(tmp_path, downloader, Clock())
+    assert list(cache.history('T', '2024-03-14')['Close']) == [14.0, 15.0]
+
+def test_many_tickers_share_one_grouped_download(tmp_path):
+    downloader, clock = StubDownloader(), Clock()
+    cache = make_cache(tmp_path, downloader, clock)
+    cache.history('AAPL', '2024-03-01')
+    clock.now += 61
+    histories = cache.history_many(['MSFT', 'AAPL', 'GONE', 'NVDA', 'MSFT'], '2024-03-01')
+    assert downloader.calls[1:] == [('AAPL', '2024-03-15', '2024-03-16'),
+                                    (['GONE', 'MSFT', 'NVDA'], '2024-03-01', '2024-03-16')]
+    assert sorted(histories) == ['AAPL', 'GONE', 'MSFT', 'NVDA']
+    assert histories['NVDA'].loc['2024-03-14', 'Close'] == 14.0
+    assert histories['GONE'].empty
@@ -0,0 +1,73 @@
+from datetime import date
+import numpy as np
+import pandas as pd
+from api.lib.price_warehouse import PriceWarehouse, build_directory
+
+class StubDownloader:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, tickers, start, end):
+        self.calls.append((tickers, start, end))
+        days = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+        frames = {}
+        for ticker in [tickers] if isinstance(tickers, str) else tickers:
+            close = [float(day.day) + (100 if ticker == 'MSFT' else 0) for day in days]
+            frames[ticker] = pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close,
+                                           'Adj Close': close, 'Volume': 1000.0}, index=days)
+        if isinstance(tickers, str):
+            return frames[tickers]
+        return pd.concat(frames, axis=1).swaplevel(axis=1)
+
+def make_warehouse(tmp_path, downloader, today):
+    return PriceWarehouse(tmp_path, downloader=downloader, today=lambda: today)
+
+def test_directory_is_built_from_the_symbol_listing(tmp_path):
+    listing = tmp_path / 'stocks.csv'
+    listing.write_text('Symbol,Name\nAAPL,Apple Inc. Common Stock\nECC           ,"Eagle Point Credit Company, Inc."\nAAPL,Duplicate\n')
+    directory = build_directory(listing)
+    assert directory == {'AAPL': 'Apple Inc. Common Stock', 'ECC': 'Eagle Point Credit Company, Inc.'}
+    warehouse = make_warehouse(tmp_path / 'warehouse', StubDownloader(), date(2024, 3, 15))
+    warehouse.write_directory(directory)
+    assert warehouse.directory() == directory
+
+def test_updates_only_fetch_after_the_last_stored_bar(tmp_path):
+    downloader = StubDownloader()
+    make_warehouse(tmp_path, downloader, date(2024, 3, 8)).update(['AAPL', 'MSFT'], start=date(2024, 3, 1))
+    warehouse = make_warehouse(tmp_path, downloader, date(2024, 3, 15))
+    written = warehouse.update(['AAPL', 'MSFT', 'ABR$A'], start=date(2024, 3, 1))
+    assert downloader.calls == [(['AAPL', 'MSFT'], '2024-03-01', '2024-03-09'),
+                                (['AAPL', 'MSFT'], '2024-03-08', '2024-03-16'),
+                                ('ABR$A', '2024-03-01', '2024-03-16')]
+    assert written == {'AAPL': 6, 'MSFT': 6, 'ABR$A': 11}
+    bars = warehouse.bars('AAPL')
+    assert list(bars.dates.astype(str)) == [str(day.date()) for day in pd.bdate_range('2024-03-01', '2024-03-15')]
+
+def test_reads_are_zero_copy_date_slices(tmp_path):
+    warehouse = make_warehouse(tmp_path, StubDownloader(), date(2024, 3, 15))
+    warehouse.update(['AAPL'], start=date(2024, 3, 1))
+    bars = warehouse.bars('AAPL', '2024-03-05', date(2024, 3, 9))
+    assert list(bars.close) == [5.0, 6.0, 7.0, 8.0]
+    assert bars.close.flags['C_CONTIGUOUS'] and not bars.close.flags['OWNDATA']
+    assert np.shares_memory(bars.close, warehouse._map('AAPL'))
+    assert warehouse.bars('NONE') is None
+
+def test_panel_aligns_symbols_on_shared_dates(tmp_path):
+    downloader = StubDownloader()
+    warehouse = make_warehouse(tmp_path, downloader, date(2024, 3, 15))
+    warehouse.update(['AAPL'], start=date(2024, 3, 11))
+    warehouse.update(['MSFT'], start=date(2024, 3, 13))
+    dates, matrix = warehouse.panel(['AAPL', 'MSFT', 'NONE'], start='2024-03-12')
+    assert list(dates.astype(str)) == ['2024-03-12', '2024-03-13', '2024-03-14', '2024-03-15']
+    assert np.array_equal(matrix[:, 0], [12.0, 13.0, 14.0, 15.0])
+    assert np.isnan(matrix[0, 1]) and matrix[1, 1] == 113.0
+    assert np.isnan(matrix[:, 2]).all()
+
+def test_long_lived_readers_see_updates_from_another_instance(tmp_path):
+    reader = make_warehouse(tmp_path, StubDownloader(), date(2024, 3, 8))
+    assert reader.bars('AAPL') is None
+    make_warehouse(tmp_path, StubDownloader(), date(2024, 3, 8)).update(['AAPL'], start=date(2024, 3, 1))
+    assert len(reader.bars('AAPL').dates) == 6
+    assert reader._map('AAPL') is reader._map('AAPL')
+    make_warehouse(tmp_path, StubDownloader(), date(2024, 3, 15)).update(['AAPL'])
+    assert reader.last_date('AAPL') == date(2024, 3, 15)
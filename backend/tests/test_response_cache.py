@@ -0,0 +1,80 @@
+from flask import Flask, jsonify, request
+from api.lib.response_cache import DataVersion, ResponseCache
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def make_app(version, clock=None, ttl=None, max_entries=1024):
+    app = Flask(__name__)
+    cache = ResponseCache(lambda: version['value'], max_entries=max_entries, clock=clock or Clock())
+    calls = []
+
+    @app.route('/items')
+    @cache.cached(ttl=ttl)
+    def items():
+        calls.append(dict(request.args))
+        if request.args.get('bad'):
+            return jsonify({'error': 'bad'}), 400
+        response = jsonify([version['value'], request.args.get('page')])
+        response.headers['X-Next-Cursor'] = 'abc'
+        return response
+
+    return app.test_client(), cache, calls
+
+def test_repeat_requests_are_served_from_memory_with_etags():
+    client, cache, calls = make_app({'value': 1})
+    first = client.get('/items?page=1')
+    second = client.get('/items?page=1')
+    assert len(calls) == 1
+    assert (first.headers['X-Cache'], second.headers['X-Cache']) == ('miss', 'hit')
+    assert first.data == second.data and first.headers['ETag'] == second.headers['ETag']
+    assert second.headers['X-Next-Cursor'] == 'abc'
+    assert not first.headers['ETag'].startswith('W/')
+
+    client.get('/items?page=2')
+    assert len(calls) == 2
+
+def test_matching_if_none_match_gets_304():
+    client, cache, calls = make_app({'value': 1})
+    etag = client.get('/items').headers['ETag']
+    response = client.get('/items', headers={'If-None-Match': etag})
+    assert response.status_code == 304 and response.data == b''
+    assert cache.stats()['not_modified'] == 1
+
+def test_new_data_version_invalidates_entries():
+    version = {'value': 1}
+    client, cache, calls = make_app(version)
+    etag = client.get('/items').headers['ETag']
+    version['value'] = 2
+    response = client.get('/items', headers={'If-None-Match': etag})
+    assert response.status_code == 200 and response.json == [2, None]
+    assert len(calls) == 2
+
+def test_errors_are_not_cached_and_ttl_expires_entries():
+    clock = Clock()
+    client, cache, calls = make_app({'value': 1}, clock=clock, ttl=10)
+    assert client.get('/items?bad=1').status_code == 400
+    assert client.get('/items?bad=1').status_code == 400
+    client.get('/items')
+    clock.now = 10
+    client.get('/items')
+    assert len(calls) == 4
+    assert cache.stats()['expired'] == 1
+
+def test_lru_evicts_oldest_entry():
+    client, cache, calls = make_app({'value': 1}, max_entries=2)
+    for page in ['1', '2', '1', '3', '1']:
+        client.get(f'/items?page={page}')
+    assert len(calls) == 3
+    assert cache.stats()['evicted'] == 1
+
+def test_data_version_is_polled():
+    clock, reads = Clock(), []
+    version = DataVersion(lambda: reads.append(1) or len(reads), check_every=30, clock=clock)
+    assert version() == 1 and version() == 1
+    clock.now = 30
+    assert version() == 2
@@ -0,0 +1,44 @@
+import threading
+import pytest
+from api.lib.single_flight import SingleFlight
+
+def test_concurrent_calls_share_one_result():
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls, results = [], []
+
+    def fetch(ticker):
+        calls.append(ticker)
+        started.set()
+        release.wait(5)
+        return {'ticker': ticker}
+
+    leader = threading.Thread(target=lambda: results.append(flights.do('AAPL', fetch, 'AAPL')))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flights.do('AAPL', fetch, 'AAPL'))) for _ in range(4)]
+    for thread in followers: thread.start()
+    while flights.stats()['coalesced'] < 4: pass
+    release.set()
+    for thread in [leader, *followers]: thread.join(5)
+
+    assert calls == ['AAPL']
+    assert len(results) == 5 and all(result is results[0] for result in results)
+    stats = flights.stats()
+    assert stats['issued'] == 1 and stats['coalesced'] == 4 and stats['in_flight'] == 0
+    assert stats['coalesced_ratio'] == 0.8
+
+def test_finished_calls_are_not_reused():
+    flights = SingleFlight()
+    assert flights.do('a', lambda: 1) == 1
+    assert flights.do('a', lambda: 2) == 2
+    assert flights.stats()['issued'] == 2
+
+def test_errors_propagate_and_clear_the_key():
+    flights = SingleFlight()
+    def fail():
+        raise LookupError('no close')
+    with pytest.raises(LookupError):
+        flights.do('a', fail)
+    assert flights.stats()['errors'] == 1 and flights.stats()['in_flight'] == 0
+    assert flights.do('a', lambda: 3) == 3
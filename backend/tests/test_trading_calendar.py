@@ -0,0 +1,41 @@
+from datetime import date
+import numpy as np
+import pandas as pd
+import pytest
+from api.lib.trading_calendar import TradingCalendar, close_on_or_after, close_on_or_before, easter, nyse_holidays
+
+@pytest.fixture(scope='module')
+def calendar():
+    return TradingCalendar.nyse(2018, 2025)
+
+def test_holiday_rules_match_published_nyse_schedules():
+    assert easter(2024) == date(2024, 3, 31)
+    assert nyse_holidays(2024) == {date(2024, 1, 1), date(2024, 1, 15), date(2024, 2, 19), date(2024, 3, 29),
+                                   date(2024, 5, 27), date(2024, 6, 19), date(2024, 7, 4), date(2024, 9, 2),
+                                   date(2024, 11, 28), date(2024, 12, 25)}
+    # Saturday New Year's Day is not observed; Sunday Juneteenth and Christmas move to Monday
+    assert date(2021, 12, 31) not in nyse_holidays(2021) and date(2022, 1, 1) not in nyse_holidays(2022)
+    assert {date(2022, 6, 20), date(2022, 12, 26)} <= nyse_holidays(2022)
+
+def test_trades_resolve_to_their_effective_session(calendar):
+    assert calendar.session_on_or_after(date(2024, 3, 28)) == date(2024, 3, 28)
+    # Good Friday, then the weekend
+    assert calendar.session_on_or_after(date(2024, 3, 29)) == date(2024, 4, 1)
+    assert calendar.session_on_or_after(date(2018, 12, 5)) == date(2018, 12, 6)
+    assert calendar.session_on_or_before(date(2024, 12, 25)) == date(2024, 12, 24)
+    assert not calendar.is_session(date(2025, 1, 9))
+    with pytest.raises(LookupError):
+        calendar.session_on_or_after(date(2026, 1, 1))
+
+def test_vectorized_lookup_matches_bisect(calendar):
+    days = pd.to_datetime(['2024-03-29', '2024-07-04', '2024-07-05', '2026-01-02', None])
+    resolved = calendar.sessions_on_or_after(days)
+    assert list(resolved[:3]) == [np.datetime64('2024-04-01'), np.datetime64('2024-07-05'), np.datetime64('2024-07-05')]
+    assert np.isnat(resolved[3]) and np.isnat(resolved[4])
+
+def test_closes_use_the_nearest_bar():
+    bars = pd.DataFrame({'Close': [10.0, 11.0, 12.0]}, index=pd.DatetimeIndex(['2024-03-27', '2024-03-28', '2024-04-01']))
+    assert close_on_or_after(bars, '2024-03-29') == (date(2024, 4, 1), 12.0)
+    assert close_on_or_before(bars, date(2024, 3, 31)) == (date(2024, 3, 28), 11.0)
+    with pytest.raises(LookupError):
+        close_on_or_before(bars, '2024-03-01')
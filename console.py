@@ -1,9 +1,19 @@
+from pathlib import Path
+from backend.api.lib.db import run_migration
 from backend.data.models.scrape_house_trades import HouseScraper
 from backend.data.models.scrape_senate_trades import SenateScraper
 from backend.data.models.house_pdf_plumber_scraper import ReadHousePDF
 from backend.data.models.senate_pdf_plumber_scraper import TransformSenateRecordsData
 # from backend.data.models.get_pol_images import get_members
 
+MIGRATIONS = Path(__file__).resolve().parent / 'migrations'
+
+# the scrapers record links with ON CONFLICT (link), which needs the unique index on
+# databases created before it was added to the schema
+run_migration(MIGRATIONS / 'add_report_links_unique_index.sql')
+# the Senate scraper writes report_date, added after the table was first created
+run_migration(MIGRATIONS / 'add_senate_report_date.sql')
+
 # run on all house records and all senate records
 
 scraped_reports = HouseScraper().initialize_webscrape()
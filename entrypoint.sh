@@ -10,4 +10,18 @@ cd trades_dbt
 
 # transform dating using dbt
 
-dbt run --profiles-dir ./dbt_profiles
\ No newline at end of file
+dbt run --profiles-dir ./dbt_profiles
+
+cd ..
+
+# append new daily bars for every traded ticker to the local price warehouse used by /backtest
+
+python3 -m backend.data.models.price_warehouse --trades
+
+# precompute returns for every trade from the fresh dbt output and the warehouse's closes
+
+python3 -m backend.data.models.trade_performance
+
+# invalidate cached API responses now that the data has changed
+
+python3 -m backend.data.models.data_version
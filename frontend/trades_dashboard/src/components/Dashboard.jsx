@@ -14,8 +14,17 @@ const Dashboard = () => {
         const fetchData = async () => {
             try {
                 setLoading(true);
-                const response = await axios.get('http://127.0.0.1:5000/trades');
-                const transformedData = response.data.map(row => ({
+                // /trades is paginated; follow X-Next-Cursor until the last page
+                const rows = [];
+                let cursor = null;
+                do {
+                    const response = await axios.get('http://127.0.0.1:5000/trades', {
+                        params: { start_date: '2024-01-01', end_date: '2024-12-31', limit: 500, cursor }
+                    });
+                    rows.push(...response.data);
+                    cursor = response.headers['x-next-cursor'] || null;
+                } while (cursor);
+                const transformedData = rows.map(row => ({
                     politician_name: row[0],
                     politician_id: row[1],
                     stock_ticker: row[2],
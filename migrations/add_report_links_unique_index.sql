@@ -0,0 +1,10 @@
+-- Existing databases: remove duplicate links, then enforce uniqueness so the scrapers can
+-- record a report's link with INSERT ... ON CONFLICT (link) DO NOTHING. Idempotent; console.py
+-- applies it before every scrape.
+
+DELETE FROM report_links a
+    USING report_links b
+    WHERE a.link = b.link
+    AND a.id > b.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS report_links_link_key ON report_links (link);
@@ -0,0 +1,5 @@
+-- Existing databases: Senate filing dates, used as the disclosure date for backtests.
+-- Rows scraped before this change keep a NULL report_date. Idempotent; console.py applies it
+-- before every scrape.
+
+ALTER TABLE senate_trades ADD COLUMN IF NOT EXISTS report_date varchar(255);
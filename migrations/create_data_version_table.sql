@@ -0,0 +1,8 @@
+-- Single-row stamp bumped by backend/data/models/data_version.py after each pipeline run;
+-- the API keys its response cache on it.
+
+CREATE TABLE IF NOT EXISTS data_version(
+    id boolean PRIMARY KEY DEFAULT true CHECK (id),
+    version bigint NOT NULL,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
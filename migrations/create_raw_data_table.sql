@@ -23,11 +23,12 @@ CREATE TABLE IF NOT EXISTS senate_trades(
     asset_type varchar(255),
     purchased_or_sold varchar(255),
     amount varchar(255),
-    comment varchar(2000)
+    comment varchar(2000),
+    report_date varchar(255)
 );
 
 CREATE TABLE IF NOT EXISTS report_links(
     id serial primary key,
-    link varchar(255)
+    link varchar(255) UNIQUE
 );
 
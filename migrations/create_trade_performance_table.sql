@@ -0,0 +1,16 @@
+-- Filled by backend/data/models/trade_performance.py after each dbt run; /trades joins it on
+-- (stock_ticker, transaction_date). This is the only definition of the table; the job applies
+-- this file before writing, so it must stay idempotent.
+
+CREATE TABLE IF NOT EXISTS dev.trade_performance(
+    stock_ticker varchar(255) NOT NULL,
+    transaction_date date NOT NULL,
+    transaction_price double precision,
+    current_price double precision,
+    return_since_transaction double precision,
+    return_30d double precision,
+    return_90d double precision,
+    return_180d double precision,
+    computed_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (stock_ticker, transaction_date)
+);
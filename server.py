@@ -1,12 +1,27 @@
 from backend.api import create_app, db
-from flask import jsonify, request
+from flask import Response, jsonify, request, stream_with_context
 from backend.api.models import Trade, Stock, Politician
-from backend.api.lib.db import to_dict
+from backend.api.lib.db import to_dict, pool_metrics, current_data_version
+from backend.api.lib.response_cache import DataVersion, ResponseCache
+from settings import DATA_VERSION_CHECK_SECONDS, RESPONSE_CACHE_MAX_ENTRIES, PRICE_CACHE_TTL_SECONDS, STOCK_INFO_BATCH_MAX
+from settings import PRICE_WAREHOUSE_PATH
+import pandas as pd
+from backend.api.lib.backtest import mirror_backtest, backtest_summary
+from backend.api.lib.export import EXPORT_FORMATS, export_chunks
+from backend.api.lib.performance import price_symbol
+from backend.api.lib.price_warehouse import PriceWarehouse
+from backend.api.lib.pagination import InvalidQuery, decode_cursor, page_size, parse_date
+from backend.api.lib.pool import PoolTimeout
 from flask_cors import CORS
 
 
 app = create_app()
-CORS(app)
+CORS(app, expose_headers=['X-Next-Cursor', 'ETag'])
+
+# responses only change when the pipeline publishes a new data version
+response_cache = ResponseCache(DataVersion(current_data_version, check_every=DATA_VERSION_CHECK_SECONDS),
+                               max_entries=RESPONSE_CACHE_MAX_ENTRIES)
+price_warehouse = PriceWarehouse(PRICE_WAREHOUSE_PATH)
 
 
 @app.route('/')
@@ -14,6 +29,7 @@ def home():
     return 'Welcome to the Congress Trades API'
 
 @app.route('/politicians/<id>')
+@response_cache.cached()
 def politicians(id):
     politician = Politician.politician(id)
     return jsonify(politician)
@@ -28,11 +44,45 @@ def politician_trades(id):
     trades = db.session.query(Trade).filter_by(politician_id=id)
     return jsonify([to_dict(trade) for trade in trades])
 
+def trade_filters(args):
+    return {'start_date': parse_date(args.get('start_date'), 'start_date'),
+            'end_date': parse_date(args.get('end_date'), 'end_date'),
+            'politician_id': args.get('politician_id', type=int),
+            'politician': args.get('politician'),
+            'ticker': args.get('ticker'),
+            'side': args.get('side')}
+
+# one page of trades, newest first; the cursor for the next page comes back in X-Next-Cursor
 @app.route('/trades')
+@response_cache.cached()
 def trades():
-    trades = Trade.trades()
-    return jsonify(trades)
+    args = request.args
+    try:
+        trades, next_cursor = Trade.trades(cursor=decode_cursor(args.get('cursor')),
+                                           limit=page_size(args.get('limit')),
+                                           **trade_filters(args))
+    except InvalidQuery as error:
+        return jsonify({'error': str(error)}), 400
+    response = jsonify(trades)
+    if next_cursor: response.headers['X-Next-Cursor'] = next_cursor
+    return response
 
+# the full trade history with the same filters as /trades, streamed with chunked encoding
+@app.route('/export/trades.<format>')
+def export_trades(format):
+    if format not in EXPORT_FORMATS:
+        return jsonify({'error': f'unknown format: {format}, expected one of {", ".join(EXPORT_FORMATS)}'}), 404
+    try:
+        stream = Trade.export(**trade_filters(request.args))
+    except InvalidQuery as error:
+        return jsonify({'error': str(error)}), 400
+    except PoolTimeout:
+        # every export slot is busy with another download
+        return jsonify({'error': 'too many exports in progress, try again shortly'}), 503, {'Retry-After': '30'}
+    description = next(stream)
+    return Response(stream_with_context(export_chunks(format, description, stream)),
+                    mimetype=EXPORT_FORMATS[format],
+                    headers={'Content-Disposition': f'attachment; filename=trades.{format}'})
 
 @app.route('/trades/<marker>')
 def trades_by_stock(marker):
@@ -40,7 +90,9 @@ def trades_by_stock(marker):
     return jsonify([to_dict(trade) for trade in stock.trades]) if stock else []
   
 
+# also bounded by the price cache TTL, since today's close moves between pipeline runs
 @app.route('/stock-info')
+@response_cache.cached(ttl=PRICE_CACHE_TTL_SECONDS)
 def politicians_who_bought_stock():
     politician_id = request.args.get('politician_id')
     politician = Politician.politician(politician_id)
@@ -50,6 +102,86 @@ def politicians_who_bought_stock():
     stock_data, performance_percentage = Stock().find_stock_history(ticker, date)
     return jsonify(stock_data, politician, stock, performance_percentage)
 
+# many /stock-info lookups in one request: {"requests": [{"id", "politician_id", "ticker", "date"}, ...]}
+# returns {id: [stock_data, politician, stock, performance_percentage]} or {id: {"error": ...}}
+@app.route('/stock-info/batch', methods=['POST'])
+def stock_info_batch():
+    body = request.get_json(silent=True)
+    items = body.get('requests') if isinstance(body, dict) else None
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        return jsonify({'error': 'expected {"requests": [{"id", "politician_id", "ticker", "date"}, ...]}'}), 400
+    if len(items) > STOCK_INFO_BATCH_MAX:
+        return jsonify({'error': f'at most {STOCK_INFO_BATCH_MAX} requests per batch'}), 400
+
+    items = {str(item.get('id', index)): item for index, item in enumerate(items)}
+    results = {request_id: {'error': 'ticker and date are required'}
+               for request_id, item in items.items() if not item.get('ticker') or not item.get('date')}
+    valid = {request_id: item for request_id, item in items.items() if request_id not in results}
+    politician_ids = {request_id: int(item['politician_id']) for request_id, item in valid.items()
+                      if str(item.get('politician_id', '')).isdigit()}
+    politicians = Politician.politicians(set(politician_ids.values())) if politician_ids else {}
+    stocks = Stock.find_by_stock_markers({item['ticker'] for item in valid.values()})
+    histories = Stock.find_stock_histories({request_id: (item['ticker'], item['date']) for request_id, item in valid.items()})
+
+    for request_id, item in valid.items():
+        history = histories[request_id]
+        if isinstance(history, Exception):
+            results[request_id] = {'error': str(history)}
+            continue
+        stock_data, performance_percentage = history
+        politician = politicians.get(politician_ids.get(request_id))
+        results[request_id] = [stock_data, politician, stocks.get(item['ticker']), performance_percentage]
+    return jsonify(results)
+
+# closes from the local warehouse; symbols it does not hold yet (the pipeline fills it, possibly
+# on another host) are read through the price cache instead
+def backtest_closes(trades, tickers, start, end):
+    symbols = [price_symbol(ticker) for ticker in tickers]
+    dates, matrix = price_warehouse.panel(symbols, 'close', start, end)
+    closes = pd.DataFrame(matrix, index=pd.DatetimeIndex(dates), columns=symbols)
+    missing = sorted({symbol for symbol, empty in zip(symbols, closes.isna().all()) if empty})
+    if missing:
+        fetched = Stock.closes(missing, start or trades['transaction_date'].min())
+        if end: fetched = fetched[fetched.index <= pd.Timestamp(end)]
+        closes = closes.drop(columns=missing).join(fetched, how='outer').reindex(columns=symbols)
+    closes.columns = tickers
+    return closes
+
+# mirror-portfolio backtest for ?politician=, ?party= and/or ?chamber=
+@app.route('/backtest')
+@response_cache.cached(ttl=PRICE_CACHE_TTL_SECONDS)
+def backtest():
+    args = request.args
+    selection = {'politician': args.get('politician'), 'party': args.get('party'), 'chamber': args.get('chamber')}
+    if not any(selection.values()):
+        return jsonify({'error': 'pass at least one of politician, party or chamber'}), 400
+    try:
+        start, end = parse_date(args.get('start'), 'start'), parse_date(args.get('end'), 'end')
+    except InvalidQuery as error:
+        return jsonify({'error': str(error)}), 400
+
+    trades = Trade.mirror_trades(**selection)
+    tickers = sorted(trades['stock_ticker'].unique())
+    closes = backtest_closes(trades, tickers, start, end)
+    result = mirror_backtest(trades, closes, start, end)
+    unpriced = int(closes.isna().all().sum()) if len(closes) else len(tickers)
+    return jsonify({
+        'summary': {**backtest_summary(result), 'trades': len(trades), 'tickers': len(tickers), 'unpriced_tickers': unpriced},
+        'series': [{'date': day.date().isoformat(), **row} for day, row in zip(result.index, result.round(6).to_dict(orient='records'))],
+    })
+
+@app.route('/metrics/db-pool')
+def db_pool_metrics():
+    return jsonify(pool_metrics())
+
+@app.route('/metrics/price-fetches')
+def price_fetch_metrics():
+    return jsonify(Stock.price_metrics())
+
+@app.route('/metrics/response-cache')
+def response_cache_metrics():
+    return jsonify({'data_version': response_cache.version(), **response_cache.stats()})
+
 @app.shell_context_processor
 def make_shell_context():
     return {'db': db, 'Politician': Politician, 'Trade': Trade, 'Stock': Stock}
\ No newline at end of file
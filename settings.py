@@ -16,4 +16,15 @@ GLUE_DB=os.getenv('GLUE_DB')
 RAW_DATABASE=os.getenv('RAW_DATABASE')
 SUPA_CONN_URL=os.getenv('SUPA_CONN_URL')
 SUPA_KEY=os.getenv('SUPA_KEY')
-API_KEY=os.getenv('API_KEY')
\ No newline at end of file
+API_KEY=os.getenv('API_KEY')
+DB_POOL_MAX_SIZE=int(os.getenv('DB_POOL_MAX_SIZE', '10'))
+DB_POOL_TIMEOUT=float(os.getenv('DB_POOL_TIMEOUT', '30'))
+DB_POOL_HEALTH_CHECK_SECONDS=float(os.getenv('DB_POOL_HEALTH_CHECK_SECONDS', '30'))
+PRICE_CACHE_PATH=os.getenv('PRICE_CACHE_PATH', '.cache/prices.sqlite3')
+PRICE_CACHE_TTL_SECONDS=float(os.getenv('PRICE_CACHE_TTL_SECONDS', '900'))
+DATA_VERSION_CHECK_SECONDS=float(os.getenv('DATA_VERSION_CHECK_SECONDS', '30'))
+RESPONSE_CACHE_MAX_ENTRIES=int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '1024'))
+STOCK_INFO_BATCH_MAX=int(os.getenv('STOCK_INFO_BATCH_MAX', '100'))
+PRICE_WAREHOUSE_PATH=os.getenv('PRICE_WAREHOUSE_PATH', '.cache/warehouse')
+EXPORT_MAX_CONCURRENT=int(os.getenv('EXPORT_MAX_CONCURRENT', '2'))
+EXPORT_QUEUE_TIMEOUT=float(os.getenv('EXPORT_QUEUE_TIMEOUT', '5'))
@@ -1,3 +1,15 @@
+{{
+    config(
+        materialized='table',
+        indexes=[
+            {'columns': ['transaction_date', 'id']},
+            {'columns': ['politician_id', 'transaction_date']},
+            {'columns': ['politician_name', 'transaction_date']},
+            {'columns': ['stock_ticker', 'transaction_date']}
+        ]
+    )
+}}
+
 with merged_trades as (
     select * from {{ ref('stg_senate_trades') }}
     union
@@ -10,12 +22,27 @@ politicians as (
 ),
 
 politician_info as (
-    select mt.*,
+    select mt.politician_name,
+           mt.politician_id,
+           mt.stock_ticker,
+           mt.stock_information,
+           mt.purchased_or_sold,
+           mt.transaction_date,
+           mt.amount,
            p.part_of_congress,
            p.political_party,
-           p.office
+           p.office,
+           -- stable across rebuilds, so /trades page cursors stay valid after a dbt run
+           md5(concat_ws('|', mt.politician_name, mt.politician_id, mt.stock_ticker, mt.stock_information,
+                         mt.purchased_or_sold, mt.transaction_date, mt.amount)) as id,
+           -- a PTR and its amendments repeat the same trade with later filing dates; keep one
+           -- row per trade, disclosed when it was first filed, so id stays unique
+           min(mt.disclosure_date) as disclosure_date
     from merged_trades mt full outer join politicians p 
     on mt.politician_name = p.name
+    group by mt.politician_name, mt.politician_id, mt.stock_ticker, mt.stock_information,
+             mt.purchased_or_sold, mt.transaction_date, mt.amount,
+             p.part_of_congress, p.political_party, p.office
 )
 
 select * from politician_info
\ No newline at end of file
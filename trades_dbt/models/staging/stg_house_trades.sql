@@ -23,7 +23,8 @@ remove_title as (
           stock_information,
           purchased_or_sold,
           transaction_date,
-          amount
+          amount,
+          report_date
     from house_trades
 ),
 
@@ -36,7 +37,8 @@ first_and_last_only as (
              stock_information,
             purchased_or_sold,
             transaction_date,
-            amount
+            amount,
+            report_date
     from remove_title
     where transaction_date != '' 
 ),
@@ -49,7 +51,8 @@ revise_edge_names as (
            stock_information,
            purchased_or_sold,
            transaction_date,
-           amount
+           amount,
+           report_date
     from first_and_last_only
 ),
 
@@ -59,7 +62,8 @@ edited_transaction_dates as (
           stock_information,
           purchased_or_sold,
           SUBSTRING(transaction_date FROM '^\d{1,2}/\d{1,2}/\d{4}') as transaction_date,
-          amount
+          amount,
+          report_date
     from revise_edge_names
     where TO_DATE(transaction_date, 'MM-DD-YYYY') <= CURRENT_DATE
 ),
@@ -75,7 +79,8 @@ edited_amounts as (
                 WHEN SPLIT_PART(amount, E'\n', 1) LIKE '%DC%' THEN SPLIT_PART(amount, E'\n', 2)
             ELSE
                 SPLIT_PART(amount, E'\n', 1)
-    END AS amount
+    END AS amount,
+    TO_DATE(SUBSTRING(report_date FROM '^\d{1,2}/\d{1,2}/\d{4}'), 'MM-DD-YYYY') as disclosure_date
     from edited_transaction_dates
 ),
 
@@ -85,7 +90,8 @@ split_on_filing as (
            SPLIT_PART(UPPER(stock_information), 'FILING', 1) as stock_information,
            purchased_or_sold,
            transaction_date,
-           CASE WHEN amount LIKE'$1,001 -' THEN '$1,0001 - $5,000' ELSE amount END as amount
+           CASE WHEN amount LIKE'$1,001 -' THEN '$1,001 - $15,000' ELSE amount END as amount,
+           disclosure_date
     from edited_amounts
 ),
 
@@ -100,7 +106,8 @@ edited_stock_information as (
            SPLIT_PART(stock_information, E'\n', 1) || ' ' || SPLIT_PART(stock_information, E'\n', 2) as stock_information,
            purchased_or_sold,
            transaction_date,
-           amount
+           amount,
+           disclosure_date
     from split_on_filing
 ),
 
@@ -117,7 +124,8 @@ modify_purchased_or_sold as (
                 ELSE purchased_or_sold
                 END as purchased_or_sold,
             transaction_date,
-            amount
+            amount,
+            disclosure_date
     from edited_stock_information esi
     left join 
         politicians p
@@ -26,7 +26,8 @@ convert_mixed_politician_names as (
         asset_name,
         purchased_or_sold,
         transaction_date,
-        amount
+        amount,
+        report_date
     from senate_trades
 ),
 
@@ -38,7 +39,8 @@ asset_and_ticker_name_mod as (
         SPLIT_PART(asset_name, E'\n', 1) AS stock_information,
         purchased_or_sold,
         TO_DATE(transaction_date, 'MM-DD-YYYY') as transaction_date,
-        amount
+        amount,
+        TO_DATE(report_date, 'MM-DD-YYYY') as disclosure_date
     from
         convert_mixed_politician_names cmn
     left join 